@@ -0,0 +1,43 @@
+"""Times the distributed engine against the single process statevector engine.
+
+Run it with the qubit range and process counts to compare, for example
+`python benchmark_distributed.py --qubits 26 32 2 --processes 2 4 8`.
+Each row uses a state of 2^n complex64 amplitudes, 8 GiB at 30 qubits. The
+layer of the statevector threads benchmark is reused, which acts on every qubit
+and so touches the global qubits of the distributed engine as well.
+"""
+
+import argparse
+import os
+import time
+
+from benchmark_statevector_threads import layer
+from qcpy import quantumcircuit
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--qubits", nargs=3, type=int, default=[20, 30, 2])
+    parser.add_argument("--processes", nargs="+", type=int, default=[2, os.cpu_count()])
+    parser.add_argument("--layers", type=int, default=1)
+    arguments = parser.parse_args()
+
+    start, stop, step = arguments.qubits
+    print(f"{'qubits':>6} {'engine':>16} {'seconds':>9} {'ms/gate':>9} {'speedup':>8}")
+    for qubits in range(start, stop + 1, step):
+        baseline = None
+        for processes in [1] + sorted(set(arguments.processes) - {1}):
+            if processes == 1:
+                name = "statevector"
+                qc = quantumcircuit(qubits=qubits, engine="statevector")
+            else:
+                name = f"distributed x{processes}"
+                qc = quantumcircuit(qubits=qubits, processes=processes)
+            began = time.perf_counter()
+            gates = sum(layer(qc, qubits) for _ in range(arguments.layers))
+            elapsed = time.perf_counter() - began
+            baseline = baseline or elapsed
+            print(
+                f"{qubits:>6} {name:>16} {elapsed:>9.3f} "
+                f"{1000 * elapsed / gates:>9.2f} {baseline / elapsed:>8.2f}"
+            )
+            del qc
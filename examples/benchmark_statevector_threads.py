@@ -0,0 +1,52 @@
+"""Times the statevector engine on 20 to 30 qubits for several thread counts.
+
+Run it with the qubit range and thread counts to compare, for example
+`python benchmark_statevector_threads.py --qubits 20 30 2 --threads 1 8 32 64`.
+A 30 qubit state takes 8 GiB of memory.
+"""
+
+import argparse
+import os
+import time
+
+from qcpy import quantumcircuit
+
+
+def layer(qc, qubits: int) -> int:
+    """Applies one layer of single qubit, controlled and diagonal gates.
+    Returns:
+        int: Number of gates applied.
+    """
+    for qubit in range(qubits):
+        qc.h(qubit)
+        qc.rx(qubit, 0.3)
+    for qubit in range(qubits - 1):
+        qc.cx(qubit, qubit + 1)
+        qc.rzz(qubit, qubit + 1, 0.7)
+    return 4 * qubits - 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--qubits", nargs=3, type=int, default=[20, 30, 2])
+    parser.add_argument(
+        "--threads", nargs="+", type=int, default=[1, 2, 4, os.cpu_count()]
+    )
+    parser.add_argument("--layers", type=int, default=1)
+    arguments = parser.parse_args()
+
+    start, stop, step = arguments.qubits
+    print(f"{'qubits':>6} {'threads':>7} {'seconds':>9} {'ms/gate':>9} {'speedup':>8}")
+    for qubits in range(start, stop + 1, step):
+        baseline = None
+        for threads in sorted(set(arguments.threads)):
+            qc = quantumcircuit(qubits=qubits, engine="statevector", threads=threads)
+            began = time.perf_counter()
+            gates = sum(layer(qc, qubits) for _ in range(arguments.layers))
+            elapsed = time.perf_counter() - began
+            baseline = baseline or elapsed
+            print(
+                f"{qubits:>6} {threads:>7} {elapsed:>9.3f} "
+                f"{1000 * elapsed / gates:>9.2f} {baseline / elapsed:>8.2f}"
+            )
+            del qc
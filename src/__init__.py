@@ -1,5 +1,9 @@
 from .quantum_circuit import QuantumCircuit as quantumcircuit
+from .quantum_circuit import Parameter as parameter
+from .quantum_circuit import PauliSum as paulisum
 from .quantum_gate import gates
+from .noise import channels
+from .noise import NoiseModel as noisemodel
 from .visualize import *
 from .tools import *
 from .qubit import *
@@ -164,3 +164,103 @@ class RoundBelowZeroError(ValueError):
     >>> amplitude(qc, round = -1)
     >>> Error
     """
+
+
+class InvalidEngineError(ValueError):
+    """
+    When the user tries to construct a quantum circuit with
+    an engine that does not exist within qcpy.
+
+    Examples
+    --------
+    >>> from qcpy import quantumcircuit
+    >>> qc = quantumcircuit(qubits = 2, engine = 'abacus')
+    >>> Error
+    """
+
+
+class NotUnitaryMultiGateError(ValueError):
+    """
+    When a passed in gate for a multi-controlled unitary is not
+    a square matrix of size 2^k, where k is the number of target
+    qubits it is applied to.
+
+    Examples
+    --------
+    >>> from qcpy import quantumcircuit, gates
+    >>> qc = quantumcircuit(qubits = 3)
+    >>> qc.mcu([0], [1, 2], gates.paulix())
+    >>> Error
+    """
+
+
+class InvalidPauliStringError(ValueError):
+    """
+    When a Pauli string holds letters other than I, X, Y and Z, or
+    does not act on as many qubits as the rest of the observable or
+    the state it is measured on.
+
+    Examples
+    --------
+    >>> from qcpy import paulisum
+    >>> paulisum({"XZ": 1.0, "ZAI": 0.5})
+    >>> Error
+    """
+
+
+class NotCliffordGateError(ValueError):
+    """
+    When a gate that is not a Clifford gate, such as t or rx with an
+    angle that is not a multiple of pi/2, is applied to a quantum circuit
+    running on the stabilizer engine.
+
+    Examples
+    --------
+    >>> from qcpy import quantumcircuit
+    >>> qc = quantumcircuit(qubits = 2, engine = 'stabilizer')
+    >>> qc.t(0)
+    >>> Error
+    """
+
+
+class InvalidNoiseError(ValueError):
+    """
+    When a noise channel is given a strength that is not a probability,
+    Kraus operators that do not preserve the trace, or is attached to a
+    type of gate that does not exist.
+
+    Examples
+    --------
+    >>> from qcpy import channels
+    >>> channels.depolarizing(1.5)
+    >>> Error
+    """
+
+
+class NotLazyCircuitError(ValueError):
+    """
+    When parameters are given to, or compile is called on, a quantum
+    circuit that does not record its gates, or already ran them.
+
+    Examples
+    --------
+    >>> from qcpy import parameter, quantumcircuit
+    >>> qc = quantumcircuit(qubits = 2)
+    >>> qc.rx(0, parameter("theta"))
+    >>> Error
+    """
+
+
+class UnboundParameterError(ValueError):
+    """
+    When a quantum circuit holding parameters is run before a value
+    is bound to every one of them.
+
+    Examples
+    --------
+    >>> from qcpy import parameter, quantumcircuit
+    >>> qc = quantumcircuit(qubits = 2, lazy = True)
+    >>> qc.rx(0, parameter("theta"))
+    >>> qc.state
+    >>> Error
+    """
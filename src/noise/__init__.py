@@ -0,0 +1,2 @@
+from . import channels
+from .noise_model import NoiseModel
@@ -0,0 +1,93 @@
+import numpy as np
+from numpy.typing import NDArray
+from ..errors import InvalidNoiseError
+
+
+def __check__(probability: float, name: str) -> None:
+    """Makes sure the strength of a channel is a probability.
+    Args:
+        probability (float): Strength of the channel.
+        name (str): Name of the channel for the error message.
+    """
+    if not 0 <= probability <= 1:
+        raise InvalidNoiseError(f"{name} needs a probability between 0 and 1")
+    return
+
+
+def depolarizing(probability: float) -> NDArray:
+    """Depolarizing channel as a stack of 2x2 Kraus operators.
+
+    ```
+    K0 = sqrt(1 - p) I, K1 = sqrt(p / 3) X, K2 = sqrt(p / 3) Y, K3 = sqrt(p / 3) Z
+    ```
+    Args:
+        probability (float): Probability p of an X, Y or Z error.
+    Returns:
+        NDArray: Kraus operators of the depolarizing channel.
+    """
+    __check__(probability, "depolarizing")
+    error = np.sqrt(probability / 3)
+    return np.array(
+        [
+            [[np.sqrt(1 - probability), 0], [0, np.sqrt(1 - probability)]],
+            [[0, error], [error, 0]],
+            [[0, -1j * error], [1j * error, 0]],
+            [[error, 0], [0, -error]],
+        ],
+        "F",
+    )
+
+
+def amplitude_damping(gamma: float) -> NDArray:
+    """Amplitude damping channel as a stack of 2x2 Kraus operators.
+
+    ```
+    K0 = [1, 0             ]    K1 = [0, sqrt(gamma)]
+         [0, sqrt(1 - gamma)]         [0, 0          ]
+    ```
+    Args:
+        gamma (float): Probability of the qubit decaying from 1 to 0.
+    Returns:
+        NDArray: Kraus operators of the amplitude damping channel.
+    """
+    __check__(gamma, "amplitude_damping")
+    return np.array(
+        [[[1, 0], [0, np.sqrt(1 - gamma)]], [[0, np.sqrt(gamma)], [0, 0]]], "F"
+    )
+
+
+def phase_damping(lmbda: float) -> NDArray:
+    """Phase damping channel as a stack of 2x2 Kraus operators.
+
+    ```
+    K0 = [1, 0             ]    K1 = [0, 0          ]
+         [0, sqrt(1 - lmbda)]         [0, sqrt(lmbda)]
+    ```
+    Args:
+        lmbda (float): Probability of the qubit losing its phase.
+    Returns:
+        NDArray: Kraus operators of the phase damping channel.
+    """
+    __check__(lmbda, "phase_damping")
+    return np.array(
+        [[[1, 0], [0, np.sqrt(1 - lmbda)]], [[0, 0], [0, np.sqrt(lmbda)]]], "F"
+    )
+
+
+def readout(flip_zero: float, flip_one: float) -> NDArray:
+    """Readout error as the 2x2 matrix of the probability to read a value given the
+       value of the qubit.
+
+    ```
+    R = [1 - p01, p10    ]
+        [p01,     1 - p10]
+    ```
+    Args:
+        flip_zero (float): Probability p01 of reading 1 when the qubit is 0.
+        flip_one (float): Probability p10 of reading 0 when the qubit is 1.
+    Returns:
+        NDArray: Column stochastic matrix of the readout error.
+    """
+    __check__(flip_zero, "readout")
+    __check__(flip_one, "readout")
+    return np.array([[1 - flip_zero, flip_one], [flip_zero, 1 - flip_one]])
@@ -0,0 +1,106 @@
+import numpy as np
+from ..errors import InvalidNoiseError
+
+GATE_TYPES = ["single", "multi"]
+
+
+class NoiseModel:
+    """Noise channels applied after every type of gate and when qubits are read out.
+
+    Channels attach to the gates passed on as single qubit gates ("single"), or as
+    controlled and multi qubit gates ("multi"), and act on every qubit the gate
+    touched. The channels of a gate type are composed into one 4x4 superoperator,
+    so a noisy gate costs one extra local contraction per qubit no matter how many
+    channels it has.
+
+    ```
+    from qcpy import channels, noisemodel, quantumcircuit
+    noise = noisemodel()
+    noise.add(channels.depolarizing(0.01))
+    noise.add(channels.amplitude_damping(0.05), ["multi"])
+    noise.add_readout(channels.readout(0.02, 0.05))
+    qc = quantumcircuit(qubits = 2, noise = noise)
+    ```
+
+    Attributes:
+        channels (dict): Kraus operators of every channel applied after each gate type.
+        readout (np.array): 2x2 matrix of the probability to read each value given the
+                            value of the qubit, None when qubits are read perfectly.
+    """
+
+    def __init__(self):
+        self.channels = {gate_type: [] for gate_type in GATE_TYPES}
+        self.readout = None
+
+    def add(self, kraus, gate_types=GATE_TYPES) -> None:
+        """Attaches a channel to types of gates.
+        Args:
+            kraus (np.array): Stack of 2x2 Kraus operators of the channel.
+            gate_types (str/List[str]): Types of gates, "single" and/or "multi", to
+                                        apply the channel after.
+        """
+        if isinstance(gate_types, str):
+            gate_types = [gate_types]
+        kraus = np.asarray(kraus, complex).reshape(-1, 2, 2)
+        if not np.allclose(
+            np.einsum("kji,kjl->il", kraus.conj(), kraus), np.identity(2), atol=1e-6
+        ):
+            raise InvalidNoiseError("Kraus operators of a channel do not sum to I")
+        for gate_type in gate_types:
+            if gate_type not in GATE_TYPES:
+                raise InvalidNoiseError(
+                    f"Gate type {gate_type} is not one of {GATE_TYPES}"
+                )
+            self.channels[gate_type].append(kraus)
+        return
+
+    def add_readout(self, readout) -> None:
+        """Sets the error of reading out every qubit.
+        Args:
+            readout (np.array): 2x2 matrix of the probability to read each value given
+                                the value of the qubit.
+        """
+        readout = np.asarray(readout, float)
+        if readout.shape != (2, 2) or not np.allclose(readout.sum(axis=0), 1):
+            raise InvalidNoiseError(
+                "Readout error is not a 2x2 column stochastic matrix"
+            )
+        self.readout = readout
+        return
+
+    def read(self, probabilities):
+        """Applies the readout error on the probability of every basis state.
+
+        The 2x2 readout matrix is contracted with the axis of each qubit in turn, which
+        keeps the cost at O(n 2^n).
+
+        Args:
+            probabilities (np.array): Probability of every basis state.
+        Returns:
+            np.array: Probability of reading out every basis state.
+        """
+        if self.readout is None:
+            return probabilities
+        qubits = int(np.log2(probabilities.size))
+        probabilities = probabilities.reshape((2,) * qubits)
+        for axis in range(qubits):
+            probabilities = np.moveaxis(
+                np.tensordot(self.readout, probabilities, (1, axis)), 0, axis
+            )
+        return probabilities.reshape(-1)
+
+    def superoperator(self, gate_type: str):
+        """Every channel of a gate type composed into one superoperator.
+        Args:
+            gate_type (str): "single" or "multi".
+        Returns:
+            np.array: 4x4 matrix acting on a row-major flattened 2x2 density matrix,
+                      None when no channel is attached to the gate type.
+        """
+        if not self.channels[gate_type]:
+            return None
+        superoperator = np.identity(4, complex)
+        for kraus in self.channels[gate_type]:
+            channel = np.einsum("kij,kab->iajb", kraus, kraus.conj()).reshape(4, 4)
+            superoperator = np.dot(channel, superoperator)
+        return superoperator
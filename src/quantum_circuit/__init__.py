@@ -1 +1,3 @@
 from .quantum_circuit import QuantumCircuit
+from .parameter import Parameter
+from .observable import PauliSum
@@ -0,0 +1 @@
+from .amplitude_dict_calculator import AmplitudeDictCalculator
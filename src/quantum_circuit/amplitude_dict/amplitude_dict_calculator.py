@@ -0,0 +1,51 @@
+import numpy as np
+from ..interface import CalculatorInterface
+from ..statevector.statevector_single_gate import StateVectorSingleGate
+from ..statevector.statevector_multi_gate import StateVectorMultiGate
+from .amplitude_dict_core import AmplitudeDictCore
+
+
+class AmplitudeDictCalculator(
+    CalculatorInterface, AmplitudeDictCore, StateVectorSingleGate, StateVectorMultiGate
+):
+    """Calculator that only stores and updates the nonzero amplitudes of the state.
+
+    Memory and time follow the number of occupied basis states rather than 2^n, so
+    arithmetic and oracle circuits on many qubits that keep the state close to a
+    few basis states run where a full state vector would not fit.
+    """
+
+    def __init__(
+        self,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        epsilon: float = 1e-12,
+    ):
+        AmplitudeDictCore.__init__(self, qubits, big_endian, prep, epsilon)
+        StateVectorSingleGate.__init__(self, qubits, big_endian)
+        StateVectorMultiGate.__init__(self, qubits, big_endian)
+
+    def pass_single_gate(self, qubits_to_apply, gate: np.array):
+        self.__operator_matrix__(self.__create_gate_queue__(qubits_to_apply, gate))
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.__operator_matrix__(self.__custom_gate_queue__(gate_queue))
+
+    def pass_multi_gate(self, control: int, target: int, gate: np.array):
+        self.__multi_operator_matrix__(
+            self.__create_control_queue__(control, target, gate)
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        self.__mcu_operator_matrix__(self.__create_mcu_queue__(controls, targets, gate))
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_queue__(qubits, diagonal)
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_queue__(qubits, permutation)
+        )
@@ -0,0 +1,283 @@
+import numpy as np
+from ...errors import OutOfRangeError
+from ..interface import CoreInterface
+
+
+class AmplitudeDictCore(CoreInterface):
+    """Holds only the nonzero amplitudes of the state, keyed by their basis state.
+
+    The basis states are kept as a sorted array of 64 bit indices next to an array
+    of their amplitudes, so finding an amplitude is a binary search and a gate only
+    visits the basis states that are occupied. A gate on k qubits gathers every
+    occupied group of 2^k basis states that differ in those qubits, multiplies the
+    groups by the gate at once and drops every amplitude whose magnitude falls to
+    epsilon or below. The cost follows the number of nonzero amplitudes instead of
+    2^n, which allows circuits of up to 63 qubits.
+
+    Attributes:
+        indices (np.array): Sorted basis states that have a nonzero amplitude.
+        amplitudes (np.array): Amplitude of every basis state in indices.
+        epsilon (float): Largest magnitude of an amplitude that is dropped.
+        random (np.random.Generator): Draws every sample, numpy's global generator
+                                      unless the circuit gives its own.
+    """
+
+    random = np.random
+
+    def __init__(
+        self,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        epsilon: float = 1e-12,
+    ):
+        if qubits > 63:
+            raise OutOfRangeError("amplitude_dict holds at most 63 qubits")
+        self.big_endian = big_endian
+        self.qubits = qubits
+        self.epsilon = epsilon
+        if prep == "z":
+            self.indices = np.zeros(1, np.int64)
+            self.amplitudes = np.ones(1, "D")
+            return
+        self.indices = np.arange(2**qubits, dtype=np.int64)
+        self.amplitudes = np.full(2**qubits, 2 ** (-qubits / 2), "D")
+        if prep == "y":
+            ones = np.zeros(2**qubits, np.int64)
+            for bit in range(qubits):
+                ones += (self.indices >> bit) & 1
+            self.amplitudes *= np.array([1, 1j, -1, -1j])[ones % 4]
+        return
+
+    @property
+    def state(self):
+        """The state as a dense (2^n, 1) array."""
+        state = np.zeros((2**self.qubits, 1), "F")
+        state[self.indices, 0] = self.amplitudes
+        return state
+
+    @state.setter
+    def state(self, state_to_store):
+        if hasattr(state_to_store, "toarray"):
+            state_to_store = state_to_store.toarray()
+        state_to_store = np.asarray(state_to_store).reshape(-1)
+        self.__store__(np.arange(state_to_store.size), state_to_store)
+
+    @property
+    def nonzero(self) -> dict:
+        """Every basis state with a nonzero amplitude and its amplitude."""
+        return dict(zip(self.indices.tolist(), self.amplitudes.tolist()))
+
+    def __bit__(self, qubit: int) -> int:
+        """Bit of the basis state indices that holds a qubit.
+        Args:
+            qubit (int): Qubit of the quantum circuit.
+        Returns:
+            int: Bit that holds the qubit, with 0 being the least significant bit.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        return self.qubits - 1 - qubit if self.big_endian else qubit
+
+    def __store__(self, indices, amplitudes) -> None:
+        """Keeps the amplitudes above epsilon, sorted by their basis state.
+        Args:
+            indices (np.array): Distinct basis states.
+            amplitudes (np.array): Amplitude of every basis state.
+        """
+        kept = np.abs(amplitudes) > self.epsilon
+        indices = np.asarray(indices, np.int64)[kept]
+        amplitudes = np.asarray(amplitudes, "D")[kept]
+        order = np.argsort(indices, kind="stable")
+        self.indices = indices[order]
+        self.amplitudes = amplitudes[order]
+        return
+
+    def __lookup__(self, keys):
+        """Amplitudes of the given basis states, zero for the ones not held.
+        Args:
+            keys (np.array): Basis states to look up.
+        Returns:
+            np.array: Amplitude of every basis state.
+        """
+        if self.indices.size == 0:
+            return np.zeros(keys.shape, "D")
+        positions = np.searchsorted(self.indices, keys)
+        positions[positions == self.indices.size] = 0
+        found = self.indices[positions] == keys
+        return np.where(found, self.amplitudes[positions], 0)
+
+    def __local__(self, indices, bits):
+        """Index of every basis state within the 2^k entries of a gate's table.
+        Args:
+            indices (np.array): Basis states.
+            bits (List[int]): Bits of the gate, the first one being most significant.
+        Returns:
+            np.array: Value of the given bits of every basis state.
+        """
+        local = np.zeros_like(indices)
+        for bit in bits:
+            local = (local << 1) | ((indices >> bit) & 1)
+        return local
+
+    def __spread__(self, local, bits):
+        """Basis state bits of the entries of a gate's table, the inverse of __local__.
+        Args:
+            local (np.array): Entries of the gate's table.
+            bits (List[int]): Bits of the gate, the first one being most significant.
+        Returns:
+            np.array: Every entry with its value moved onto the given bits.
+        """
+        spread = np.zeros_like(local)
+        for position, bit in enumerate(reversed(bits)):
+            spread |= ((local >> position) & 1) << bit
+        return spread
+
+    @staticmethod
+    def __parity__(indices):
+        """Parity of the number of set bits of every basis state.
+        Args:
+            indices (np.array): Basis states.
+        Returns:
+            np.array: 0 or 1 for every basis state.
+        """
+        folded = indices.copy()
+        for shift in (32, 16, 8, 4, 2, 1):
+            folded ^= folded >> shift
+        return folded & 1
+
+    def amplitude(self, index: int) -> complex:
+        """Amplitude of a single basis state, by a binary search.
+        Args:
+            index (int): Basis state, with the bit of every qubit as in the state.
+        Returns:
+            complex: Amplitude of the basis state.
+        """
+        return complex(self.__lookup__(np.array([index], np.int64))[0])
+
+    def sample(self, shots: int = 1):
+        """Draws measurements of every qubit without collapsing the state.
+
+        Sorted uniform draws are searched in the cumulative probabilities of the
+        stored amplitudes, so no dense state is made.
+
+        Args:
+            shots (int): Number of measurements to draw.
+        Returns:
+            List[str]: Bits of every measured basis state, the highest bit first as
+                       measure returns them.
+        """
+        cumulative = np.cumsum(np.square(np.abs(self.amplitudes)))
+        draws = np.sort(self.random.random(shots)) * cumulative[-1]
+        positions = np.minimum(
+            np.searchsorted(cumulative, draws, side="right"), cumulative.size - 1
+        )
+        self.random.shuffle(positions)
+        return [
+            format(index, f"0{self.qubits}b")
+            for index in self.indices[positions].tolist()
+        ]
+
+    def marginal(self, qubits):
+        """Probabilities of the basis states of some of the qubits, summed over the rest.
+        Args:
+            qubits (List[int]): Qubits to keep.
+        Returns:
+            np.array: Probability of each of the 2^k basis states of the kept qubits, with
+                      their bits in the same order as in the state.
+        """
+        bits = sorted(self.__bit__(qubit) for qubit in qubits)
+        local = self.__local__(self.indices, bits[::-1])
+        return np.bincount(
+            local, np.square(np.abs(self.amplitudes)), minlength=2 ** len(bits)
+        )
+
+    def expectation(self, observable):
+        """Expectation value of Pauli strings over the stored amplitudes.
+        Args:
+            observable (PauliSum): Pauli strings with their coefficients.
+        Returns:
+            complex: Expectation value.
+        """
+        value = 0
+        for flip, terms in observable.__groups__(self.big_endian).items():
+            weights = np.zeros(self.indices.size, "D")
+            for sign, coefficient in terms:
+                weights += coefficient * (1 - 2 * self.__parity__(self.indices & sign))
+            flipped = self.__lookup__(self.indices ^ flip)
+            value += np.dot(flipped.conj() * self.amplitudes, weights)
+        return value
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit, keeping the stored amplitudes that agree with the outcome.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        bit = self.__bit__(qubit)
+        ones = ((self.indices >> bit) & 1).astype(bool)
+        probability = float(np.sum(np.square(np.abs(self.amplitudes[ones]))))
+        outcome = int(draw < probability)
+        kept = ones if outcome else ~ones
+        self.indices = self.indices[kept]
+        self.amplitudes = self.amplitudes[kept] / np.sqrt(
+            probability if outcome else 1 - probability
+        )
+        if reset and outcome:
+            self.indices = self.indices ^ (1 << bit)
+        return outcome
+
+    def __apply__(self, control_bits, target_bits, gate) -> None:
+        """Applies a gate on the occupied basis states with every control bit set.
+        Args:
+            control_bits (List[int]): Bits that all need to be set for the gate to act.
+            target_bits (List[int]): Bits the gate acts on, the first one being the most
+                                     significant bit of the gate.
+            gate (np.array): 2^k x 2^k gate where k is the number of targets.
+        """
+        control_mask = sum(1 << bit for bit in control_bits)
+        target_mask = sum(1 << bit for bit in target_bits)
+        active = (self.indices & control_mask) == control_mask
+        groups = np.unique(self.indices[active] & ~target_mask)
+        offsets = self.__spread__(np.arange(len(gate), dtype=np.int64), target_bits)
+        keys = (groups[:, None] | offsets[None, :]).reshape(-1)
+        amplitudes = self.__lookup__(keys).reshape(groups.size, len(gate))
+        amplitudes = np.dot(amplitudes, np.asarray(gate, "D").T).reshape(-1)
+        self.__store__(
+            np.concatenate([self.indices[~active], keys]),
+            np.concatenate([self.amplitudes[~active], amplitudes]),
+        )
+        return
+
+    def __operator_matrix__(self, gate_queue):
+        for bit, gate in gate_queue:
+            self.__apply__([], [bit], gate)
+        return
+
+    def __multi_operator_matrix__(self, multi_gate_queue):
+        control_bit, target_bit, gate = multi_gate_queue
+        self.__apply__([control_bit], [target_bit], gate)
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_bits, target_bits, gate = mcu_queue
+        self.__apply__(control_bits, target_bits, gate)
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        self.amplitudes = self.amplitudes * diagonal[self.__local__(self.indices, bits)]
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        mask = sum(1 << bit for bit in bits)
+        moved = permutation[self.__local__(self.indices, bits)].astype(np.int64)
+        indices = (self.indices & ~mask) | self.__spread__(moved, bits)
+        order = np.argsort(indices, kind="stable")
+        self.indices = indices[order]
+        self.amplitudes = self.amplitudes[order]
+        return
@@ -20,5 +20,18 @@ class BaseCalculator(CalculatorInterface, BaseCore, BaseSingleGate, BaseMultiGat
 
     def pass_multi_gate(self, control: int, target: int, gate: np.array):
         self.__multi_operator_matrix__(
-            self.__create_braket_queue__(control, target, gate)
+            self.__create_control_mask__(control, target, gate)
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        self.__mcu_operator_matrix__(self.__create_mcu_mask__(controls, targets, gate))
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_mask__(qubits, np.asarray(diagonal))
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_mask__(qubits, np.asarray(permutation))
         )
@@ -1,5 +1,6 @@
 import numpy as np
 from ...qubit import qubit
+from ...errors import OutOfRangeError
 from ..interface import CoreInterface
 
 
@@ -8,6 +9,7 @@ class BaseCore(CoreInterface):
     def __init__(self, qubits: int, big_endian: bool = False, prep: chr = "z"):
         self.big_endian = big_endian
         self.qubits = qubits
+        self.indices = None
         self.state = qubit(prep)
         for _ in range(qubits - 1):
             self.state = np.kron(self.state, qubit(prep))
@@ -21,16 +23,89 @@ class BaseCore(CoreInterface):
         return
 
     def __multi_operator_matrix__(self, multi_gate_queue):
-        bra_ket_zero_kron = multi_gate_queue[0]
-        bra_ket_one_kron = multi_gate_queue[1]
-        to_add_zero = bra_ket_zero_kron[0]
-        to_add_one = bra_ket_one_kron[0]
-        for i in range(1, len(bra_ket_zero_kron)):
-            to_add_zero = np.kron(bra_ket_zero_kron[i], to_add_zero)
-            to_add_one = np.kron(bra_ket_one_kron[i], to_add_one)
-        self.state = np.dot(to_add_zero + to_add_one, self.state)
+        control_mask, target_mask, gate = multi_gate_queue
+        if self.indices is None:
+            self.indices = np.arange(2**self.qubits)
+        zero = np.flatnonzero(
+            self.indices & (control_mask | target_mask) == control_mask
+        )
+        one = zero | target_mask
+        state = self.state.copy()
+        amplitude_zero = state[zero]
+        amplitude_one = state[one]
+        state[zero] = gate[0][0] * amplitude_zero + gate[0][1] * amplitude_one
+        state[one] = gate[1][0] * amplitude_zero + gate[1][1] * amplitude_one
+        self.state = state
         return
 
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_mask, offsets, gate = mcu_queue
+        if self.indices is None:
+            self.indices = np.arange(2**self.qubits)
+        base = np.flatnonzero(
+            self.indices & (control_mask | offsets[-1]) == control_mask
+        )
+        rows = base | offsets[:, None]
+        state = self.state.copy()
+        flat = state.reshape(-1)
+        flat[rows] = np.dot(gate, flat[rows])
+        self.state = state
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        axes = [self.qubits - 1 - bit for bit in bits]
+        shape = [1] * self.qubits
+        for axis in axes:
+            shape[axis] = 2
+        phases = diagonal.reshape((2,) * len(bits)).transpose(
+            sorted(range(len(axes)), key=axes.__getitem__)
+        )
+        state = self.state.reshape((2,) * self.qubits)
+        state = state * phases.reshape(shape).astype(self.state.dtype)
+        self.state = state.reshape(self.state.shape)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        axes = [self.qubits - 1 - bit for bit in bits]
+        shape = self.state.shape
+        moved = np.moveaxis(
+            self.state.reshape((2,) * self.qubits), axes, list(range(len(bits)))
+        )
+        amplitudes = moved.reshape(permutation.size, -1)[np.argsort(permutation)]
+        self.state = np.moveaxis(
+            amplitudes.reshape(moved.shape), list(range(len(bits))), axes
+        ).reshape(shape)
+        return
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit, keeping the half of the state that agrees with the outcome.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        bit = self.qubits - 1 - qubit if self.big_endian else qubit
+        shape = self.state.shape
+        state = self.state.copy().reshape(2 ** (self.qubits - bit - 1), 2, 2**bit)
+        zero, one = state[:, 0], state[:, 1]
+        probability = float(np.sum(np.square(np.abs(one))))
+        outcome = int(draw < probability)
+        kept, dropped = (one, zero) if outcome else (zero, one)
+        kept *= 1 / np.sqrt(probability if outcome else 1 - probability)
+        if reset and outcome:
+            zero[...] = one
+            one[...] = 0
+        else:
+            dropped[...] = 0
+        self.state = state.reshape(shape)
+        return outcome
+
     def __set_state__(self, state_to_store):
         self.state = state_to_store
         return
@@ -0,0 +1 @@
+from .batch_calculator import BatchCalculator
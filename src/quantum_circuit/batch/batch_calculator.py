@@ -0,0 +1,48 @@
+import numpy as np
+from ..interface import CalculatorInterface
+from ..statevector.statevector_single_gate import StateVectorSingleGate
+from ..statevector.statevector_multi_gate import StateVectorMultiGate
+from .batch_core import BatchCore
+
+
+class BatchCalculator(
+    CalculatorInterface, BatchCore, StateVectorSingleGate, StateVectorMultiGate
+):
+    """Calculator that runs one circuit on a batch of input states at once.
+
+    Every gate, and every block a fusion pass merged, is applied to all members of
+    the batch in one pass of the statevector kernels. The batch starts as B copies
+    of the prepped state and is set with a (B, 2^n) array of state vectors, or a
+    (B, n, 2) array of the state of every qubit of product states.
+    """
+
+    def __init__(
+        self, qubits: int, big_endian: bool = False, prep: chr = "z", batch: int = 1
+    ):
+        BatchCore.__init__(self, qubits, big_endian, prep, batch)
+        StateVectorSingleGate.__init__(self, qubits, big_endian)
+        StateVectorMultiGate.__init__(self, qubits, big_endian)
+
+    def pass_single_gate(self, qubits_to_apply, gate: np.array):
+        self.__operator_matrix__(self.__create_gate_queue__(qubits_to_apply, gate))
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.__operator_matrix__(self.__custom_gate_queue__(gate_queue))
+
+    def pass_multi_gate(self, control: int, target: int, gate: np.array):
+        self.__multi_operator_matrix__(
+            self.__create_control_queue__(control, target, gate)
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        self.__mcu_operator_matrix__(self.__create_mcu_queue__(controls, targets, gate))
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_queue__(qubits, diagonal)
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_queue__(qubits, permutation)
+        )
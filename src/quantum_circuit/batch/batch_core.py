@@ -0,0 +1,160 @@
+import numpy as np
+from ...errors import InvalidEngineError
+from ..statevector.statevector_core import StateVectorCore
+
+
+class BatchCore(StateVectorCore):
+    """Holds a batch of state vectors that every gate is applied to at once.
+
+    The states are the rows of a contiguous (B, 2^n) array. A kernel of the
+    statevector engine reshapes it with the batch as one more leading axis that the
+    gate does not touch, so a gate costs one vectorized pass over the whole batch
+    instead of a Python loop over B circuits.
+
+    A gate may also be given as a (B, 2^k, 2^k) stack with one matrix per member,
+    such as a rotation swept over an array of angles, which is applied to every
+    member in the same single pass.
+
+    Attributes:
+        random (np.random.Generator): Draws every sample, numpy's global generator
+                                      unless the circuit gives its own.
+    """
+
+    random = np.random
+
+    def __init__(
+        self, qubits: int, big_endian: bool = False, prep: chr = "z", batch: int = 1
+    ):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        self.threads = 1
+        self.batch = batch
+        self.state = StateVectorCore(qubits, big_endian, prep).state
+        return
+
+    @property
+    def state(self):
+        """State vector of every member of the batch as a (B, 2^n) array."""
+        return self.states
+
+    @state.setter
+    def state(self, state_to_store):
+        state = np.asarray(state_to_store)
+        if state.ndim == 3:
+            state = self.__product__(state)
+        if state.size == 2**self.qubits:
+            state = np.tile(state.reshape(1, -1), (self.batch, 1))
+        self.states = np.array(state, "F").reshape(self.batch, 2**self.qubits)
+
+    def __product__(self, qubit_states):
+        """Product state of every member of the batch, without a chain of krons.
+        Args:
+            qubit_states (np.array): (B, n, 2) state of every qubit of every member.
+        Returns:
+            np.array: (B, 2^n) state vector of every member.
+        """
+        states = np.ones((len(qubit_states), 1), "F")
+        for bit in reversed(range(self.qubits)):
+            qubit = self.qubits - 1 - bit if self.big_endian else bit
+            states = (states[:, :, None] * qubit_states[:, qubit, None, :]).reshape(
+                len(qubit_states), -1
+            )
+        return states
+
+    def __tensor__(self, bits):
+        """Reshapes every member of the batch so that each of the given bits has its
+           own axis.
+        Args:
+            bits (List[int]): Bits of the basis state index to split out.
+        Returns:
+            (np.array, dict): View of the batch and the axis of every given bit.
+        """
+        shape, axes = self.__shape__(bits)
+        return self.states.reshape([len(self.states)] + shape), {
+            bit: axis + 1 for bit, axis in axes.items()
+        }
+
+    def __members__(self, gate) -> None:
+        """Checks that a stack of gates holds one gate for every member of the batch.
+        Args:
+            gate (np.array): Gate or stack of gates to apply.
+        """
+        if np.ndim(gate) == 3 and len(gate) != self.batch:
+            raise InvalidEngineError(
+                f"A stack of {len(gate)} gates does not match a batch of {self.batch} states"
+            )
+        return
+
+    def __apply_pair__(self, tensor, axis: int, gate) -> None:
+        """Applies a 2x2 gate, or one 2x2 gate per member, onto an axis of the batch.
+        Args:
+            tensor (np.array): View of the batch.
+            axis (int): Axis of the target bit within the view.
+            gate (np.array): 2x2 gate or (B, 2, 2) stack of gates to apply.
+        """
+        self.__members__(gate)
+        if np.ndim(gate) == 3:
+            gate = np.moveaxis(gate, 0, -1).reshape(
+                (2, 2, len(gate)) + (1,) * (tensor.ndim - 2)
+            )
+        StateVectorCore.__apply_pair__(self, tensor, axis, gate)
+        return
+
+    def __apply_block__(self, tensor, axes, gate) -> None:
+        """Applies a 2^k x 2^k gate, or one per member, onto k axes of the batch.
+        Args:
+            tensor (np.array): View of the batch.
+            axes (List[int]): Axis of every target bit, the first one being the most
+                              significant bit of the gate.
+            gate (np.array): 2^k x 2^k gate or (B, 2^k, 2^k) stack of gates to apply.
+        """
+        self.__members__(gate)
+        if np.ndim(gate) == 2:
+            StateVectorCore.__apply_block__(self, tensor, axes, gate)
+            return
+        moved = np.moveaxis(tensor, axes, list(range(1, len(axes) + 1)))
+        amplitudes = moved.reshape(len(gate), gate.shape[-1], -1)
+        moved[...] = np.matmul(gate, amplitudes).reshape(moved.shape)
+        return
+
+    def probabilities(self):
+        """Probability of reading out every basis state of every member of the batch.
+        Returns:
+            np.array: (B, 2^n) probability of every basis state.
+        """
+        return (np.abs(self.states) ** 2).astype(float)
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Members of a batch would each collapse to their own outcome, which a single
+        classical bit cannot hold.
+        """
+        raise InvalidEngineError("A batch of states cannot be measured mid-circuit")
+
+    def sample(self, shots: int = 1):
+        """Reads out the qubits of every member of the batch.
+
+        The cumulative probabilities of member i are offset by i, so all draws of
+        every member are found by one searchsorted over the whole batch.
+
+        Args:
+            shots (int): Number of times to read out the qubits.
+        Returns:
+            List[List[str]]: Basis state of every member for every shot, the most
+                             significant bit first.
+        """
+        probabilities = self.probabilities()
+        cumulative = np.cumsum(probabilities, axis=1)
+        cumulative /= cumulative[:, -1:]
+        offsets = np.arange(len(cumulative))
+        cumulative += offsets[:, None]
+        draws = self.random.random((shots, len(cumulative))) + offsets
+        outcomes = np.searchsorted(cumulative.reshape(-1), draws, side="right")
+        outcomes = np.minimum(outcomes - offsets * 2**self.qubits, 2**self.qubits - 1)
+        return [
+            [bin(outcome)[2:].zfill(self.qubits) for outcome in shot]
+            for shot in outcomes
+        ]
+
+    def __set_state__(self, state_to_store):
+        self.state = state_to_store
+        return
@@ -0,0 +1 @@
+from .deferred_execution import DeferredExecution
@@ -0,0 +1,120 @@
+import hashlib
+import numpy as np
+from ...errors import UnboundParameterError
+from ..interface import CalculatorInterface
+from ..parameter import ParameterGate
+
+
+class DeferredExecution(CalculatorInterface):
+    """Records gates instead of applying them and runs them when the state is read.
+
+    Building, drawing and counting the gates of a circuit never touches the calculator
+    underneath, which is not even created, so no state is allocated until the state,
+    or a tool reading it such as probability or measure, is needed. The recorded gates
+    are then replayed in order.
+
+    Args:
+        build (Callable[[], CalculatorInterface]): Creates the calculator to run gates on.
+        qubits (int): Number of qubits of the calculator.
+
+    Attributes:
+        build (Callable[[], CalculatorInterface]): Creates the calculator to run gates on.
+        built (CalculatorInterface): Calculator once created, None before.
+        qubits (int): Number of qubits of the calculator.
+        queue (list): Recorded gates as the name of the calculator method and its arguments.
+    """
+
+    def __init__(self, build, qubits: int):
+        self.build = build
+        self.built = None
+        self.qubits = qubits
+        self.queue = []
+
+    def __getattr__(self, name: str):
+        return getattr(self.calculator, name)
+
+    @property
+    def calculator(self) -> CalculatorInterface:
+        """Calculator the recorded gates are run on, created the first time it is needed."""
+        if self.built is None:
+            self.built = self.build()
+        return self.built
+
+    @property
+    def state(self):
+        """State of the calculator once every recorded gate has been run."""
+        self.run()
+        return self.calculator.state
+
+    @state.setter
+    def state(self, state_to_store):
+        self.queue = []
+        self.calculator.state = state_to_store
+
+    @property
+    def key(self) -> str:
+        """Digest of the recorded gates, equal for two queues of the same gates."""
+        digest = hashlib.sha1()
+        for method, args in self.queue:
+            digest.update(method.encode())
+            for arg in args:
+                self.__digest__(digest, arg)
+        return digest.hexdigest()
+
+    def __digest__(self, digest, arg) -> None:
+        """Adds an argument of a recorded gate to a digest.
+        Args:
+            digest (hashlib._Hash): Digest of the recorded gates.
+            arg (int/list/np.array): Qubits, gate or gates given to a calculator method.
+        """
+        if isinstance(arg, ParameterGate):
+            digest.update(arg.function.__qualname__.encode())
+            self.__digest__(digest, [repr(argument) for argument in arg.args])
+            return
+        if isinstance(arg, (list, tuple)):
+            digest.update(b"[")
+            for item in arg:
+                self.__digest__(digest, item)
+            digest.update(b"]")
+            return
+        arg = np.asarray(arg)
+        digest.update(repr((arg.dtype.str, arg.shape)).encode())
+        digest.update(np.ascontiguousarray(arg).tobytes())
+        return
+
+    def run(self) -> None:
+        """Runs the recorded gates on the calculator in the order they were given."""
+        if any(
+            isinstance(arg, ParameterGate) for _, args in self.queue for arg in args
+        ):
+            raise UnboundParameterError("Parameters of the circuit are not bound")
+        queue, self.queue = self.queue, []
+        for method, args in queue:
+            getattr(self.calculator, method)(*args)
+        return
+
+    def pass_single_gate(self, qubits_to_apply, gate):
+        if not isinstance(qubits_to_apply, int):
+            qubits_to_apply = list(qubits_to_apply)
+        self.queue.append(("pass_single_gate", (qubits_to_apply, gate)))
+        return
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.queue.append(("pass_custom_gate_queue", (gate_queue,)))
+        return
+
+    def pass_multi_gate(self, control: int, target: int, gate):
+        self.queue.append(("pass_multi_gate", (control, target, gate)))
+        return
+
+    def pass_mcu_gate(self, controls, targets, gate):
+        self.queue.append(("pass_mcu_gate", (list(controls), list(targets), gate)))
+        return
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        self.queue.append(("pass_diagonal_gate", (list(qubits), diagonal)))
+        return
+
+    def pass_permutation_gate(self, qubits, permutation):
+        self.queue.append(("pass_permutation_gate", (list(qubits), permutation)))
+        return
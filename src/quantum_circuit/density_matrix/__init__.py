@@ -0,0 +1 @@
+from .density_matrix_calculator import DensityMatrixCalculator
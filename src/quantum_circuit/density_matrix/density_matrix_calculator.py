@@ -0,0 +1,60 @@
+import numpy as np
+from ..interface import CalculatorInterface
+from ..statevector.statevector_single_gate import StateVectorSingleGate
+from ..statevector.statevector_multi_gate import StateVectorMultiGate
+from .density_matrix_core import DensityMatrixCore
+
+
+class DensityMatrixCalculator(
+    CalculatorInterface, DensityMatrixCore, StateVectorSingleGate, StateVectorMultiGate
+):
+    """Calculator that keeps the density matrix of a mixed state.
+
+    Every gate is applied as U rho U^dagger with the local kernels of the statevector
+    engine. When a noise model is given, its channels for single qubit gates run on
+    the qubits of every single qubit gate right after it, and its channels for multi
+    qubit gates on the qubits of every controlled, multi-controlled and multi qubit
+    table gate.
+    """
+
+    def __init__(
+        self, qubits: int, big_endian: bool = False, prep: chr = "z", noise=None
+    ):
+        DensityMatrixCore.__init__(self, qubits, big_endian, prep, noise)
+        StateVectorSingleGate.__init__(self, qubits, big_endian)
+        StateVectorMultiGate.__init__(self, qubits, big_endian)
+
+    def pass_single_gate(self, qubits_to_apply, gate: np.array):
+        gate_queue = self.__create_gate_queue__(qubits_to_apply, gate)
+        self.__operator_matrix__(gate_queue)
+        self.__noise__([bit for bit, _ in gate_queue], "single")
+
+    def pass_custom_gate_queue(self, gate_queue):
+        gate_queue = self.__custom_gate_queue__(gate_queue)
+        self.__operator_matrix__(gate_queue)
+        self.__noise__([bit for bit, _ in gate_queue], "single")
+
+    def pass_multi_gate(self, control: int, target: int, gate: np.array):
+        multi_gate_queue = self.__create_control_queue__(control, target, gate)
+        self.__multi_operator_matrix__(multi_gate_queue)
+        self.__noise__(multi_gate_queue[:2], "multi")
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        mcu_queue = self.__create_mcu_queue__(controls, targets, gate)
+        self.__mcu_operator_matrix__(mcu_queue)
+        self.__noise__(mcu_queue[0] + mcu_queue[1], "multi")
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        diagonal_queue = self.__create_diagonal_queue__(qubits, diagonal)
+        self.__diagonal_operator_matrix__(diagonal_queue)
+        self.__noise__(
+            diagonal_queue[0], "single" if len(diagonal_queue[0]) == 1 else "multi"
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        permutation_queue = self.__create_permutation_queue__(qubits, permutation)
+        self.__permutation_operator_matrix__(permutation_queue)
+        self.__noise__(
+            permutation_queue[0],
+            "single" if len(permutation_queue[0]) == 1 else "multi",
+        )
@@ -0,0 +1,184 @@
+import numpy as np
+from ...qubit import qubit
+from ...errors import OutOfRangeError
+from ..interface import CoreInterface
+from ..statevector.statevector_core import StateVectorCore
+
+
+class DensityMatrixCore(CoreInterface):
+    """Holds the density matrix of a mixed state and the kernels that update it.
+
+    The 2^n x 2^n density matrix is flattened row by row into a state vector of 2n
+    qubits, where bit b + n of an index is bit b of the row and bit b is bit b of
+    the column. U rho U^dagger is then U on the row bits followed by the conjugate
+    of U on the column bits, both run by the in-place kernels of the statevector
+    engine, and a channel on a qubit is its 4x4 superoperator on the row and column
+    bit of the qubit. No 4^n x 4^n superoperator is ever formed.
+
+    Attributes:
+        random (np.random.Generator): Draws every sample, numpy's global generator
+                                      unless the circuit gives its own.
+    """
+
+    random = np.random
+
+    def __init__(
+        self, qubits: int, big_endian: bool = False, prep: chr = "z", noise=None
+    ):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        self.noise = noise
+        self.vector = StateVectorCore(2 * qubits)
+        if prep != "z":
+            state = qubit(prep)
+            for _ in range(qubits - 1):
+                state = np.kron(state, qubit(prep))
+            self.state = state
+        return
+
+    @property
+    def state(self):
+        """Density matrix of the state as a 2^n x 2^n array."""
+        return self.vector.state.reshape(2**self.qubits, 2**self.qubits)
+
+    @state.setter
+    def state(self, state_to_store):
+        state = np.asarray(state_to_store)
+        if state.size == 2**self.qubits:
+            state = state.reshape(-1, 1)
+            state = np.dot(state, state.conj().T)
+        self.vector.state = np.array(state, "F").reshape(4**self.qubits, 1)
+
+    @property
+    def purity(self) -> float:
+        """Trace of the square of the density matrix, 1 for a pure state."""
+        return float(np.vdot(self.vector.state, self.vector.state).real)
+
+    def __bit__(self, qubit: int) -> int:
+        """Position of a qubit inside of a basis state index.
+        Args:
+            qubit (int): Qubit of the quantum circuit.
+        Returns:
+            int: Bit that holds the qubit, with 0 being the least significant bit.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        return self.qubits - 1 - qubit if self.big_endian else qubit
+
+    def __rows__(self, bits):
+        """Bits of the flattened density matrix that hold the given bits of the rows."""
+        return [bit + self.qubits for bit in bits]
+
+    def __noise__(self, bits, gate_type: str) -> None:
+        """Applies the channels attached to a type of gate on every bit it touched.
+        Args:
+            bits (List[int]): Bits the gate acted on.
+            gate_type (str): "single" or "multi".
+        """
+        if self.noise is None:
+            return
+        superoperator = self.noise.superoperator(gate_type)
+        if superoperator is None:
+            return
+        superoperator = superoperator.astype("F")
+        for bit in sorted(set(bits)):
+            self.vector.__mcu_operator_matrix__(
+                [[], [bit + self.qubits, bit], superoperator]
+            )
+        return
+
+    def probabilities(self):
+        """Probability of reading out every basis state, readout errors included.
+        Returns:
+            np.array: Probability of every basis state.
+        """
+        probabilities = np.diagonal(self.state).real.astype(float)
+        if self.noise is None:
+            return probabilities
+        return self.noise.read(probabilities)
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit, keeping the block of the density matrix that agrees with
+           the outcome.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        bit = self.__bit__(qubit)
+        diagonal = np.diagonal(self.state).real
+        probability = float(
+            np.sum(diagonal.reshape(2 ** (self.qubits - bit - 1), 2, 2**bit)[:, 1])
+        )
+        outcome = int(draw < probability)
+        tensor, axes = self.vector.__tensor__(self.__rows__([bit]) + [bit])
+        blocks = {}
+        for row in range(2):
+            for column in range(2):
+                index = [slice(None)] * tensor.ndim
+                index[axes[bit + self.qubits]] = row
+                index[axes[bit]] = column
+                blocks[row, column] = tensor[tuple(index)]
+        blocks[outcome, outcome] *= 1 / (probability if outcome else 1 - probability)
+        if reset and outcome:
+            blocks[0, 0][...] = blocks[1, 1]
+        kept = (0, 0) if reset else (outcome, outcome)
+        for block, view in blocks.items():
+            if block != kept:
+                view[...] = 0
+        return outcome
+
+    def sample(self, shots: int = 1):
+        """Reads out the qubits, readout errors included.
+        Args:
+            shots (int): Number of times to read out the qubits.
+        Returns:
+            List[str]: Basis state of every shot, the most significant bit first.
+        """
+        probabilities = np.clip(self.probabilities(), 0, None)
+        outcomes = self.random.choice(
+            probabilities.size, shots, p=probabilities / probabilities.sum()
+        )
+        return [bin(outcome)[2:].zfill(self.qubits) for outcome in outcomes]
+
+    def __operator_matrix__(self, gate_queue):
+        self.vector.__operator_matrix__(
+            [(bit + self.qubits, gate) for bit, gate in gate_queue]
+            + [(bit, gate.conj()) for bit, gate in gate_queue]
+        )
+        return
+
+    def __multi_operator_matrix__(self, multi_gate_queue):
+        control_bit, target_bit, gate = multi_gate_queue
+        self.vector.__multi_operator_matrix__(
+            [control_bit + self.qubits, target_bit + self.qubits, gate]
+        )
+        self.vector.__multi_operator_matrix__([control_bit, target_bit, gate.conj()])
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_bits, target_bits, gate = mcu_queue
+        self.vector.__mcu_operator_matrix__(
+            [self.__rows__(control_bits), self.__rows__(target_bits), gate]
+        )
+        self.vector.__mcu_operator_matrix__([control_bits, target_bits, gate.conj()])
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        self.vector.__diagonal_operator_matrix__(
+            [self.__rows__(bits) + bits, np.kron(diagonal, diagonal.conj())]
+        )
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        self.vector.__permutation_operator_matrix__([self.__rows__(bits), permutation])
+        self.vector.__permutation_operator_matrix__([bits, permutation])
+        return
+
+    def __set_state__(self, state_to_store):
+        self.state = state_to_store
+        return
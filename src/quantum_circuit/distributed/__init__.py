@@ -0,0 +1 @@
+from .distributed_calculator import DistributedCalculator
@@ -0,0 +1,52 @@
+import numpy as np
+from ..interface import CalculatorInterface
+from ..statevector.statevector_single_gate import StateVectorSingleGate
+from ..statevector.statevector_multi_gate import StateVectorMultiGate
+from .distributed_core import DistributedCore
+
+
+class DistributedCalculator(
+    CalculatorInterface, DistributedCore, StateVectorSingleGate, StateVectorMultiGate
+):
+    """Calculator that splits the state vector between worker processes.
+
+    The state lives in shared memory and every worker applies the statevector
+    kernels to its own shard, so gates run in parallel without the GIL and without
+    copying the state between processes. Gates on the highest qubits first swap
+    them into the shards, which costs one pass over a quarter of the state.
+    """
+
+    def __init__(
+        self,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        processes: int = None,
+    ):
+        DistributedCore.__init__(self, qubits, big_endian, prep, processes)
+        StateVectorSingleGate.__init__(self, qubits, big_endian)
+        StateVectorMultiGate.__init__(self, qubits, big_endian)
+
+    def pass_single_gate(self, qubits_to_apply, gate: np.array):
+        self.__operator_matrix__(self.__create_gate_queue__(qubits_to_apply, gate))
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.__operator_matrix__(self.__custom_gate_queue__(gate_queue))
+
+    def pass_multi_gate(self, control: int, target: int, gate: np.array):
+        self.__multi_operator_matrix__(
+            self.__create_control_queue__(control, target, gate)
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        self.__mcu_operator_matrix__(self.__create_mcu_queue__(controls, targets, gate))
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_queue__(qubits, diagonal)
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_queue__(qubits, permutation)
+        )
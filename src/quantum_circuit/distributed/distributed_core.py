@@ -0,0 +1,288 @@
+import multiprocessing
+import os
+import weakref
+import numpy as np
+from multiprocessing import shared_memory
+from ...errors import OutOfRangeError
+from ..interface import CoreInterface
+from .distributed_shard import DistributedShard, serve
+
+
+class DistributedCore(CoreInterface):
+    """Holds a state vector in shared memory and the worker processes that update it.
+
+    The state is cut into one shard per process on its highest bits, the global
+    bits. A gate on local bits is sent to every worker, which applies it to its own
+    shard with the statevector kernels, and controls on global bits only decide
+    which workers take part. Before a gate acts on a global bit, that bit is
+    swapped with a local bit the gate does not use, so the layout records which
+    bit of the shared state holds every bit of the circuit's basis states.
+
+    Attributes:
+        processes (int): Number of worker processes, a power of two.
+        local_qubits (int): Number of bits within every shard.
+        layout (List[int]): Bit of the shared state that holds every bit of the state.
+        whole (DistributedShard): The whole shared state, used by the main process for
+                                  gates that touch more bits than a shard holds.
+    """
+
+    def __init__(
+        self,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        processes: int = None,
+    ):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        if processes is None:
+            processes = os.cpu_count() or 1
+        global_qubits = min(int(np.log2(max(processes, 1))), max(qubits - 2, 0))
+        self.processes = 2**global_qubits
+        self.local_qubits = qubits - global_qubits
+        self.layout = list(range(qubits))
+        memory = shared_memory.SharedMemory(create=True, size=2**qubits * 8)
+        self.whole = DistributedShard(memory.buf, qubits, qubits, 0)
+        context = multiprocessing.get_context()
+        self.connections = []
+        workers = []
+        for index in range(self.processes):
+            connection, worker_connection = context.Pipe()
+            worker = context.Process(
+                target=serve,
+                args=(memory.name, qubits, self.local_qubits, index, worker_connection),
+                daemon=True,
+            )
+            worker.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            workers.append(worker)
+        self.close = weakref.finalize(
+            self,
+            DistributedCore.__shutdown__,
+            memory,
+            workers,
+            self.connections,
+            os.getpid(),
+        )
+        self.__broadcast__(
+            {index: ("__prep__", (prep,)) for index in range(len(workers))}
+        )
+        return
+
+    @staticmethod
+    def __shutdown__(memory, workers, connections, owner: int) -> None:
+        """Stops the workers and frees the shared memory.
+        A process forked from the one that made the workers inherits this finalizer
+        and leaves them to their owner.
+        """
+        if os.getpid() != owner:
+            return
+        for connection in connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in workers:
+            worker.join(5)
+            if worker.is_alive():
+                worker.terminate()
+        try:
+            memory.close()
+        except BufferError:
+            pass
+        memory.unlink()
+        return
+
+    @property
+    def state(self):
+        """Copy of the state with every bit back in its place."""
+        tensor = self.whole.state.reshape((2,) * self.qubits)
+        order = [
+            self.qubits - 1 - self.layout[self.qubits - 1 - axis]
+            for axis in range(self.qubits)
+        ]
+        return np.array(tensor.transpose(order), "F").reshape(2**self.qubits, 1)
+
+    @state.setter
+    def state(self, state_to_store):
+        self.whole.state[...] = np.asarray(state_to_store).reshape(2**self.qubits, 1)
+        self.layout = list(range(self.qubits))
+
+    def __bit__(self, qubit: int) -> int:
+        """Bit of the state's basis state indices that holds a qubit.
+        Args:
+            qubit (int): Qubit of the quantum circuit.
+        Returns:
+            int: Bit that holds the qubit, with 0 being the least significant bit.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        return self.qubits - 1 - qubit if self.big_endian else qubit
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit, keeping the half of the state that agrees with the outcome.
+        The shared state is collapsed from the main process while the workers wait,
+        on the bit of the shared state that holds the qubit.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        bit = self.layout[self.__bit__(qubit)]
+        state = self.whole.state.reshape(2 ** (self.qubits - bit - 1), 2, 2**bit)
+        zero, one = state[:, 0], state[:, 1]
+        probability = float(np.sum(np.square(np.abs(one))))
+        outcome = int(draw < probability)
+        kept, dropped = (one, zero) if outcome else (zero, one)
+        kept *= 1 / np.sqrt(probability if outcome else 1 - probability)
+        if reset and outcome:
+            zero[...] = one
+            one[...] = 0
+        else:
+            dropped[...] = 0
+        return outcome
+
+    def __broadcast__(self, tasks) -> None:
+        """Sends tasks to the workers and waits until all of them are done.
+        Args:
+            tasks (dict): Method of DistributedShard and its arguments for every worker
+                          that takes part.
+        """
+        for index, task in tasks.items():
+            self.connections[index].send(task)
+        errors = [self.connections[index].recv() for index in tasks]
+        for error in errors:
+            if error is not None:
+                raise error
+        return
+
+    def __exchange__(self, global_bit: int, local_bit: int) -> None:
+        """Swaps a global bit of the shared state with a local one.
+        Args:
+            global_bit (int): Bit of the shared state above the local bits.
+            local_bit (int): Bit of the shared state within the shards.
+        """
+        other_bit = 0 if local_bit else 1
+        self.__broadcast__(
+            {
+                index: (
+                    "__exchange__",
+                    (global_bit - self.local_qubits, local_bit, other_bit),
+                )
+                for index in range(self.processes)
+            }
+        )
+        located = self.layout.index(global_bit)
+        self.layout[self.layout.index(local_bit)] = global_bit
+        self.layout[located] = local_bit
+        return
+
+    def __localize__(self, bits, used) -> bool:
+        """Swaps every global bit of a gate's targets with a local bit it does not use.
+        Args:
+            bits (List[int]): Bits of the state the gate acts on.
+            used (List[int]): Every bit of the state the gate touches.
+        Returns:
+            bool: If every bit is local, False when the shards are too small for it.
+        """
+        placed = {self.layout[bit] for bit in used}
+        free = [
+            local_bit
+            for local_bit in reversed(range(self.local_qubits))
+            if local_bit not in placed
+        ]
+        moving = [bit for bit in bits if self.layout[bit] >= self.local_qubits]
+        if len(moving) > len(free) or self.local_qubits < 2:
+            return not moving
+        for bit, local_bit in zip(moving, free):
+            self.__exchange__(self.layout[bit], local_bit)
+        return True
+
+    def __everywhere__(self, method: str, arguments) -> None:
+        """Runs a kernel on every shard."""
+        self.__broadcast__(
+            {index: (method, arguments) for index in range(self.processes)}
+        )
+        return
+
+    def __operator_matrix__(self, gate_queue):
+        bits = [bit for bit, _ in gate_queue]
+        if not self.__localize__(bits, bits):
+            self.whole.__operator_matrix__(
+                [(self.layout[bit], gate) for bit, gate in gate_queue]
+            )
+            return
+        self.__everywhere__(
+            "__operator_matrix__",
+            ([(self.layout[bit], gate) for bit, gate in gate_queue],),
+        )
+        return
+
+    def __multi_operator_matrix__(self, multi_gate_queue):
+        control_bit, target_bit, gate = multi_gate_queue
+        self.__mcu_operator_matrix__([[control_bit], [target_bit], gate])
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_bits, target_bits, gate = mcu_queue
+        if not self.__localize__(target_bits, control_bits + target_bits):
+            self.whole.__mcu_operator_matrix__(
+                [
+                    [self.layout[bit] for bit in control_bits],
+                    [self.layout[bit] for bit in target_bits],
+                    gate,
+                ]
+            )
+            return
+        controls = [self.layout[bit] for bit in control_bits]
+        local = [bit for bit in controls if bit < self.local_qubits]
+        mask = sum(
+            1 << (bit - self.local_qubits) for bit in controls if bit not in local
+        )
+        queue = [local, [self.layout[bit] for bit in target_bits], gate]
+        self.__broadcast__(
+            {
+                index: ("__mcu_operator_matrix__", (queue,))
+                for index in range(self.processes)
+                if index & mask == mask
+            }
+        )
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        placed = [self.layout[bit] for bit in bits]
+        local = [bit for bit in placed if bit < self.local_qubits]
+        table = diagonal.reshape((2,) * len(bits))
+        tasks = {}
+        for index in range(self.processes):
+            phases = table[
+                tuple(
+                    (
+                        slice(None)
+                        if bit < self.local_qubits
+                        else (index >> (bit - self.local_qubits)) & 1
+                    )
+                    for bit in placed
+                )
+            ].reshape(-1)
+            if not np.all(phases == 1):
+                tasks[index] = ("__diagonal_operator_matrix__", ([local, phases],))
+        self.__broadcast__(tasks)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        if not self.__localize__(bits, bits):
+            self.whole.__permutation_operator_matrix__(
+                [[self.layout[bit] for bit in bits], permutation]
+            )
+            return
+        self.__everywhere__(
+            "__permutation_operator_matrix__",
+            ([[self.layout[bit] for bit in bits], permutation],),
+        )
+        return
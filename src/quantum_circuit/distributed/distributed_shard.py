@@ -0,0 +1,108 @@
+import numpy as np
+from multiprocessing import shared_memory
+from ..statevector.statevector_core import StateVectorCore
+
+
+class DistributedShard(StateVectorCore):
+    """Slice of a state vector in shared memory that the statevector kernels run on.
+
+    The state of n qubits is cut into 2^g shards on its g highest bits, the global
+    bits, and shard i holds every amplitude whose global bits spell i. Its own
+    n - g bits are the local bits, so a kernel that only touches local bits runs on
+    the shard exactly like it would on a whole state.
+
+    Args:
+        buffer (memoryview): Shared memory holding the whole state.
+        qubits (int): Number of qubits of the whole state.
+        local_qubits (int): Number of bits held within every shard.
+        index (int): Which shard this is.
+
+    Attributes:
+        shards (np.array): The whole state, one row per shard.
+        index (int): Which shard this is.
+        state (np.array): The (2^l, 1) view of this shard.
+    """
+
+    def __init__(self, buffer, qubits: int, local_qubits: int, index: int):
+        self.big_endian = False
+        self.qubits = local_qubits
+        self.threads = 1
+        self.shards = np.ndarray(
+            (2 ** (qubits - local_qubits), 2**local_qubits), "F", buffer
+        )
+        self.index = index
+        self.state = self.shards[index].reshape(2**local_qubits, 1)
+
+    def __prep__(self, prep: chr) -> None:
+        """Writes this shard of every qubit prepared in the same direction.
+        Args:
+            prep (chr): Direction of the qubits, "z", "x" or "y".
+        """
+        qubits = self.qubits + int(np.log2(len(self.shards)))
+        if prep == "z":
+            self.state[...] = 0
+            self.state[0] = self.index == 0
+            return
+        self.state[...] = 2 ** (-qubits / 2)
+        if prep == "y":
+            ones = np.full(self.state.shape, bin(self.index).count("1"), np.uint8)
+            basis = np.arange(self.state.size).reshape(self.state.shape)
+            for bit in range(self.qubits):
+                ones += ((basis >> bit) & 1).astype(np.uint8)
+            self.state *= np.array([1, 1j, -1, -1j], "F")[ones % 4]
+        return
+
+    def __exchange__(self, global_bit: int, local_bit: int, other_bit: int) -> None:
+        """Swaps a global bit of the state with one of the local bits.
+
+        Shards whose global bit differs are paired up. Every amplitude with the
+        global bit unset and the local bit set trades places with its partner that
+        has the global bit set and the local bit unset. The pair splits the work
+        on a second local bit, so each shard copies a quarter of its amplitudes.
+
+        Args:
+            global_bit (int): Bit of the shard index to swap.
+            local_bit (int): Bit within the shard to swap it with.
+            other_bit (int): Another bit within the shard the work is split on.
+        """
+        side = (self.index >> global_bit) & 1
+        own, axes = self.__tensor__([local_bit, other_bit])
+        partner = self.shards[self.index ^ (1 << global_bit)].reshape(own.shape)
+        index = [slice(None)] * own.ndim
+        index[axes[other_bit]] = side
+        index[axes[local_bit]] = 1 - side
+        mine = own[tuple(index)]
+        index[axes[local_bit]] = side
+        theirs = partner[tuple(index)]
+        swapped = mine.copy()
+        mine[...] = theirs
+        theirs[...] = swapped
+        return
+
+
+def serve(name: str, qubits: int, local_qubits: int, index: int, connection) -> None:
+    """Runs the kernels sent over a connection on one shard until told to stop.
+    Args:
+        name (str): Name of the shared memory holding the state.
+        qubits (int): Number of qubits of the whole state.
+        local_qubits (int): Number of bits held within every shard.
+        index (int): Shard of the state to work on.
+        connection (Connection): Receives (method, arguments) tasks and None to stop,
+                                 answers every task with None or the raised error.
+    """
+    memory = shared_memory.SharedMemory(name)
+    shard = DistributedShard(memory.buf, qubits, local_qubits, index)
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        method, arguments = task
+        try:
+            getattr(shard, method)(*arguments)
+        except Exception as error:
+            connection.send(error)
+        else:
+            connection.send(None)
+    del shard
+    memory.close()
+    connection.close()
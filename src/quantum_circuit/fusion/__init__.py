@@ -0,0 +1 @@
+from .gate_fusion import GateFusion
@@ -0,0 +1,342 @@
+import numpy as np
+from ...quantum_gate import swap
+from ..interface import CalculatorInterface
+from ..parameter import ParameterGate
+
+
+class GateFusion(CalculatorInterface):
+    """Merges runs of gates on the same qubits before they reach a calculator.
+
+    Gates are held back in blocks of at most max_qubits qubits and multiplied into
+    one matrix per block. A block is only passed on once a gate that does not fit
+    in it touches one of its qubits or the state is read, so a run like
+    rz -> ry -> rz -> sx, or the cx/u/cx sequence of an rzz, costs a single pass
+    over the state no matter which calculator is underneath. Diagonal gates are
+    kept as phases and permutation gates as the basis state each basis state is
+    sent to instead, so a layer of rz, cz and rzz gates, or a ladder of x, cx,
+    swap and ccx gates, merges into one table spanning up to max_table_qubits.
+    A stack of gates swept over a batch, or a gate of parameters, is never fused
+    and is passed on as it is.
+
+    Args:
+        calculator (CalculatorInterface): Calculator the fused gates are passed on to.
+        max_qubits (int): Largest block to fuse gates into, 1 for single qubit runs and
+                          2 to also collapse runs confined to a pair of qubits.
+        max_table_qubits (int): Largest diagonal or permutation block, which keeps a
+                                table of 2^k entries for its k qubits.
+
+    Attributes:
+        calculator (CalculatorInterface): Calculator the fused gates are passed on to.
+        max_qubits (int): Largest block to fuse gates into.
+        max_table_qubits (int): Largest diagonal or permutation block.
+        pending (dict): Block waiting to be applied on every qubit, as a list of the
+                        block's qubits, its matrix or table with the first qubit most
+                        significant, and its kind ("matrix", "diagonal", "permutation").
+        eliminated (int): Number of gate applications that were fused away.
+        tolerance (float): Largest difference between entries of a fused block and
+                           of a simpler gate for the block to be taken as that gate,
+                           a few times the rounding error of the complex64 gates.
+    """
+
+    tolerance = 4 * np.finfo(np.float32).eps
+
+    def __init__(self, calculator, max_qubits: int = 1, max_table_qubits: int = 16):
+        self.calculator = calculator
+        self.max_qubits = max_qubits
+        self.max_table_qubits = max_table_qubits
+        self.pending = {}
+        self.eliminated = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self.calculator, name)
+
+    @property
+    def state(self):
+        """State of the calculator once every pending gate has been applied."""
+        self.flush()
+        return self.calculator.state
+
+    @state.setter
+    def state(self, state_to_store):
+        self.pending = {}
+        self.calculator.state = state_to_store
+
+    def __matrix__(self, gate, kind: str):
+        """Matrix of a gate given as a matrix, a diagonal or a permutation.
+        Args:
+            gate (np.array): Matrix or table of the gate.
+            kind (str): How the gate is given.
+        Returns:
+            np.array: Matrix of the gate.
+        """
+        if kind == "diagonal":
+            return np.diag(gate)
+        if kind == "permutation":
+            matrix = np.zeros((gate.size, gate.size), complex)
+            matrix[gate, np.arange(gate.size)] = 1
+            return matrix
+        return gate
+
+    def __close__(self, gate, other) -> bool:
+        """Whether a fused block only differs from a gate by rounding errors."""
+        return np.allclose(gate, other, rtol=0, atol=self.tolerance)
+
+    def __table__(self, gate):
+        """Finds out if a fused matrix only multiplies phases or permutes basis states.
+        Args:
+            gate (np.array): Matrix of the fused block.
+        Returns:
+            (str, np.array): Kind of the block and its matrix or table.
+        """
+        if self.__close__(gate, np.diag(np.diagonal(gate))):
+            return "diagonal", np.diagonal(gate)
+        permutation = np.argmax(np.abs(gate), axis=0)
+        if self.__close__(gate, self.__matrix__(permutation, "permutation")):
+            return "permutation", permutation
+        return "matrix", gate
+
+    def __expand__(self, gate, qubits, block_qubits):
+        """Expands a gate on some qubits of a block to a matrix on the whole block.
+        Args:
+            gate (np.array): Matrix of the gate, the first qubit being most significant.
+            qubits (List[int]): Qubits the gate acts on.
+            block_qubits (List[int]): Qubits of the block, at most two.
+        Returns:
+            np.array: Matrix of the gate acting on every qubit of the block.
+        """
+        if list(qubits) == list(block_qubits):
+            return gate
+        if len(qubits) == 2:
+            return np.dot(swap(), np.dot(gate, swap()))
+        if qubits[0] == block_qubits[0]:
+            return np.kron(gate, np.identity(2))
+        return np.kron(np.identity(2), gate)
+
+    def __expand_table__(self, table, qubits, block_qubits, kind: str):
+        """Expands the table of a diagonal or permutation gate to a whole block.
+        Args:
+            table (np.array): Phases or permutation of the gate, the first qubit being
+                              most significant.
+            qubits (List[int]): Qubits the gate acts on.
+            block_qubits (List[int]): Qubits of the block, any number of them.
+            kind (str): "diagonal" or "permutation".
+        Returns:
+            np.array: The 2^k entries of the gate on the k qubits of the block.
+        """
+        if kind == "diagonal":
+            shape = [2 if qubit in qubits else 1 for qubit in block_qubits]
+            order = sorted(
+                range(len(qubits)),
+                key=lambda position: block_qubits.index(qubits[position]),
+            )
+            phases = table.reshape((2,) * len(qubits)).transpose(order).reshape(shape)
+            return np.broadcast_to(phases, (2,) * len(block_qubits)).reshape(-1)
+        indices = np.arange(2 ** len(block_qubits))
+        bits = [len(block_qubits) - 1 - block_qubits.index(qubit) for qubit in qubits]
+        local = np.zeros_like(indices)
+        for bit in bits:
+            local = (local << 1) | ((indices >> bit) & 1)
+        moved = table[local]
+        for shift, bit in enumerate(reversed(bits)):
+            indices = (indices & ~(1 << bit)) | (((moved >> shift) & 1) << bit)
+        return indices
+
+    def __opaque__(self, gate) -> bool:
+        """Finds out if a gate has to be passed on without being fused.
+        Args:
+            gate (np.array/ParameterGate): Gate to pass on.
+        Returns:
+            bool: If the gate is a stack of gates or depends on parameters.
+        """
+        return isinstance(gate, ParameterGate) or np.ndim(gate) > 2
+
+    def __store__(self, block) -> None:
+        """Makes a block the pending block of each of its qubits."""
+        for qubit in block[0]:
+            self.pending[qubit] = block
+        return
+
+    def __merge__(self, qubits, gate, kind: str = "matrix") -> None:
+        """Multiplies a gate into the pending blocks of its qubits.
+
+        Diagonal and permutation gates are merged as tables with blocks of the same
+        kind, up to max_table_qubits, and as matrices with anything else.
+
+        Args:
+            qubits (List[int]): Qubits the gate acts on.
+            gate (np.array): Matrix or table of the gate, the first qubit being most
+                             significant.
+            kind (str): How the gate is given, "matrix", "diagonal" or "permutation".
+        """
+        qubits = list(qubits)
+        blocks = []
+        for qubit in qubits:
+            block = self.pending.get(qubit)
+            if block is not None and all(block is not found for found in blocks):
+                blocks.append(block)
+        block_qubits = [qubit for block in blocks for qubit in block[0]]
+        block_qubits += [qubit for qubit in qubits if qubit not in block_qubits]
+        if (
+            kind != "matrix"
+            and all(block[2] == kind for block in blocks)
+            and len(block_qubits) <= self.max_table_qubits
+        ):
+            table = self.__expand_table__(gate, qubits, block_qubits, kind)
+            for block in blocks:
+                expanded = self.__expand_table__(block[1], block[0], block_qubits, kind)
+                table = expanded * table if kind == "diagonal" else table[expanded]
+                self.eliminated += 1
+            self.__store__([block_qubits, table, kind])
+            return
+        if len(qubits) > self.max_qubits:
+            self.flush(qubits)
+            self.__store__([qubits, gate, kind])
+            return
+        gate = self.__matrix__(gate, kind)
+        if len(qubits) == 1 and blocks and len(blocks[0][0]) <= self.max_qubits:
+            block_qubits = blocks[0][0]
+        else:
+            block_qubits = qubits
+        to_flush = [block for block in blocks if not set(block[0]) <= set(block_qubits)]
+        for block in to_flush:
+            self.flush(block[0][:1])
+        matrix = np.identity(2 ** len(block_qubits), complex)
+        for block in blocks:
+            if all(block is not flushed for flushed in to_flush):
+                expanded = self.__matrix__(block[1], block[2])
+                matrix = np.dot(
+                    self.__expand__(expanded, block[0], block_qubits), matrix
+                )
+                self.eliminated += 1
+        matrix = np.dot(self.__expand__(gate, qubits, block_qubits), matrix)
+        self.__store__([block_qubits, matrix, "matrix"])
+        return
+
+    def __pass_tables__(self, tables, kind: str) -> None:
+        """Passes disjoint diagonal or permutation blocks on as few tables as possible.
+        Args:
+            tables (List[(List[int], np.array)]): Qubits and table of every block.
+            kind (str): "diagonal" or "permutation".
+        """
+        chunks = [[]]
+        for block_qubits, table in tables:
+            size = sum(len(chunk_qubits) for chunk_qubits, _ in chunks[-1])
+            if chunks[-1] and size + len(block_qubits) > self.max_table_qubits:
+                chunks.append([])
+            chunks[-1].append((block_qubits, table))
+        for chunk in chunks:
+            qubits = []
+            if kind == "diagonal":
+                combined = np.ones(1, complex)
+            else:
+                combined = np.zeros(1, int)
+            for block_qubits, table in chunk:
+                qubits += block_qubits
+                if kind == "diagonal":
+                    combined = np.kron(combined, table)
+                else:
+                    combined = (combined[:, None] * table.size + table).reshape(-1)
+            if kind == "diagonal":
+                self.calculator.pass_diagonal_gate(qubits, combined.astype("F"))
+            else:
+                self.calculator.pass_permutation_gate(qubits, combined)
+        return
+
+    def flush(self, qubits=None) -> None:
+        """Applies the pending fused gates.
+
+        Diagonal and permutation blocks being applied are combined into as few
+        tables as max_table_qubits allows and single qubit blocks holding the same
+        matrix are passed on together.
+
+        Args:
+            qubits (List[int]): Qubits to apply the pending blocks of, all when None.
+        """
+        if qubits is None:
+            qubits = list(self.pending)
+        grouped = {}
+        tables = {"diagonal": [], "permutation": []}
+        for qubit in qubits:
+            if qubit not in self.pending:
+                continue
+            block_qubits, gate, kind = self.pending[qubit]
+            for block_qubit in block_qubits:
+                del self.pending[block_qubit]
+            if kind == "matrix":
+                kind, gate = self.__table__(gate)
+            if kind == "diagonal" and self.__close__(gate, 1):
+                self.eliminated += 1
+            elif kind == "permutation" and np.array_equal(gate, np.arange(gate.size)):
+                self.eliminated += 1
+            elif kind != "matrix":
+                tables[kind].append((block_qubits, gate))
+            elif len(block_qubits) == 1:
+                gate = gate.astype("F")
+                grouped.setdefault(gate.tobytes(), (gate, []))[1].append(
+                    block_qubits[0]
+                )
+            elif self.__close__(gate[:2, :2], np.identity(2)) and self.__close__(
+                gate[:2, 2:], 0
+            ):
+                self.calculator.pass_multi_gate(*block_qubits, gate[2:, 2:].astype("F"))
+            else:
+                swapped = np.dot(swap(), np.dot(gate, swap()))
+                if self.__close__(swapped[:2, :2], np.identity(2)) and self.__close__(
+                    swapped[:2, 2:], 0
+                ):
+                    self.calculator.pass_multi_gate(
+                        *block_qubits[::-1], swapped[2:, 2:].astype("F")
+                    )
+                else:
+                    self.calculator.pass_mcu_gate([], block_qubits, gate.astype("F"))
+        for gate, qubits_to_apply in grouped.values():
+            self.calculator.pass_single_gate(qubits_to_apply, gate)
+        for kind, kind_tables in tables.items():
+            if kind_tables:
+                self.__pass_tables__(kind_tables, kind)
+        return
+
+    def pass_single_gate(self, qubits_to_apply, gate):
+        if isinstance(qubits_to_apply, int):
+            qubits_to_apply = [qubits_to_apply]
+        if self.__opaque__(gate):
+            self.flush(qubits_to_apply)
+            self.calculator.pass_single_gate(qubits_to_apply, gate)
+            return
+        for qubit in qubits_to_apply:
+            self.__merge__([qubit], np.asarray(gate))
+        return
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.flush()
+        self.calculator.pass_custom_gate_queue(gate_queue)
+        return
+
+    def pass_multi_gate(self, control: int, target: int, gate):
+        if self.max_qubits < 2 or self.__opaque__(gate):
+            self.flush([control, target])
+            self.calculator.pass_multi_gate(control, target, gate)
+            return
+        controlled = np.identity(4, complex)
+        controlled[2:, 2:] = gate
+        self.__merge__([control, target], controlled)
+        return
+
+    def pass_mcu_gate(self, controls, targets, gate):
+        qubits = list(controls) + list(targets)
+        if len(qubits) > self.max_qubits or self.__opaque__(gate):
+            self.flush(qubits)
+            self.calculator.pass_mcu_gate(controls, targets, gate)
+            return
+        controlled = np.identity(2 ** len(qubits), complex)
+        controlled[-len(gate) :, -len(gate) :] = gate
+        self.__merge__(qubits, controlled)
+        return
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        self.__merge__(qubits, np.asarray(diagonal), "diagonal")
+        return
+
+    def pass_permutation_gate(self, qubits, permutation):
+        self.__merge__(qubits, np.asarray(permutation), "permutation")
+        return
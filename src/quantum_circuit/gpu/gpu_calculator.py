@@ -23,9 +23,20 @@ class GpuCalculator(CalculatorInterface, GpuCore, GpuSingleGate, GpuMultiGate):
 
     def pass_multi_gate(self, control: int, target: int, gate):
         self.__multi_operator_matrix__(
-            self.__create_braket_queue__(
-                cp.array(gate),
-                control,
-                target,
-            )
+            self.__create_control_mask__(control, target, cp.array(gate))
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate):
+        self.__mcu_operator_matrix__(
+            self.__create_mcu_mask__(controls, targets, cp.array(gate))
+        )
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_mask__(qubits, cp.array(diagonal))
+        )
+
+    def pass_permutation_gate(self, qubits, permutation):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_mask__(qubits, cp.array(permutation))
         )
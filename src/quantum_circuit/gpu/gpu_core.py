@@ -7,6 +7,7 @@ class GpuCore(CoreInterface):
     def __init__(self, qubits: int, big_endian: bool = False, prep: chr = "z"):
         self.big_endian = big_endian
         self.qubits = qubits
+        self.indices = None
         gpu_qubit = cp.array(qubit(prep))
         self.state = cp.array(gpu_qubit)
         for _ in range(qubits - 1):
@@ -20,12 +21,54 @@ class GpuCore(CoreInterface):
         return
 
     def __multi_operator_matrix__(self, multi_gate_queue):
-        bra_ket_zero_kron = multi_gate_queue[0]
-        bra_ket_one_kron = multi_gate_queue[1]
-        to_add_zero = bra_ket_zero_kron[0]
-        to_add_one = bra_ket_one_kron[0]
-        for i in range(1, len(bra_ket_zero_kron)):
-            to_add_zero = cp.kron(bra_ket_zero_kron[i], to_add_zero)
-            to_add_one = cp.kron(bra_ket_one_kron[i], to_add_one)
-        self.state = cp.dot(to_add_zero + to_add_one, self.state)
+        control_mask, target_mask, gate = multi_gate_queue
+        if self.indices is None:
+            self.indices = cp.arange(2**self.qubits)
+        zero = cp.flatnonzero(
+            self.indices & (control_mask | target_mask) == control_mask
+        )
+        one = zero | target_mask
+        amplitude_zero = self.state[zero]
+        amplitude_one = self.state[one]
+        self.state[zero] = gate[0][0] * amplitude_zero + gate[0][1] * amplitude_one
+        self.state[one] = gate[1][0] * amplitude_zero + gate[1][1] * amplitude_one
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_mask, offsets, gate = mcu_queue
+        if self.indices is None:
+            self.indices = cp.arange(2**self.qubits)
+        base = cp.flatnonzero(
+            self.indices & (control_mask | offsets[-1]) == control_mask
+        )
+        rows = base | offsets[:, None]
+        state = self.state.reshape(-1)
+        state[rows] = cp.dot(gate, state[rows])
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        axes = [self.qubits - 1 - bit for bit in bits]
+        shape = [1] * self.qubits
+        for axis in axes:
+            shape[axis] = 2
+        phases = diagonal.reshape((2,) * len(bits)).transpose(
+            sorted(range(len(axes)), key=axes.__getitem__)
+        )
+        state = self.state.reshape((2,) * self.qubits)
+        state = state * phases.reshape(shape).astype(self.state.dtype)
+        self.state = state.reshape(self.state.shape)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        axes = [self.qubits - 1 - bit for bit in bits]
+        shape = self.state.shape
+        moved = cp.moveaxis(
+            self.state.reshape((2,) * self.qubits), axes, list(range(len(bits)))
+        )
+        amplitudes = moved.reshape(permutation.size, -1)[cp.argsort(permutation)]
+        self.state = cp.moveaxis(
+            amplitudes.reshape(moved.shape), list(range(len(bits))), axes
+        ).reshape(shape)
         return
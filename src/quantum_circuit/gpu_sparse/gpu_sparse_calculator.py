@@ -31,3 +31,18 @@ class GpuSparseCalculator(
                 target,
             )
         )
+
+    def pass_mcu_gate(self, controls, targets, gate):
+        self.__mcu_operator_matrix__(
+            self.__create_mcu_mask__(controls, targets, cp.array(gate))
+        )
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_mask__(qubits, cp.array(diagonal))
+        )
+
+    def pass_permutation_gate(self, qubits, permutation):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_mask__(qubits, cp.array(permutation))
+        )
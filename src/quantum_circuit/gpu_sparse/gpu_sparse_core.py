@@ -1,5 +1,5 @@
 import cupy as cp
-from cupyx.scipy.sparse import csr_matrix, csc_matrix
+from cupyx.scipy.sparse import coo_matrix, csr_matrix, csc_matrix
 from cupyx.scipy.sparse import kron
 from ..interface import CoreInterface
 from ...qubit import qubit
@@ -32,3 +32,57 @@ class GpuSparseCore(CoreInterface):
             to_add_one = kron(csr_matrix(bra_ket_one_kron[i]), to_add_one)
         to_add_zero += to_add_one
         self.state = csc_matrix(to_add_zero @ self.state.toarray())
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_mask, offsets, gate = mcu_queue
+        size = 2**self.qubits
+        indices = cp.arange(size)
+        base = cp.flatnonzero(indices & (control_mask | offsets[-1]) == control_mask)
+        rows = base | offsets[:, None]
+        untouched = cp.ones(size, dtype=bool)
+        untouched[rows] = False
+        gate_row, gate_column = cp.nonzero(gate)
+        values = cp.broadcast_to(
+            gate[gate_row, gate_column][:, None], rows[gate_row].shape
+        )
+        operator = coo_matrix(
+            (
+                cp.concatenate(
+                    [
+                        cp.ones(int(cp.count_nonzero(untouched)), dtype=gate.dtype),
+                        values.ravel(),
+                    ]
+                ),
+                (
+                    cp.concatenate([indices[untouched], rows[gate_row].ravel()]),
+                    cp.concatenate([indices[untouched], rows[gate_column].ravel()]),
+                ),
+            ),
+            shape=(size, size),
+        ).tocsr()
+        self.state = csc_matrix(operator @ self.state.toarray())
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        self.state = csc_matrix(self.state)
+        rows = self.state.indices
+        position = cp.zeros(rows.size, dtype=int)
+        for bit in bits:
+            position = (position << 1) | ((rows >> bit) & 1)
+        self.state.data *= diagonal[position].astype(self.state.dtype)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        state = csc_matrix(self.state)
+        rows = state.indices.astype(int)
+        local = cp.zeros_like(rows)
+        for bit in bits:
+            local = (local << 1) | ((rows >> bit) & 1)
+        moved = permutation[local]
+        for shift, bit in enumerate(reversed(bits)):
+            rows = (rows & ~(1 << bit)) | (((moved >> shift) & 1) << bit)
+        self.state = csc_matrix(
+            (state.data, (rows, cp.zeros_like(rows))), shape=state.shape
+        )
+        return
@@ -10,3 +10,12 @@ class CalculatorInterface:
 
     def pass_multi_gate(self, control: int, target: int, gate):
         pass
+
+    def pass_mcu_gate(self, controls, targets, gate):
+        pass
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        pass
+
+    def pass_permutation_gate(self, qubits, permutation):
+        pass
@@ -7,3 +7,12 @@ class CoreInterface:
 
     def __multi_operator_matrix__(self, multi_gate_queue):
         pass
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        pass
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        pass
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        pass
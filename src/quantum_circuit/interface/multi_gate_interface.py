@@ -4,3 +4,15 @@ class MultiGateInterface:
 
     def __create_braket_queue__(self, gate, control: int, target_qubit: int):
         pass
+
+    def __create_control_mask__(self, control: int, target: int, gate):
+        pass
+
+    def __create_mcu_mask__(self, controls, targets, gate):
+        pass
+
+    def __create_diagonal_mask__(self, qubits, diagonal):
+        pass
+
+    def __create_permutation_mask__(self, qubits, permutation):
+        pass
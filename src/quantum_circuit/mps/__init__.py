@@ -0,0 +1 @@
+from .mps_calculator import MpsCalculator
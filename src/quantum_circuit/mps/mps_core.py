@@ -0,0 +1,365 @@
+import numpy as np
+from ...errors import OutOfRangeError
+from ...qubit import qubit
+from ..interface import CoreInterface
+
+
+class MpsCore(CoreInterface):
+    """Holds the state as a matrix product state, one tensor per qubit along a chain.
+
+    Site p of the chain holds a (left, 2, right) tensor and the amplitude of a basis
+    state is the product of the matrices its bits pick out of every site. A single
+    qubit gate updates one tensor. A gate on k qubits first moves their sites next
+    to each other with swaps, contracts the k tensors, applies the gate and splits
+    the result back with SVDs that keep at most max_bond singular values, dropping
+    those below cutoff times the largest. The tensors left of the orthogonality
+    center stay left orthonormal and the ones right of it right orthonormal, so the
+    kept singular values are the Schmidt values of the bond. Time and memory follow
+    the bond dimension instead of 2^n, which suits chains with little entanglement.
+
+    Attributes:
+        tensors (List[np.array]): Tensor of every site along the chain.
+        order (List[int]): Bit of the basis state indices held by every site.
+        center (int): Site every other site is orthonormal towards.
+        max_bond (int): Largest bond dimension kept, no limit when None.
+        cutoff (float): Smallest kept singular value relative to the largest one.
+        truncation (float): Total weight of the singular values dropped so far.
+        random (np.random.Generator): Draws every sample, numpy's global generator
+                                      unless the circuit gives its own.
+    """
+
+    random = np.random
+
+    def __init__(
+        self,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        max_bond: int = None,
+        cutoff: float = None,
+    ):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        self.max_bond = max_bond
+        self.cutoff = 1e-12 if cutoff is None else cutoff
+        self.truncation = 0.0
+        site = np.asarray(qubit(prep), "D").reshape(1, 2, 1)
+        self.tensors = [site.copy() for _ in range(qubits)]
+        self.order = list(range(qubits))
+        self.center = 0
+        return
+
+    @property
+    def state(self):
+        """The state as a dense (2^n, 1) array, only for chains small enough to hold it."""
+        state = np.ones((1, 1), "D")
+        for tensor in self.tensors:
+            state = np.tensordot(state, tensor, (-1, 0))
+        state = state.reshape((2,) * self.qubits)
+        sites = {bit: site for site, bit in enumerate(self.order)}
+        axes = [sites[self.qubits - 1 - axis] for axis in range(self.qubits)]
+        return np.array(state.transpose(axes), "F").reshape(2**self.qubits, 1)
+
+    @state.setter
+    def state(self, state_to_store):
+        if hasattr(state_to_store, "toarray"):
+            state_to_store = state_to_store.toarray()
+        rest = np.asarray(state_to_store, "D").reshape((2,) * self.qubits)
+        rest = rest.transpose(list(reversed(range(self.qubits)))).reshape(1, -1)
+        self.order = list(range(self.qubits))
+        self.tensors = []
+        for _ in range(self.qubits - 1):
+            left = rest.shape[0]
+            unitary, values, rest = self.__split__(rest.reshape(left * 2, -1))
+            self.tensors.append(unitary.reshape(left, 2, -1))
+            rest = values[:, None] * rest
+        self.tensors.append(rest.reshape(rest.shape[0], 2, 1))
+        self.center = self.qubits - 1
+
+    def __bit__(self, qubit: int) -> int:
+        """Bit of the basis state indices that holds a qubit.
+        Args:
+            qubit (int): Qubit of the quantum circuit.
+        Returns:
+            int: Bit that holds the qubit, with 0 being the least significant bit.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        return self.qubits - 1 - qubit if self.big_endian else qubit
+
+    def __split__(self, matrix):
+        """SVD of a matrix keeping at most max_bond singular values above the cutoff.
+        Args:
+            matrix (np.array): Matrix to split.
+        Returns:
+            (np.array, np.array, np.array): Left singular vectors, kept singular values
+                                            and right singular vectors.
+        """
+        unitary, values, adjoint = np.linalg.svd(matrix, full_matrices=False)
+        keep = max(1, int(np.sum(values > self.cutoff * values[0])))
+        if self.max_bond is not None:
+            keep = min(keep, self.max_bond)
+        self.truncation += float(np.sum(values[keep:] ** 2))
+        return unitary[:, :keep], values[:keep], adjoint[:keep]
+
+    def __center__(self, site: int) -> None:
+        """Moves the orthogonality center to a site with QR decompositions.
+        Args:
+            site (int): Site to move the center to.
+        """
+        while self.center < site:
+            tensor = self.tensors[self.center]
+            left, _, right = tensor.shape
+            unitary, rest = np.linalg.qr(tensor.reshape(left * 2, right))
+            self.tensors[self.center] = unitary.reshape(left, 2, -1)
+            self.center += 1
+            self.tensors[self.center] = np.tensordot(rest, self.tensors[self.center], 1)
+        while self.center > site:
+            tensor = self.tensors[self.center]
+            left, _, right = tensor.shape
+            unitary, rest = np.linalg.qr(tensor.reshape(left, 2 * right).T)
+            self.tensors[self.center] = unitary.T.reshape(-1, 2, right)
+            self.center -= 1
+            self.tensors[self.center] = np.tensordot(
+                self.tensors[self.center], rest.T, 1
+            )
+        return
+
+    def __apply_sites__(self, start: int, gate) -> None:
+        """Applies a gate on neighbouring sites and splits them back with SVDs.
+        Args:
+            start (int): First site of the gate.
+            gate (np.array): 2^k x 2^k gate on sites start to start + k - 1, the first
+                             site being most significant.
+        """
+        size = int(np.log2(len(gate)))
+        self.__center__(start)
+        block = self.tensors[start]
+        for site in range(start + 1, start + size):
+            block = np.tensordot(block, self.tensors[site], (-1, 0))
+        left, right = block.shape[0], block.shape[-1]
+        block = block.reshape(left, 2**size, right)
+        block = np.einsum("ij,ajb->aib", gate, block)
+        rest = block.reshape(left, -1)
+        for site in range(start, start + size - 1):
+            bond = rest.shape[0]
+            unitary, values, rest = self.__split__(rest.reshape(bond * 2, -1))
+            self.tensors[site] = unitary.reshape(bond, 2, -1)
+            rest = values[:, None] * rest
+        self.tensors[start + size - 1] = rest.reshape(rest.shape[0], 2, right)
+        self.center = start + size - 1
+        return
+
+    def __swap_sites__(self, site: int) -> None:
+        """Swaps the qubits held by a site and the next one."""
+        swap = np.identity(4)[[0, 2, 1, 3]]
+        self.__apply_sites__(site, swap)
+        self.order[site], self.order[site + 1] = self.order[site + 1], self.order[site]
+        return
+
+    def __apply__(self, bits, gate) -> None:
+        """Applies a gate on any bits, moving their sites next to each other first.
+
+        The sites are gathered around the middle one of them, so a gate on sites
+        far apart costs one swap per site in between.
+
+        Args:
+            bits (List[int]): Bits the gate acts on, the first one being most significant.
+            gate (np.array): 2^k x 2^k gate.
+        """
+        gate = np.asarray(gate, "D")
+        if len(bits) == 1:
+            site = self.order.index(bits[0])
+            if not np.allclose(np.dot(gate, gate.conj().T), np.identity(2)):
+                self.__center__(site)
+            self.tensors[site] = np.einsum("ij,ajb->aib", gate, self.tensors[site])
+            return
+        size = len(bits)
+        sites = sorted(self.order.index(bit) for bit in bits)
+        middle = size // 2
+        start = sites[middle] - middle
+        for position in reversed(range(middle)):
+            for site in range(sites[position], start + position):
+                self.__swap_sites__(site)
+        for position in range(middle + 1, size):
+            for site in reversed(range(start + position, sites[position])):
+                self.__swap_sites__(site)
+        window = self.order[start : start + size]
+        positions = [bits.index(bit) for bit in window]
+        gate = gate.reshape((2,) * 2 * size)
+        gate = gate.transpose(positions + [size + position for position in positions])
+        self.__apply_sites__(start, gate.reshape(2**size, 2**size))
+        return
+
+    def __factors__(self, table, kind: str):
+        """Splits a diagonal or permutation table into one 2x2 gate per qubit.
+        Args:
+            table (np.array): Diagonal entries or permutation of the gate.
+            kind (str): "diagonal" or "permutation".
+        Returns:
+            List[np.array]: Gate on every qubit, None when the table does not split.
+        """
+        size = int(np.log2(len(table)))
+        units = [1 << (size - 1 - position) for position in range(size)]
+        if kind == "permutation":
+            flips = table[0]
+            if not np.array_equal(table, np.arange(len(table)) ^ flips):
+                return None
+            return [
+                np.identity(2)[::-1] if flips & unit else np.identity(2)
+                for unit in units
+            ]
+        if table[0] == 0:
+            return None
+        factors = [np.array([1, table[unit] / table[0]]) for unit in units]
+        product = np.ones(1)
+        for factor in factors:
+            product = np.kron(product, factor)
+        if not np.allclose(product * table[0], table):
+            return None
+        factors[0] = factors[0] * table[0]
+        return [np.diag(factor) for factor in factors]
+
+    def amplitude(self, index: int) -> complex:
+        """Amplitude of a single basis state, in O(n) matrix products.
+        Args:
+            index (int): Basis state, with the bit of every qubit as in the state.
+        Returns:
+            complex: Amplitude of the basis state.
+        """
+        vector = np.ones(1, "D")
+        for site, bit in enumerate(self.order):
+            vector = np.dot(vector, self.tensors[site][:, (index >> bit) & 1, :])
+        return complex(vector[0])
+
+    def sample(self, shots: int = 1):
+        """Draws measurements of every qubit without collapsing the state.
+
+        The center is moved to the first site and every site is then drawn from
+        its probability given the sites before it, for all shots at once.
+
+        Args:
+            shots (int): Number of measurements to draw.
+        Returns:
+            List[str]: Bits of every measured basis state, the highest bit first as
+                       measure returns them.
+        """
+        self.__center__(0)
+        vectors = np.ones((shots, 1), "D")
+        outcomes = np.zeros((shots, self.qubits), np.uint8)
+        for site, bit in enumerate(self.order):
+            branches = np.einsum("sa,aib->sib", vectors, self.tensors[site])
+            weights = np.sum(np.abs(branches) ** 2, axis=2)
+            ones = self.random.random(shots) * np.sum(weights, axis=1) < weights[:, 1]
+            outcomes[:, self.qubits - 1 - bit] = ones
+            vectors = branches[np.arange(shots), ones.astype(int)]
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        characters = (outcomes + ord("0")).astype(np.uint8)
+        return [row.tobytes().decode() for row in characters]
+
+    def marginal(self, qubits):
+        """Probabilities of the basis states of some of the qubits, summed over the rest.
+
+        The chain is contracted with its conjugate one site at a time, keeping the
+        bit of every kept site apart and summing over every other one, which costs
+        O(2^k n chi^3) for k kept qubits and bond dimension chi.
+
+        Args:
+            qubits (List[int]): Qubits to keep.
+        Returns:
+            np.array: Probability of each of the 2^k basis states of the kept qubits, with
+                      their bits in the same order as in the state.
+        """
+        bits = sorted(self.__bit__(qubit) for qubit in qubits)
+        environments = np.ones((1, 1, 1), "D")
+        for site, bit in enumerate(self.order):
+            tensor = self.tensors[site]
+            branches = np.einsum(
+                "xab,aic,bid->xicd", environments, tensor, tensor.conj()
+            )
+            if bit in bits:
+                environments = branches.reshape(-1, *branches.shape[2:])
+            else:
+                environments = np.sum(branches, axis=1)
+        kept = [bit for bit in self.order if bit in bits]
+        probabilities = np.maximum(np.real(environments), 0).reshape((2,) * len(bits))
+        axes = [kept.index(bits[len(bits) - 1 - axis]) for axis in range(len(bits))]
+        return probabilities.transpose(axes).reshape(-1)
+
+    def expectation(self, observable):
+        """Expectation value of Pauli strings, contracting the chain once per string.
+
+        Every string is put between the chain and its conjugate one site at a time,
+        which costs O(n chi^3) for bond dimension chi.
+
+        Args:
+            observable (PauliSum): Pauli strings with their coefficients.
+        Returns:
+            complex: Expectation value.
+        """
+        paulis = {
+            "I": np.identity(2),
+            "X": np.array([[0, 1], [1, 0]]),
+            "Y": np.array([[0, -1j], [1j, 0]]),
+            "Z": np.diag([1, -1]),
+        }
+        sites = {bit: site for site, bit in enumerate(self.order)}
+        value = 0
+        for string, coefficient in observable.terms.items():
+            letters = ["I"] * self.qubits
+            for qubit, letter in enumerate(string):
+                letters[sites[self.__bit__(qubit)]] = letter
+            environment = np.ones((1, 1), "D")
+            for site, tensor in enumerate(self.tensors):
+                environment = np.einsum(
+                    "ab,aic,ij,bjd->cd",
+                    environment,
+                    tensor.conj(),
+                    paulis[letters[site]],
+                    tensor,
+                    optimize=True,
+                )
+            value += coefficient * environment[0, 0]
+        return value
+
+    def __operator_matrix__(self, gate_queue):
+        for bit, gate in gate_queue:
+            self.__apply__([bit], gate)
+        return
+
+    def __multi_operator_matrix__(self, multi_gate_queue):
+        control_bit, target_bit, gate = multi_gate_queue
+        controlled = np.identity(4, "D")
+        controlled[2:, 2:] = gate
+        self.__apply__([control_bit, target_bit], controlled)
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_bits, target_bits, gate = mcu_queue
+        controlled = np.identity(2 ** (len(control_bits) + len(target_bits)), "D")
+        controlled[-len(gate) :, -len(gate) :] = gate
+        self.__apply__(control_bits + target_bits, controlled)
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        factors = self.__factors__(np.asarray(diagonal, "D"), "diagonal")
+        if factors is None:
+            self.__apply__(bits, np.diag(diagonal))
+            return
+        for bit, factor in zip(bits, factors):
+            self.__apply__([bit], factor)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        factors = self.__factors__(np.asarray(permutation), "permutation")
+        if factors is None:
+            matrix = np.zeros((len(permutation), len(permutation)), "D")
+            matrix[permutation, np.arange(len(permutation))] = 1
+            self.__apply__(bits, matrix)
+            return
+        for bit, factor in zip(bits, factors):
+            if factor[0, 0] == 0:
+                self.__apply__([bit], factor)
+        return
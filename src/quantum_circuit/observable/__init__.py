@@ -0,0 +1 @@
+from .pauli_sum import PauliSum
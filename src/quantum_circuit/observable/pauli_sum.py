@@ -0,0 +1,247 @@
+import numpy as np
+from ...errors import InvalidPauliStringError
+
+
+class PauliSum:
+    """Observable made of Pauli strings with coefficients, such as 0.5 "XZIY".
+
+    The k-th letter of a string acts on qubit k. A string never becomes a matrix:
+    it flips the bits of its X and Y letters, and gives a sign from the parity of
+    the bits of its Z and Y letters. Strings flipping the same bits are grouped, so
+    a group costs one pass over the state with one weight vector made of all its
+    strings.
+
+    ```
+    from qcpy import paulisum, quantumcircuit
+    qc = quantumcircuit(qubits = 2)
+    qc.h(0)
+    qc.expectation(paulisum({"XI": 0.5, "ZZ": -1.0}))
+    ```
+
+    Args:
+        terms (dict/str/List[(str, complex)]): Coefficient of every Pauli string, a
+                                               single string, or pairs of strings and
+                                               coefficients, summed when repeated.
+
+    Attributes:
+        terms (dict): Coefficient of every Pauli string.
+        qubits (int): Number of qubits the strings act on.
+        tables (dict): Indices and parities of tables of 2^k entries, for every k,
+                       shared by every observable.
+        few (int): Most strings of a group whose weights are summed one by one.
+    """
+
+    tables = {}
+    few = 8
+
+    def __init__(self, terms):
+        if isinstance(terms, str):
+            terms = [(terms, 1)]
+        elif isinstance(terms, dict):
+            terms = terms.items()
+        self.terms = {}
+        for string, coefficient in terms:
+            string = string.upper()
+            if set(string) - set("IXYZ") or not string:
+                raise InvalidPauliStringError(f"{string} is not a Pauli string")
+            self.terms[string] = self.terms.get(string, 0) + coefficient
+        lengths = {len(string) for string in self.terms}
+        if len(lengths) != 1:
+            raise InvalidPauliStringError("Pauli strings need to be of the same length")
+        self.qubits = lengths.pop()
+
+    def __add__(self, other):
+        if not isinstance(other, PauliSum):
+            other = PauliSum(other)
+        return PauliSum(list(self.terms.items()) + list(other.terms.items()))
+
+    def __mul__(self, scalar):
+        return PauliSum(
+            [
+                (string, scalar * coefficient)
+                for string, coefficient in self.terms.items()
+            ]
+        )
+
+    __rmul__ = __mul__
+
+    def __repr__(self) -> str:
+        return " + ".join(
+            f"{coefficient}*{string}" for string, coefficient in self.terms.items()
+        )
+
+    def __groups__(self, big_endian: bool):
+        """Bit masks of every Pauli string, grouped by the bits they flip.
+        Args:
+            big_endian (bool): Flag for the endianess of the state.
+        Returns:
+            dict: Bits flipped, to the bits giving a sign and the coefficient of every
+                  string flipping them, with the phase of its Y letters.
+        """
+        groups = {}
+        for string, coefficient in self.terms.items():
+            flip = sign = 0
+            for qubit, letter in enumerate(string):
+                bit = 1 << (self.qubits - 1 - qubit if big_endian else qubit)
+                if letter in "XY":
+                    flip |= bit
+                if letter in "YZ":
+                    sign |= bit
+            phase = 1j ** string.count("Y")
+            groups.setdefault(flip, []).append((sign, coefficient * phase))
+        return groups
+
+    def __table__(self, size: int):
+        """Every index of a table of 2^size entries and the sign from the parity of its bits.
+        Made once per size and shared by every observable.
+        Args:
+            size (int): Number of bits of the table.
+        Returns:
+            (np.array, np.array): Every index, and 1 or -1 for the parity of its bits.
+        """
+        if size not in PauliSum.tables:
+            parity = np.ones(1, np.float32)
+            for _ in range(size):
+                parity = np.concatenate([parity, -parity])
+            indices = np.arange(2**size, dtype=np.int32 if size < 31 else np.int64)
+            PauliSum.tables[size] = (indices, parity)
+        return PauliSum.tables[size]
+
+    def __axes__(self, mask: int):
+        """Axes of a state reshaped to one axis per qubit that hold the bits of a mask."""
+        return [self.qubits - 1 - bit for bit in range(self.qubits) if mask >> bit & 1]
+
+    def __weights__(self, terms, buffers):
+        """Weight of every basis state for a group of strings flipping the same bits.
+
+        The weights only depend on the bits the signs of the group use, so they are
+        made as a table over those bits and broadcast over the others. Beyond a few
+        strings, the table is the Walsh-Hadamard transform of the coefficients,
+        instead of one pass over it per string.
+
+        Args:
+            terms (List[(int, complex)]): Bits giving a sign, and coefficient of every
+                                          string of the group.
+            buffers (tuple): Weights, masked indices and signs of 2^n entries, reused by
+                             every group, the weights of the precision of the state.
+        Returns:
+            np.array: Sum of the coefficient and sign of every string, with one axis
+                      per qubit, of length 2 for the bits used and 1 for the others.
+        """
+        used = 0
+        for sign, _ in terms:
+            used |= sign
+        bits = [bit for bit in reversed(range(self.qubits)) if used >> bit & 1]
+        indices, parity = self.__table__(len(bits))
+        signs = [
+            sum(
+                (sign >> bit & 1) << (len(bits) - 1 - position)
+                for position, bit in enumerate(bits)
+            )
+            for sign, _ in terms
+        ]
+        weights, masked, picked = (buffer[: indices.size] for buffer in buffers)
+        weights[...] = 0
+        if len(terms) <= self.few:
+            scalar = weights.real.dtype.type
+            for sign, (_, coefficient) in zip(signs, terms):
+                np.bitwise_and(indices, sign, out=masked)
+                np.take(parity, masked, out=picked)
+                weights.real += scalar(coefficient.real) * picked
+                if coefficient.imag:
+                    weights.imag += scalar(coefficient.imag) * picked
+        else:
+            for sign, (_, coefficient) in zip(signs, terms):
+                weights[sign] += coefficient
+            for bit in range(len(bits)):
+                pairs = weights.reshape(-1, 2, 2**bit)
+                pairs[:, 0] += pairs[:, 1]
+                pairs[:, 1] *= -2
+                pairs[:, 1] += pairs[:, 0]
+        shape = [1] * self.qubits
+        for axis in self.__axes__(used):
+            shape[axis] = 2
+        return weights.reshape(shape)
+
+    def __passes__(self, big_endian: bool, dtype=complex):
+        """Goes over the groups of strings flipping the same bits.
+        The weights of a group are only valid until the next group.
+        Args:
+            big_endian (bool): Flag for the endianess of the state.
+            dtype (np.dtype): Complex type of the weights.
+        Returns:
+            Iterator[(int, np.array)]: Bits flipped, and the weights of the group.
+        """
+        indices, parity = self.__table__(self.qubits)
+        buffers = (
+            np.empty(indices.size, dtype),
+            np.empty_like(indices),
+            np.empty_like(parity),
+        )
+        for flip, terms in self.__groups__(big_endian).items():
+            yield flip, self.__weights__(terms, buffers)
+
+    def __real__(self, value):
+        """Drops the imaginary part of a value when every coefficient is real."""
+        if all(np.isreal(coefficient) for coefficient in self.terms.values()):
+            return np.real(value)
+        return value
+
+    def expectation(self, state, big_endian: bool = False, density: bool = False):
+        """Expectation value of the observable.
+        Args:
+            state (np.array): State vector, (B, 2^n) state vectors of a batch, or
+                              density matrix.
+            big_endian (bool): Flag for the endianess of the state.
+            density (bool): Flag for the state being a 2^n x 2^n density matrix.
+        Returns:
+            float/np.array: Expectation value, for every member of a batch.
+        """
+        state = np.asarray(state)
+        if state.shape[-1] == 1:
+            state = state.reshape(-1)
+        if density:
+            state = state.reshape(2**self.qubits, 2**self.qubits)
+        elif state.shape[-1] != 2**self.qubits:
+            raise InvalidPauliStringError(
+                f"Pauli strings of {self.qubits} qubits do not match the state"
+            )
+        value = 0
+        if density:
+            indices, _ = self.__table__(self.qubits)
+            for flip, weights in self.__passes__(big_endian):
+                diagonal = state[indices, indices ^ flip]
+                value += np.sum(diagonal.reshape((2,) * self.qubits) * weights)
+            return self.__real__(value)
+        leading = state.ndim - 1
+        tensor = state.reshape(state.shape[:-1] + (2,) * self.qubits)
+        conjugate = tensor.conj()
+        product = np.empty(tensor.shape, np.result_type(state, np.complex64))
+        for flip, weights in self.__passes__(big_endian, product.dtype):
+            flipped = np.flip(
+                conjugate, [leading + axis for axis in self.__axes__(flip)]
+            )
+            np.multiply(flipped, tensor, out=product)
+            product *= weights
+            value += product.reshape(state.shape).sum(axis=-1)
+        return self.__real__(value)
+
+    def apply(self, state, big_endian: bool = False):
+        """The observable times a state vector.
+        Args:
+            state (np.array): State vector, or (B, 2^n) state vectors of a batch.
+            big_endian (bool): Flag for the endianess of the state.
+        Returns:
+            np.array: The observable times the state, of the same shape.
+        """
+        state = np.asarray(state)
+        result = np.zeros(state.shape, np.result_type(state, complex))
+        shape = (-1,) + (2,) * self.qubits
+        tensor = state.reshape(shape)
+        weighted = np.empty(tensor.shape, result.dtype)
+        for flip, weights in self.__passes__(big_endian, result.dtype):
+            np.multiply(tensor, weights, out=weighted)
+            result.reshape(shape)[...] += np.flip(
+                weighted, [1 + axis for axis in self.__axes__(flip)]
+            )
+        return result
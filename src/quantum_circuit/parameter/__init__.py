@@ -0,0 +1,2 @@
+from .parameter import Parameter, ParameterGate
+from .compiled_circuit import CompiledCircuit
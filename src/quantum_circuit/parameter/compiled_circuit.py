@@ -0,0 +1,184 @@
+import numpy as np
+from ...errors import InvalidEngineError, UnboundParameterError
+from ..observable import PauliSum
+from .parameter import Parameter, ParameterGate
+
+
+class CompiledCircuit:
+    """Recorded gates of a circuit frozen into a plan of calls to its calculator.
+
+    The plan is made once, with runs of constant gates already fused and every
+    parameterized gate kept as it is. Binding values only builds the matrices of
+    the parameterized gates, and running replays the plan on a new calculator,
+    without the drawing, the log or the gate dispatch of the circuit. The gradient
+    of an expectation over every parameter takes one more backward sweep over the
+    plan, by the adjoint method.
+
+    Args:
+        build (Callable[[], CalculatorInterface]): Creates the calculator to run on.
+        plan (list): Calls to the calculator as the name of the method and its
+                     arguments.
+
+    Attributes:
+        build (Callable[[], CalculatorInterface]): From the given build.
+        plan (list): From the given plan.
+        slots (List[(int, int)]): Step of the plan and position of the argument of
+                                  every parameterized gate.
+        parameters (List[Parameter]): Parameters of the plan, in the order they are
+                                      first used.
+        bound (list): Plan with the matrix of every parameterized gate built, None
+                      until values are bound.
+        values (dict): Values bound to the parameters, None until values are bound.
+        calculator (CalculatorInterface): Calculator of the last run, None before.
+    """
+
+    def __init__(self, build, plan):
+        self.build = build
+        self.plan = plan
+        self.slots = []
+        self.parameters = []
+        for step, (_, args) in enumerate(plan):
+            for position, arg in enumerate(args):
+                if isinstance(arg, ParameterGate):
+                    self.slots.append((step, position))
+                    self.parameters += [
+                        parameter
+                        for parameter in arg.parameters
+                        if parameter not in self.parameters
+                    ]
+        self.bound = None if self.slots else plan
+        self.values = None if self.slots else {}
+        self.calculator = None
+
+    def bind(self, values):
+        """Builds the matrix of every parameterized gate from values of the parameters.
+        Args:
+            values (dict/List[float]): Value of every parameter, keyed by the parameter or
+                                       its name, or given in the order of parameters.
+                                       Arrays of values sweep them on the batch engine.
+        Returns:
+            CompiledCircuit: The compiled circuit, ready to run.
+        """
+        if not isinstance(values, dict):
+            values = dict(zip(self.parameters, values))
+        bound = list(self.plan)
+        for step, position in self.slots:
+            method, args = bound[step]
+            args = list(args)
+            args[position] = args[position].bind(values)
+            bound[step] = (method, tuple(args))
+        self.bound = bound
+        self.values = values
+        return self
+
+    def run(self):
+        """Runs the plan with the bound values on a new calculator.
+        Returns:
+            np.array: State of the calculator once every gate ran.
+        """
+        if self.bound is None:
+            raise UnboundParameterError("Values need to be bound before running")
+        self.calculator = self.build()
+        for method, args in self.bound:
+            getattr(self.calculator, method)(*args)
+        return self.calculator.state
+
+    def __adjoint__(self, method: str, args):
+        """Call to the calculator that undoes a step of the plan.
+        Args:
+            method (str): Name of the calculator method of the step.
+            args (tuple): Arguments of the step, with every gate built.
+        Returns:
+            tuple: Arguments of the same method applying the adjoint of the step.
+        """
+        dagger = lambda gate: np.swapaxes(np.asarray(gate), -1, -2).conj()
+        if method == "pass_custom_gate_queue":
+            return ([dagger(gate) for gate in args[0]],)
+        if method == "pass_diagonal_gate":
+            return (args[0], np.conj(args[1]))
+        if method == "pass_permutation_gate":
+            return (args[0], np.argsort(args[1]))
+        return args[:-1] + (dagger(args[-1]),)
+
+    def __controlled__(self, method: str, args) -> bool:
+        """Whether a step of the plan only applies its gate when controls are set.
+        The derivative of such a step is zero on the states its controls leave
+        alone, which the calculator keeps as they are instead.
+        Args:
+            method (str): Name of the calculator method of the step.
+            args (tuple): Arguments of the step.
+        Returns:
+            bool: Whether the step has controls.
+        """
+        if method == "pass_multi_gate":
+            return True
+        return method == "pass_mcu_gate" and len(args[0]) > 0
+
+    def __observe__(self, observable, state, big_endian: bool):
+        """Applies an observable to a state vector.
+        Args:
+            observable (PauliSum/np.array): Pauli strings with their coefficients,
+                                            diagonal of the observable as 2^n entries,
+                                            or its 2^n x 2^n matrix.
+            state (np.array): State vector.
+            big_endian (bool): Flag for the endianess of the state.
+        Returns:
+            np.array: The observable times the state.
+        """
+        state = np.asarray(state).reshape(-1)
+        if isinstance(observable, PauliSum):
+            return observable.apply(state, big_endian)
+        observable = np.asarray(observable)
+        if observable.ndim == 1:
+            return observable * state
+        return np.dot(observable, state)
+
+    def gradient(self, observable):
+        """Expectation of an observable and its derivative by every parameter.
+
+        The bound plan runs forward once. It is then undone step by step on the
+        state, while a second state carrying the observable is moved back with it,
+        and the derivative of every parameterized gate is taken between the two, so
+        the cost is about two runs of the plan with three state vectors no matter
+        how many parameters there are.
+
+        Args:
+            observable (PauliSum/np.array): Pauli strings with their coefficients,
+                                            diagonal of the observable as 2^n entries,
+                                            or its 2^n x 2^n matrix.
+        Returns:
+            (float, dict): Expectation, and its derivative by every parameter.
+        """
+        state = self.run()
+        forward = self.calculator
+        if np.size(state) != 2**forward.qubits:
+            raise InvalidEngineError("Adjoint gradients need a single state vector")
+        backward = self.build()
+        backward.state = self.__observe__(observable, state, forward.big_endian)
+        derivative = self.build()
+        expectation = float(np.vdot(np.reshape(state, -1), backward.state).real)
+        gradient = {parameter: 0.0 for parameter in self.parameters}
+        positions = dict(self.slots)
+        for step in reversed(range(len(self.bound))):
+            method, args = self.bound[step]
+            adjoint = self.__adjoint__(method, args)
+            getattr(forward, method)(*adjoint)
+            if step in positions:
+                position = positions[step]
+                gate = self.plan[step][1][position]
+                for index, arg in enumerate(gate.args):
+                    if not isinstance(arg, Parameter):
+                        continue
+                    derived = list(args)
+                    derived[position] = gate.derivative(self.values, index)
+                    derivative.state = forward.state.copy()
+                    getattr(derivative, method)(*derived)
+                    overlap = np.vdot(backward.state, derivative.state)
+                    if self.__controlled__(method, args):
+                        derived[position] = np.zeros_like(derived[position])
+                        derivative.state = forward.state.copy()
+                        getattr(derivative, method)(*derived)
+                        overlap -= np.vdot(backward.state, derivative.state)
+                    gradient[arg] += 2 * float(overlap.real)
+            getattr(backward, method)(*adjoint)
+        return expectation, gradient
@@ -0,0 +1,102 @@
+import numpy as np
+from ...errors import UnboundParameterError
+
+
+class Parameter:
+    """Placeholder for an angle of a gate, given a value once the circuit is bound.
+
+    ```
+    from qcpy import parameter, quantumcircuit
+    theta = parameter("theta")
+    qc = quantumcircuit(qubits = 2, lazy = True)
+    qc.rx(0, theta)
+    qc.compile().bind({theta: 0.3}).run()
+    ```
+
+    Args:
+        name (str): Name of the parameter, which values can also be bound by.
+
+    Attributes:
+        name (str): From the given name.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Parameter({self.name})"
+
+
+class ParameterGate:
+    """Gate whose matrix depends on parameters, built once they are bound.
+
+    Every entry of a gate is a trigonometric polynomial of each of its angles, with
+    frequencies that are multiples of 1/2 up to max_frequency. The derivative of a
+    gate is then exact from samples of the gate at equally spaced shifts over its
+    4π period, weighted as the derivative of the trigonometric interpolant.
+
+    Args:
+        function (Callable[..., np.array]): Builds the matrix of the gate from its
+                                            arguments.
+        args (tuple): Arguments of the function, some of them parameters.
+
+    Attributes:
+        function (Callable[..., np.array]): From the given function.
+        args (tuple): From the given arguments.
+        parameters (List[Parameter]): Parameters among the arguments.
+    """
+
+    max_frequency = 4
+
+    def __init__(self, function, args):
+        self.function = function
+        self.args = tuple(args)
+        self.parameters = [arg for arg in self.args if isinstance(arg, Parameter)]
+
+    def bind(self, values: dict):
+        """Matrix of the gate for given values of its parameters.
+        Args:
+            values (dict): Value of every parameter, keyed by the parameter or its name.
+        Returns:
+            np.array: Matrix of the gate.
+        """
+        return self.function(*self.__values__(values))
+
+    def derivative(self, values: dict, position: int):
+        """Derivative of the matrix of the gate by one of its arguments.
+        Args:
+            values (dict): Value of every parameter, keyed by the parameter or its name.
+            position (int): Position of the argument among the arguments of the gate.
+        Returns:
+            np.array: Derivative of every entry of the matrix of the gate.
+        """
+        args = self.__values__(values)
+        samples = 4 * self.max_frequency + 1
+        derivative = 0
+        for shift in range(1, samples):
+            shifted = list(args)
+            shifted[position] = args[position] + 4 * np.pi * shift / samples
+            weight = (-1) ** (shift + 1) / (4 * np.sin(np.pi * shift / samples))
+            derivative = derivative + weight * np.asarray(
+                self.function(*shifted), complex
+            )
+        return derivative
+
+    def __values__(self, values: dict):
+        """Arguments of the gate with the value of every parameter.
+        Args:
+            values (dict): Value of every parameter, keyed by the parameter or its name.
+        Returns:
+            list: Arguments to build the matrix of the gate from.
+        """
+        args = []
+        for arg in self.args:
+            if not isinstance(arg, Parameter):
+                args.append(arg)
+            elif arg in values:
+                args.append(values[arg])
+            elif arg.name in values:
+                args.append(values[arg.name])
+            else:
+                raise UnboundParameterError(f"No value is bound to {arg.name}")
+        return args
@@ -17,6 +17,7 @@ from ..quantum_gate import (
     s,
     sdg,
     sx,
+    swap,
     sxdg,
     t,
     tdg,
@@ -24,11 +25,44 @@ from ..quantum_gate import (
 )
 
 from ..circuit_drawing import CircuitDrawing
-from ..errors import InvalidQubitPrepError, OutOfRangeError
+from ..errors import (
+    InvalidEngineError,
+    InvalidPauliStringError,
+    InvalidQubitPrepError,
+    NotLazyCircuitError,
+    NotUnitaryMultiGateError,
+    OutOfRangeError,
+)
+from .amplitude_dict import AmplitudeDictCalculator
 from .base import BaseCalculator
+from .batch import BatchCalculator
+from .deferred import DeferredExecution
+from .density_matrix import DensityMatrixCalculator
+from .distributed import DistributedCalculator
+from .fusion import GateFusion
 from .gpu import GpuCalculator
 from .gpu_sparse import GpuSparseCalculator
+from .interface import CalculatorInterface
+from .mps import MpsCalculator
+from .observable import PauliSum
+from .parameter import CompiledCircuit, Parameter, ParameterGate
 from .sparse import SparseCalculator
+from .stabilizer import CliffordRouting, StabilizerCalculator
+from .statevector import StateVectorCalculator
+from .trajectory import TrajectoryCalculator
+from .unitary import UnitaryCalculator
+
+ENGINES = {
+    "statevector": StateVectorCalculator,
+    "distributed": DistributedCalculator,
+    "amplitude_dict": AmplitudeDictCalculator,
+    "stabilizer": StabilizerCalculator,
+    "mps": MpsCalculator,
+    "density_matrix": DensityMatrixCalculator,
+    "trajectory": TrajectoryCalculator,
+    "unitary": UnitaryCalculator,
+    "batch": BatchCalculator,
+}
 
 
 class QuantumCircuit:
@@ -43,13 +77,70 @@ class QuantumCircuit:
                     a specific gate.
         sparse (bool): Flag to set if the quantum circuit should have it's matrices in sparse.
         gpu (bool): Flag to set if the quantum circuit should run in a GPU process.
+        engine (str): Name of a calculator to run the quantum circuit on instead of the one
+                      picked by the sparse and gpu flags. "statevector" applies every gate
+                      in place on the state vector without building 2^n x 2^n operators,
+                      "distributed" splits that state vector between worker processes and
+                      "amplitude_dict" only keeps the nonzero amplitudes. "stabilizer" runs
+                      Clifford gates on a stabilizer tableau. "mps" keeps a matrix product
+                      state of one tensor per qubit. "density_matrix" keeps the density
+                      matrix of a mixed state and "trajectory" samples it with a batch of
+                      state vectors. "unitary" builds the unitary of the whole circuit and
+                      "batch" runs it on a batch of input states at once.
+        fuse (bool/int): Flag to merge consecutive single qubit gates on the same qubit into
+                         one gate before they reach the calculator. 2 also collapses every run
+                         of gates confined to two qubits into one 4x4 gate.
+        lazy (bool): Flag to only record gates and run them once the state is read.
+        threads (int): Number of threads the statevector engine splits every gate between,
+                       above 1 the statevector engine is used when no engine is given.
+        processes (int): Number of worker processes the distributed engine splits the state
+                         between, above 1 the distributed engine is used when no engine is
+                         given.
+        epsilon (float): Largest magnitude of an amplitude the amplitude_dict engine drops,
+                         1e-12 when None.
+        clifford (bool): Flag to run gates on a stabilizer tableau for as long as every gate
+                         is Clifford, and on the calculator picked by the other flags after.
+        max_bond (int): Largest bond dimension the mps engine keeps, no limit when None.
+        cutoff (float): Smallest singular value the mps engine keeps, relative to the largest
+                        one of the bond, 1e-12 when None.
+        noise (NoiseModel): Channels to apply after every gate and when reading out the
+                            qubits, the density_matrix engine is used when no engine is
+                            given. Not used with fuse or clifford.
+        trajectories (int): Number of state vectors the trajectory engine samples the noise
+                            with, the trajectory engine is used when no engine is given.
+        batch (int): Number of input states the batch engine runs the circuit on, the
+                     batch engine is used when no engine is given.
+        seed (int): Seed of the random draws of measurements inside of the circuit, of
+                    the noise of the trajectory engine and of the shots of measure.
 
     Attributes:
-        calculator (GpuSparseCalculator/SparseCalculator/GpuCalculator/BaseCalculator): Sets itself
-                    as a class depending on what architecure and improvement algorithms the user
-                    provided.
+        calculator (GpuSparseCalculator/SparseCalculator/GpuCalculator/BaseCalculator/
+                    StateVectorCalculator): Sets itself as a class depending on what
+                    architecure and improvement algorithms the user provided.
+        big_endian (bool): From the given flag for the endianess of the state.
+        prep (chr): From the given direction the qubits are prepped in.
         sparse (bool): From the given flag if the state should use sparse matrices.
         gpu (bool): From the given flag if the calculations should be ran on a GPU arch.
+        engine (str): From the given engine name, None when picked by the flags.
+        fuse (bool/int): From the given flag the largest block of qubits gates are fused on.
+        lazy (bool): From the given flag if gates are recorded until the state is read.
+        threads (int): From the given number of threads gates are split between.
+        processes (int): From the given number of processes the state is split between.
+        epsilon (float): From the given magnitude amplitudes are dropped at.
+        clifford (bool): From the given flag if Clifford gates run on a stabilizer tableau.
+        max_bond (int): From the given largest bond dimension.
+        cutoff (float): From the given smallest relative singular value.
+        noise (NoiseModel): From the given channels applied after every gate.
+        trajectories (int): From the given number of sampled state vectors.
+        batch (int): From the given number of input states.
+        random (np.random.Generator): Draws the outcome of every measurement, the noise
+                                      of every trajectory and every shot, from the
+                                      given seed.
+        classical (dict): Classical register, the outcome of every measurement by the
+                          classical bit it was stored in.
+        build (Callable[[bool], CalculatorInterface]): Creates the calculator the gates
+                                                      run on, wrapped for fusion unless
+                                                      given False.
     """
 
     def __init__(
@@ -59,28 +150,158 @@ class QuantumCircuit:
         prep: chr = "z",
         sparse: bool = False,
         gpu: bool = False,
+        engine: str = None,
+        fuse: int = False,
+        lazy: bool = False,
+        threads: int = 1,
+        processes: int = 1,
+        epsilon: float = None,
+        clifford: bool = False,
+        max_bond: int = None,
+        cutoff: float = None,
+        noise=None,
+        trajectories: int = None,
+        batch: int = None,
+        seed: int = None,
     ):
         self.qlog = QLog(qubits)
         self.calculator = None
+        self.big_endian = big_endian
+        self.prep = prep
         self.sparse = sparse
         self.gpu = gpu
+        self.engine = engine
+        self.fuse = fuse
+        self.lazy = lazy
+        self.threads = threads
+        self.processes = processes
+        self.epsilon = epsilon
+        self.clifford = clifford
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self.noise = noise
+        self.trajectories = trajectories
+        self.batch = batch
+        self.random = np.random.default_rng(seed)
+        self.classical = {}
+        picked = f"Engine {engine}" if engine is not None else "The default calculator"
+        if self.threads > 1 and self.engine is None:
+            self.engine = "statevector"
+            picked = "Engine statevector picked by threads"
+        if self.processes > 1 and self.engine is None:
+            self.engine = "distributed"
+            picked = "Engine distributed picked by processes"
+        if self.trajectories is not None and self.engine is None:
+            self.engine = "trajectory"
+            picked = "Engine trajectory picked by trajectories"
+        if self.noise is not None and self.engine is None:
+            self.engine = "density_matrix"
+            picked = "Engine density_matrix picked by noise"
+        if self.batch is not None and self.engine is None:
+            self.engine = "batch"
+            picked = "Engine batch picked by batch"
         if prep != "z" and prep != "y" and prep != "x":
             raise InvalidQubitPrepError("Qubit prep is not x,y,or z")
+        if self.engine is not None and self.engine not in ENGINES:
+            raise InvalidEngineError(f"Engine {engine} is not one of {list(ENGINES)}")
+        if self.threads > 1 and self.engine != "statevector":
+            raise InvalidEngineError(f"{picked} does not run on multiple threads")
+        if self.processes > 1 and self.engine != "distributed":
+            raise InvalidEngineError(f"{picked} does not run on multiple processes")
+        if self.epsilon is not None and self.engine != "amplitude_dict":
+            raise InvalidEngineError(f"{picked} does not drop amplitudes")
+        if (
+            self.max_bond is not None or self.cutoff is not None
+        ) and self.engine != "mps":
+            raise InvalidEngineError(f"{picked} does not truncate bonds")
+        if self.noise is not None and self.engine not in [
+            "density_matrix",
+            "trajectory",
+        ]:
+            raise InvalidEngineError(f"{picked} does not apply noise")
+        if self.noise is not None and self.fuse:
+            raise InvalidEngineError(
+                "Noise is applied after every gate, not fused gates"
+            )
+        if self.noise is not None and self.clifford:
+            raise InvalidEngineError("Noise is not applied on a stabilizer tableau")
+        if self.trajectories is not None and self.engine != "trajectory":
+            raise InvalidEngineError(f"{picked} does not sample trajectories")
+        if self.batch is not None and self.engine != "batch":
+            raise InvalidEngineError(f"{picked} does not run batches of states")
+        if self.engine is not None:
+            self.sparse = False
+            self.gpu = False
         if self.gpu:
             try:
                 subprocess.check_output(["nvcc", "--version"]).decode()
             except FileNotFoundError:
                 self.gpu = False
-        if self.sparse and self.gpu:
-            self.calculator = GpuSparseCalculator(qubits, big_endian, prep)
+        if self.engine is not None:
+            calculator = ENGINES[self.engine]
+        elif self.sparse and self.gpu:
+            calculator = GpuSparseCalculator
         elif self.sparse:
-            self.calculator = SparseCalculator(qubits, big_endian, prep)
+            calculator = SparseCalculator
         elif self.gpu:
-            self.calculator = GpuCalculator(qubits, big_endian, prep)
+            calculator = GpuCalculator
+        else:
+            calculator = BaseCalculator
+        build = lambda fuse=True: self.__build_calculator__(
+            calculator, qubits, big_endian, prep, fuse
+        )
+        self.build = build
+        if self.clifford:
+            build_fallback = build
+            max_qubits = (
+                None
+                if calculator in [AmplitudeDictCalculator, MpsCalculator]
+                else StabilizerCalculator.dense_qubits
+            )
+            build = lambda: CliffordRouting(
+                build_fallback, qubits, big_endian, prep, max_qubits, self.random
+            )
+        if self.lazy:
+            self.calculator = DeferredExecution(build, qubits)
         else:
-            self.calculator = BaseCalculator(qubits, big_endian, prep)
+            self.calculator = build()
         self.circuit_drawing = CircuitDrawing(qubits)
 
+    def __build_calculator__(
+        self, calculator, qubits: int, big_endian: bool, prep: chr, fuse: bool = True
+    ) -> CalculatorInterface:
+        """Creates the calculator the gates run on, wrapped for fusion when asked to.
+        Args:
+            calculator (type): Class of the calculator to create.
+            qubits (int): Number of qubits.
+            big_endian (bool): Flag to set if the state is big endian.
+            prep (chr): Initial direction of the qubits.
+            fuse (bool): Flag to wrap the calculator for fusion when the circuit fuses.
+        Returns:
+            CalculatorInterface: Calculator for the quantum circuit.
+        """
+        if self.threads > 1:
+            built = calculator(qubits, big_endian, prep, self.threads)
+        elif self.processes > 1:
+            built = calculator(qubits, big_endian, prep, self.processes)
+        elif self.epsilon is not None:
+            built = calculator(qubits, big_endian, prep, self.epsilon)
+        elif self.max_bond is not None or self.cutoff is not None:
+            built = calculator(qubits, big_endian, prep, self.max_bond, self.cutoff)
+        elif self.trajectories is not None:
+            built = calculator(qubits, big_endian, prep, self.noise, self.trajectories)
+        elif self.noise is not None:
+            built = calculator(qubits, big_endian, prep, self.noise)
+        elif self.batch is not None:
+            built = calculator(qubits, big_endian, prep, self.batch)
+        else:
+            built = calculator(qubits, big_endian, prep)
+        if hasattr(built, "random"):
+            built.random = self.random
+        if self.fuse and fuse:
+            built = GateFusion(built, int(self.fuse))
+        return built
+
     def __eq__(self, circuit) -> bool:
         """Determines if the states of a given QC and this current one are equal to each other.
         Args:
@@ -128,12 +349,263 @@ class QuantumCircuit:
                 OutOfRangeError("qubit is out of range of size of quantum circuit")
             self.circuit_drawing.insert_single(gate, qubits_to_apply)
 
+    def __diagonal__(self, gate: np.array):
+        """Entries of a gate when it only multiplies phases.
+        Args:
+            gate (np.array): Square gate to check.
+        Returns:
+            np.array: Diagonal of the gate, None when the gate is not diagonal.
+        """
+        gate = np.asarray(gate)
+        diagonal = np.diagonal(gate)
+        if np.count_nonzero(gate) != np.count_nonzero(diagonal):
+            return None
+        return diagonal
+
+    def __permutation__(self, gate: np.array):
+        """Basis state each basis state is sent to when a gate only permutes them.
+        Args:
+            gate (np.array): Square gate to check.
+        Returns:
+            np.array: Permutation of the gate, None when the gate is not a permutation.
+        """
+        gate = np.asarray(gate)
+        rows, columns = np.nonzero(gate)
+        if (
+            rows.size != len(gate)
+            or np.unique(rows).size != rows.size
+            or np.unique(columns).size != columns.size
+            or np.any(gate[rows, columns] != 1)
+        ):
+            return None
+        permutation = np.empty(rows.size, int)
+        permutation[columns] = rows
+        return permutation
+
+    def __pass_table__(self, qubits, gate: np.array, controls: int = 0) -> bool:
+        """Passes a gate on as a phase multiply or an index remap when it is one.
+
+        Noisy circuits skip the tables, so that every gate reaches the calculator as
+        the type of gate its noise channels are attached to, and so do stacks of
+        gates swept over a batch, gates of parameters and repeated qubits.
+
+        Args:
+            qubits (List[int]): Controls followed by the qubits the gate acts on, the
+                                first one being the most significant qubit of the gate.
+            gate (np.array): 2^k x 2^k gate applied on every k qubits after the controls
+                             once all controls are set.
+            controls (int): How many of the qubits are controls.
+        Returns:
+            bool: If the gate was diagonal or a permutation and has been passed on.
+        """
+        if (
+            self.noise is not None
+            or isinstance(gate, ParameterGate)
+            or np.ndim(gate) > 2
+            or len(set(qubits)) != len(qubits)
+        ):
+            return False
+        diagonal = self.__diagonal__(gate)
+        permutation = None if diagonal is not None else self.__permutation__(gate)
+        if diagonal is None and permutation is None:
+            return False
+        table = np.ones(1, complex) if diagonal is not None else np.zeros(1, int)
+        for _ in range((len(qubits) - controls) // int(np.log2(len(gate)))):
+            if diagonal is not None:
+                table = np.kron(table, diagonal)
+            else:
+                table = (table[:, None] * len(gate) + permutation).reshape(-1)
+        offset = 2 ** len(qubits) - table.size
+        if diagonal is not None:
+            self.calculator.pass_diagonal_gate(
+                qubits, np.concatenate([np.ones(offset), table])
+            )
+        else:
+            self.calculator.pass_permutation_gate(
+                qubits, np.concatenate([np.arange(offset), offset + table])
+            )
+        return True
+
+    def __sweep__(self, gate: np.array) -> np.array:
+        """Checks that a gate given as a stack of gates, one per member of a batch,
+           runs on the batch engine.
+        Args:
+            gate (np.array): Gate, or stack of gates from an array of parameters.
+        Returns:
+            np.array: The given gate.
+        """
+        if np.ndim(gate) > 2 and self.engine != "batch":
+            raise InvalidEngineError(
+                f"Engine {self.engine} does not sweep arrays of parameters"
+            )
+        return gate
+
+    def __gate__(self, function, *args):
+        """Builds a gate from its angles, or defers it until parameters are bound.
+        Args:
+            function (Callable[..., np.array]): Builds the matrix of the gate.
+            args (float/np.array/Parameter): Angles of the gate.
+        Returns:
+            np.array/ParameterGate: Matrix of the gate, or the gate to build once its
+                                    parameters are bound.
+        """
+        if not any(isinstance(arg, Parameter) for arg in args):
+            return self.__sweep__(function(*args))
+        if not self.lazy:
+            raise NotLazyCircuitError("Parameters are only recorded with lazy=True")
+        return ParameterGate(function, args)
+
+    def __pass_single_gate__(self, qubits_to_apply, gate: np.array) -> None:
+        """Passes a single qubit gate on, through the fast paths when it allows it.
+
+        A table covers at most 8 of the qubits, so a gate on many qubits is passed on
+        as one table per 8 qubits instead of a table of 2^n entries. A qubit given
+        more than once gets the gate once.
+
+        Args:
+            qubits_to_apply (int/arr[int]): Qubits to apply the gate to.
+            gate (np.array): 2x2 gate to apply.
+        """
+        if isinstance(qubits_to_apply, int):
+            qubits = [qubits_to_apply]
+        else:
+            qubits = list(dict.fromkeys(qubits_to_apply))
+            if len(qubits) != len(qubits_to_apply):
+                qubits_to_apply = qubits
+        if not self.__pass_table__(qubits[:8], gate):
+            self.calculator.pass_single_gate(qubits_to_apply, gate)
+            return
+        for start in range(8, len(qubits), 8):
+            self.__pass_table__(qubits[start : start + 8], gate)
+
+    def __pass_multi_gate__(self, control: int, target: int, gate: np.array) -> None:
+        """Passes a controlled gate on, through the fast paths when it allows it.
+        Args:
+            control (int): Qubit to act as the control for the gate.
+            target (int): Qubit to act as the target for the gate.
+            gate (np.array): 2x2 gate applied when the control is set.
+        """
+        if not self.__pass_table__([control, target], gate, 1):
+            self.calculator.pass_multi_gate(control, target, gate)
+
+    def __pass_mcu_gate__(self, controls, targets, gate: np.array) -> None:
+        """Passes a multi-controlled unitary on, through the fast paths when it allows it.
+        Args:
+            controls (List[int]): Qubits that all need to be set for the gate to act.
+            targets (List[int]): Qubits the gate acts on.
+            gate (np.array): 2^k x 2^k gate where k is the number of targets.
+        """
+        qubits = list(controls) + list(targets)
+        if not self.__pass_table__(qubits, gate, len(controls)):
+            self.calculator.pass_mcu_gate(controls, targets, gate)
+
+    def __kron__(self, left: np.array, right: np.array) -> np.array:
+        """Kronecker product of two gates, or of every pair of two stacks of gates.
+        Args:
+            left (np.array): Gate or (..., r, c) stack of gates.
+            right (np.array): Gate or (..., r, c) stack of gates.
+        Returns:
+            np.array: Kronecker product of the gates, stacked like the given stacks.
+        """
+        product = left[..., :, None, :, None] * right[..., None, :, None, :]
+        return product.reshape(
+            product.shape[:-4]
+            + (left.shape[-2] * right.shape[-2], left.shape[-1] * right.shape[-1])
+        )
+
+    def __decomposition__(self, size: int, steps) -> np.array:
+        """Multiplies a decomposition on a few qubits into a single unitary.
+        Args:
+            size (int): Number of qubits the decomposition acts on.
+            steps (List[tuple]): (qubit, gate) for a single gate or (control, target, gate)
+                                 for a controlled gate, qubit 0 being the most significant.
+                                 A stack of gates gives a stack of unitaries.
+        Returns:
+            np.array: 2^size x 2^size unitary of the whole decomposition.
+        """
+        braket_zero = np.array([[1 + 0j, 0 + 0j], [0 + 0j, 0 + 0j]], "F")
+        braket_one = np.array([[0 + 0j, 0 + 0j], [0 + 0j, 1 + 0j]], "F")
+        unitary = np.identity(2**size, complex)
+        for step in steps:
+            zero_kron = [identity()] * size
+            one_kron = [identity()] * size
+            if len(step) == 2:
+                one_kron[step[0]] = step[1]
+                zero_kron = None
+            else:
+                zero_kron[step[0]] = braket_zero
+                one_kron[step[0]] = braket_one
+                one_kron[step[1]] = step[2]
+            operator = one_kron[0]
+            for gate in one_kron[1:]:
+                operator = self.__kron__(operator, gate)
+            if zero_kron is not None:
+                to_add = zero_kron[0]
+                for gate in zero_kron[1:]:
+                    to_add = self.__kron__(to_add, gate)
+                operator = operator + to_add
+            unitary = np.matmul(operator, unitary)
+        return unitary
+
+    def __rxx__(self, theta: float) -> np.array:
+        """Unitary of the RXX gate.
+        Args:
+            theta (float): theta value to rotate the gate on the X axis.
+        Returns:
+            np.array: 4x4 unitary of the gate.
+        """
+        return self.__decomposition__(
+            2,
+            [
+                (0, u(phi=theta, lmbda=0, theta=np.pi / 2)),
+                (1, hadamard()),
+                (0, 1, paulix()),
+                (1, u(-1 * theta, 0, 0)),
+                (0, 1, paulix()),
+                (0, u(np.pi / 2, -1 * np.pi, np.pi - theta)),
+                (1, hadamard()),
+            ],
+        )
+
+    def __rzz__(self, lmbda: float) -> np.array:
+        """Unitary of the RZZ gate.
+        Args:
+            lmbda (float): The lambda value to rotate the gate on the z axis.
+        Returns:
+            np.array: 4x4 unitary of the gate.
+        """
+        return self.__decomposition__(
+            2, [(0, 1, paulix()), (1, u(0, lmbda, 0)), (0, 1, paulix())]
+        )
+
+    def compile(self) -> CompiledCircuit:
+        """Freezes the recorded gates of a lazy circuit into a template that runs them
+           again for new values of its parameters.
+
+        When the circuit fuses gates, runs of constant gates are fused once here, so
+        binding values only builds the gates of the parameters.
+
+        Returns:
+            CompiledCircuit: Template of the recorded gates.
+        """
+        if not self.lazy or self.calculator.built is not None:
+            raise NotLazyCircuitError(
+                "Only lazy circuits whose gates have not run yet compile"
+            )
+        recorder = DeferredExecution(None, self.calculator.qubits)
+        target = GateFusion(recorder, int(self.fuse)) if self.fuse else recorder
+        for method, args in self.calculator.queue:
+            getattr(target, method)(*args)
+        if self.fuse:
+            target.flush()
+        return CompiledCircuit(lambda: self.build(False), recorder.queue)
+
     def set(self, circuit) -> None:
         """Sets the current state to a given one.
         Args:
             circuit (QuantumCircuit): The given state to set to the current one.
         """
-        self.calculator.state = circuit.calculator.state
+        self.calculator.state = circuit.calculator.state.copy()
 
     @property
     def state(self):
@@ -149,6 +621,63 @@ class QuantumCircuit:
             temp_state = np.array(self.calculator.state.toarray(), "F")
         return temp_state
 
+    def unitary(self, cache: bool = False):
+        """Unitary of every gate applied on the quantum circuit, with the unitary engine.
+
+        With cache, a lazy circuit whose gates have not run yet reuses the unitary of
+        the same recorded gates on a circuit of the same size, endianess, prep and
+        fusion when it was built before, and caches its own otherwise.
+
+        Args:
+            cache (bool): Flag to reuse the unitary of a circuit of the same gates.
+        Returns:
+            np.array: 2^n x 2^n unitary of the circuit.
+        """
+        if self.engine != "unitary":
+            raise InvalidEngineError(f"Engine {self.engine} does not build unitaries")
+        key = None
+        if cache and self.lazy and self.calculator.built is None:
+            key = (
+                f"{self.calculator.key}:{self.calculator.qubits}:{self.big_endian}:"
+                f"{self.prep}:{self.fuse}"
+            )
+            if key in UnitaryCalculator.cache:
+                self.calculator.state = UnitaryCalculator.cache[key]
+        backend = self.backend
+        if key is not None:
+            backend.store(key)
+        return backend.state.copy()
+
+    def expectation(self, observable):
+        """Expectation value of an observable on the state of the quantum circuit.
+
+        Every Pauli string is measured by flipping and signing the amplitudes, without
+        building its matrix. A batch gives one value per member, trajectories give
+        their average, and a density matrix gives the expectation of the mixed state.
+
+        Args:
+            observable (PauliSum/dict/str): Pauli strings with their coefficients.
+        Returns:
+            float/np.array: Expectation value, for every member of a batch.
+        """
+        if not isinstance(observable, PauliSum):
+            observable = PauliSum(observable)
+        backend = self.backend
+        if hasattr(backend, "expectation"):
+            if observable.qubits != backend.qubits:
+                raise InvalidPauliStringError(
+                    f"Pauli strings of {observable.qubits} qubits do not match the state"
+                )
+            return observable.__real__(backend.expectation(observable))
+        value = observable.expectation(
+            self.state,
+            self.backend.big_endian,
+            density=self.engine == "density_matrix",
+        )
+        if self.engine == "trajectory":
+            return np.mean(value)
+        return value
+
     @property
     def size(self) -> int:
         """How many qubits are in the quantum circuit.
@@ -157,6 +686,49 @@ class QuantumCircuit:
         """
         return self.calculator.qubits
 
+    @property
+    def fused(self) -> int:
+        """How many gates were fused away before reaching the calculator.
+        Returns:
+            int: Number of eliminated gates, 0 when the circuit does not fuse gates.
+        """
+        return getattr(self.calculator, "eliminated", 0) if self.fuse else 0
+
+    @property
+    def backend(self) -> CalculatorInterface:
+        """Calculator the circuit runs on, once every recorded or fused gate reached it.
+        Returns:
+            CalculatorInterface: Calculator underneath the lazy, Clifford and fusion layers.
+        """
+        calculator = self.calculator
+        if isinstance(calculator, DeferredExecution):
+            calculator.run()
+            calculator = calculator.calculator
+        if isinstance(calculator, CliffordRouting):
+            calculator = calculator.calculator
+        if isinstance(calculator, GateFusion):
+            calculator.flush()
+            calculator = calculator.calculator
+        return calculator
+
+    @property
+    def tableau(self):
+        """Stabilizer tableau the circuit runs on, with every gate applied to it.
+        Returns:
+            StabilizerCalculator: Tableau of the state, None when the circuit does not run
+                                  on one.
+        """
+        backend = self.backend
+        return backend if isinstance(backend, StabilizerCalculator) else None
+
+    @property
+    def queued(self) -> int:
+        """How many recorded gates are waiting to run on the calculator.
+        Returns:
+            int: Number of recorded gates, 0 when the circuit does not defer gates.
+        """
+        return len(self.calculator.queue) if self.lazy else 0
+
     def i(self, qubits_to_apply) -> None:
         """Use the identity gate on the quantum circuit.
         Args:
@@ -180,7 +752,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, paulix())
+        self.__pass_single_gate__(qubits_to_apply, paulix())
         self.__add_single_drawing__(qubits_to_apply, "X")
 
     def y(self, qubits_to_apply) -> None:
@@ -196,7 +768,7 @@ class QuantumCircuit:
         Args:
             qubit_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, pauliz())
+        self.__pass_single_gate__(qubits_to_apply, pauliz())
         self.__add_single_drawing__(qubits_to_apply, "Z")
 
     def p(self, qubits_to_apply, theta: float = np.pi / 2) -> None:
@@ -204,7 +776,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, phase(theta))
+        self.__pass_single_gate__(qubits_to_apply, self.__gate__(phase, theta))
         self.__add_single_drawing__(qubits_to_apply, "P")
 
     def s(self, qubits_to_apply) -> None:
@@ -212,7 +784,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, s())
+        self.__pass_single_gate__(qubits_to_apply, s())
         self.__add_single_drawing__(qubits_to_apply, "S")
 
     def sdg(self, qubits_to_apply) -> None:
@@ -220,7 +792,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, sdg())
+        self.__pass_single_gate__(qubits_to_apply, sdg())
         self.__add_single_drawing__(qubits_to_apply, "S†")
 
     def t(self, qubits_to_apply) -> None:
@@ -228,7 +800,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, t())
+        self.__pass_single_gate__(qubits_to_apply, t())
         self.__add_single_drawing__(qubits_to_apply, "T")
 
     def tdg(self, qubits_to_apply) -> None:
@@ -236,7 +808,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, tdg())
+        self.__pass_single_gate__(qubits_to_apply, tdg())
         self.__add_single_drawing__(qubits_to_apply, "T†")
 
     def rz(self, qubits_to_apply, theta: float = np.pi / 2) -> None:
@@ -244,7 +816,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, rz(theta))
+        self.__pass_single_gate__(qubits_to_apply, self.__gate__(rz, theta))
         self.__add_single_drawing__(qubits_to_apply, "RZ")
 
     def ry(self, qubits_to_apply, theta: float = np.pi / 2) -> None:
@@ -252,7 +824,7 @@ class QuantumCircuit:
         Args:
             qubits to apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, ry(theta))
+        self.calculator.pass_single_gate(qubits_to_apply, self.__gate__(ry, theta))
         self.__add_single_drawing__(qubits_to_apply, "RY")
 
     def rx(self, qubits_to_apply, theta: float = np.pi / 2) -> None:
@@ -260,7 +832,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, rx(theta))
+        self.calculator.pass_single_gate(qubits_to_apply, self.__gate__(rx, theta))
         self.__add_single_drawing__(qubits_to_apply, "RX")
 
     def sx(self, qubits_to_apply) -> None:
@@ -290,7 +862,9 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, u(theta, phi, lmbda))
+        self.calculator.pass_single_gate(
+            qubits_to_apply, self.__gate__(u, theta, phi, lmbda)
+        )
         self.__add_single_drawing__(qubits_to_apply, "U")
 
     def custom(self, qubits_to_apply, gate: np.array) -> None:
@@ -298,7 +872,7 @@ class QuantumCircuit:
         Args:
             qubits_to_apply(int, arr[int]): qubits to apply the gate to.
         """
-        self.calculator.pass_single_gate(qubits_to_apply, gate)
+        self.__pass_single_gate__(qubits_to_apply, gate)
         self.__add_single_drawing__(qubits_to_apply, "C")
 
     def gatearray(self, gate_array) -> None:
@@ -314,7 +888,7 @@ class QuantumCircuit:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the gate.
         """
-        self.calculator.pass_multi_gate(control, target, paulix())
+        self.__pass_multi_gate__(control, target, paulix())
         self.circuit_drawing.add_control("X", control, target)
 
     def ch(self, control: int, target: int) -> None:
@@ -340,34 +914,37 @@ class QuantumCircuit:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the target.
         """
-        self.calculator.pass_multi_gate(control, target, pauliz())
+        self.__pass_multi_gate__(control, target, pauliz())
         self.circuit_drawing.add_control("Z", control, target)
 
-    def crx(self, control: int, target: int) -> None:
+    def crx(self, control: int, target: int, theta: float = np.pi / 2) -> None:
         """Insert a CRX (Controlled RX) gate into the quantum circuit.
         Args:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the gate.
+            theta (float): angle to rotate the target by.
         """
-        self.calculator.pass_multi_gate(control, target, rx())
+        self.calculator.pass_multi_gate(control, target, self.__gate__(rx, theta))
         self.circuit_drawing.add_control("RX", control, target)
 
-    def cry(self, control: int, target: int) -> None:
+    def cry(self, control: int, target: int, theta: float = np.pi / 2) -> None:
         """Insert a CRY (Controlled RY) gate into the quantum circuit.
         Args:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the gate.
+            theta (float): angle to rotate the target by.
         """
-        self.calculator.pass_multi_gate(control, target, ry())
+        self.calculator.pass_multi_gate(control, target, self.__gate__(ry, theta))
         self.circuit_drawing.add_control("RY", control, target)
 
-    def crz(self, control: int, target: int) -> None:
+    def crz(self, control: int, target: int, theta: float = np.pi / 2) -> None:
         """Insert a CRZ (Controlled RZ) gate into the quantum circuit.
         Args:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the gate.
+            theta (float): angle to rotate the target by.
         """
-        self.calculator.pass_multi_gate(control, target, rz())
+        self.__pass_multi_gate__(control, target, self.__gate__(rz, theta))
         self.circuit_drawing.add_control("RZ", control, target)
 
     def cr1(self, control: int, target: int) -> None:
@@ -376,7 +953,7 @@ class QuantumCircuit:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the gate.
         """
-        self.calculator.pass_multi_gate(control, target, r1())
+        self.__pass_multi_gate__(control, target, r1())
         self.circuit_drawing.add_control("R1", control, target)
 
     def multicustom(self, gate: np.array, control: int, target: int) -> None:
@@ -386,9 +963,32 @@ class QuantumCircuit:
             control (int): qubit to act as the control for the gate.
             target (int): qubit to act as the target for the gate.
         """
-        self.calculator.pass_multi_gate(control, target, gate)
+        self.__pass_multi_gate__(control, target, gate)
         self.circuit_drawing.add_control("C", control, target)
 
+    def mcu(self, controls, targets, gate: np.array) -> None:
+        """Insert a multi-controlled unitary on any number of target qubits.
+        Args:
+            controls (int, arr[int]): qubits that all need to be set for the gate to act.
+            targets (int, arr[int]): qubits the gate acts on, the first one being the
+                                     most significant qubit of the gate.
+            gate (np.array): 2^k x 2^k unitary where k is the number of targets, or a stack
+                             of one per member of a batch.
+        """
+        controls = [controls] if isinstance(controls, int) else list(controls)
+        targets = [targets] if isinstance(targets, int) else list(targets)
+        if np.shape(gate)[-2:] != (2 ** len(targets), 2 ** len(targets)):
+            raise NotUnitaryMultiGateError(
+                f"Gate of shape {np.shape(gate)} cannot act on {len(targets)} qubits"
+            )
+        self.__pass_mcu_gate__(controls, targets, self.__sweep__(gate))
+        if not controls and len(targets) == 1:
+            self.__add_single_drawing__(targets[0], "U")
+        elif len(targets) == 1:
+            self.circuit_drawing.add_multi("U", controls, targets[0])
+        else:
+            self.circuit_drawing.add_block("U", controls + targets)
+
     def ccx(self, control_one: int, control_two: int, target: int) -> None:
         """Insert a CCX (Toffoli) gate into the quantum circuit.
         Args:
@@ -396,11 +996,7 @@ class QuantumCircuit:
             control_two (int): qubit to act as the control two for the gate.
             target (int): qubit to act as the target for the gate.
         """
-        self.calculator.pass_multi_gate(control_two, target, sx())
-        self.calculator.pass_multi_gate(control_one, control_two, paulix())
-        self.calculator.pass_multi_gate(control_two, target, sxdg())
-        self.calculator.pass_multi_gate(control_one, control_two, paulix())
-        self.calculator.pass_multi_gate(control_one, target, sx())
+        self.__pass_mcu_gate__([control_one, control_two], [target], paulix())
         self.circuit_drawing.add_multi("X", [control_one, control_two], target)
 
     def qft(self, qubit_one: int, qubit_two: int, qubit_three: int) -> None:
@@ -411,14 +1007,14 @@ class QuantumCircuit:
             qubit_three (int): qubit to act as the qubit three for the gate.
         """
         self.calculator.pass_single_gate(qubit_one, hadamard())
-        self.calculator.pass_multi_gate(qubit_two, qubit_one, r1())
-        self.calculator.pass_multi_gate(qubit_two, qubit_three, r1())
+        self.__pass_multi_gate__(qubit_two, qubit_one, r1())
+        self.__pass_multi_gate__(qubit_two, qubit_three, r1())
         self.calculator.pass_single_gate(qubit_two, hadamard())
-        self.calculator.pass_multi_gate(qubit_three, qubit_two, r1())
+        self.__pass_multi_gate__(qubit_three, qubit_two, r1())
         self.calculator.pass_single_gate(qubit_three, hadamard())
-        self.calculator.pass_multi_gate(qubit_one, qubit_three, paulix())
-        self.calculator.pass_multi_gate(qubit_three, qubit_one, paulix())
-        self.calculator.pass_multi_gate(qubit_one, qubit_three, paulix())
+        self.__pass_multi_gate__(qubit_one, qubit_three, paulix())
+        self.__pass_multi_gate__(qubit_three, qubit_one, paulix())
+        self.__pass_multi_gate__(qubit_one, qubit_three, paulix())
         self.circuit_drawing.add_block("QFT", [qubit_one, qubit_two, qubit_three])
 
     def rccx(self, control_one: int, control_two: int, target: int) -> None:
@@ -428,15 +1024,21 @@ class QuantumCircuit:
             control_two (int): qubit to act as the control two for the gate.
             target (int): qubit to act as the target for the gate.
         """
-        self.calculator.pass_single_gate(target, u(np.pi / 2, 0, np.pi))
-        self.calculator.pass_single_gate(target, u(0, 0, np.pi / 4))
-        self.calculator.pass_multi_gate(control_two, target, paulix())
-        self.calculator.pass_single_gate(target, u(0, 0, (-1 * np.pi) / 4))
-        self.calculator.pass_multi_gate(control_one, target, paulix())
-        self.calculator.pass_single_gate(target, u(0, 0, np.pi / 4))
-        self.calculator.pass_multi_gate(control_two, target, paulix())
-        self.calculator.pass_single_gate(target, u(0, 0, (-1 * np.pi) / 4))
-        self.calculator.pass_single_gate(target, u(np.pi / 2, 0, np.pi))
+        rccx = self.__decomposition__(
+            3,
+            [
+                (2, u(np.pi / 2, 0, np.pi)),
+                (2, u(0, 0, np.pi / 4)),
+                (1, 2, paulix()),
+                (2, u(0, 0, (-1 * np.pi) / 4)),
+                (0, 2, paulix()),
+                (2, u(0, 0, np.pi / 4)),
+                (1, 2, paulix()),
+                (2, u(0, 0, (-1 * np.pi) / 4)),
+                (2, u(np.pi / 2, 0, np.pi)),
+            ],
+        )
+        self.calculator.pass_mcu_gate([], [control_one, control_two, target], rccx)
         self.circuit_drawing.add_block("RCCX", [control_one, control_two, target])
 
     def rc3x(self, qubit_1: int, qubit_2: int, qubit_3: int, qubit_4: int) -> None:
@@ -447,24 +1049,30 @@ class QuantumCircuit:
             qubit_3 (int): qubit to act as the qubit three for the gate.
             qubit_4 (int): qubit to act as the qubit four for the gate.
         """
-        self.calculator.pass_single_gate(qubit_4, u(np.pi / 2, 0, np.pi))
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, np.pi / 4))
-        self.calculator.pass_multi_gate(qubit_3, qubit_4, paulix())
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, (-1 * np.pi) / 4))
-        self.calculator.pass_single_gate(qubit_4, u(np.pi / 2, 0, np.pi))
-        self.calculator.pass_multi_gate(qubit_1, qubit_4, paulix())
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, np.pi / 4))
-        self.calculator.pass_multi_gate(qubit_2, qubit_4, paulix())
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, (-1 * np.pi / 4)))
-        self.calculator.pass_multi_gate(qubit_1, qubit_4, paulix())
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, np.pi / 4))
-        self.calculator.pass_multi_gate(qubit_2, qubit_4, paulix())
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, (-1 * np.pi / 4)))
-        self.calculator.pass_single_gate(qubit_4, u(np.pi / 2, 0, np.pi))
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, np.pi / 4))
-        self.calculator.pass_multi_gate(qubit_3, qubit_4, paulix())
-        self.calculator.pass_single_gate(qubit_4, u(0, 0, (-1 * np.pi / 4)))
-        self.calculator.pass_single_gate(qubit_4, u(np.pi / 2, 0, np.pi))
+        rc3x = self.__decomposition__(
+            4,
+            [
+                (3, u(np.pi / 2, 0, np.pi)),
+                (3, u(0, 0, np.pi / 4)),
+                (2, 3, paulix()),
+                (3, u(0, 0, (-1 * np.pi) / 4)),
+                (3, u(np.pi / 2, 0, np.pi)),
+                (0, 3, paulix()),
+                (3, u(0, 0, np.pi / 4)),
+                (1, 3, paulix()),
+                (3, u(0, 0, (-1 * np.pi / 4))),
+                (0, 3, paulix()),
+                (3, u(0, 0, np.pi / 4)),
+                (1, 3, paulix()),
+                (3, u(0, 0, (-1 * np.pi / 4))),
+                (3, u(np.pi / 2, 0, np.pi)),
+                (3, u(0, 0, np.pi / 4)),
+                (2, 3, paulix()),
+                (3, u(0, 0, (-1 * np.pi / 4))),
+                (3, u(np.pi / 2, 0, np.pi)),
+            ],
+        )
+        self.calculator.pass_mcu_gate([], [qubit_1, qubit_2, qubit_3, qubit_4], rc3x)
         self.circuit_drawing.add_block("RC3X", [qubit_1, qubit_2, qubit_3, qubit_4])
 
     def swap(self, qubit_one: int, qubit_two: int) -> None:
@@ -473,9 +1081,7 @@ class QuantumCircuit:
             qubit_one (int): qubit to act as the qubit one for the gate.
             qubit_two (int): qubit to act as the qubit two for the gate.
         """
-        self.calculator.pass_multi_gate(qubit_one, qubit_two, paulix())
-        self.calculator.pass_multi_gate(qubit_two, qubit_one, paulix())
-        self.calculator.pass_multi_gate(qubit_one, qubit_two, paulix())
+        self.__pass_mcu_gate__([], [qubit_one, qubit_two], swap())
         self.circuit_drawing.add_swap(qubit_one, qubit_two)
 
     def rxx(self, qubit_one: int, qubit_two: int, theta: float = np.pi / 2) -> None:
@@ -485,17 +1091,9 @@ class QuantumCircuit:
             qubit two (int): qubit to act as the qubit two for the gate.
             theta (float): theta value to rotate the gate on the X axis.
         """
-        self.calculator.pass_single_gate(
-            qubit_one, u(phi=theta, lmbda=0, theta=np.pi / 2)
+        self.calculator.pass_mcu_gate(
+            [], [qubit_one, qubit_two], self.__gate__(self.__rxx__, theta)
         )
-        self.calculator.pass_single_gate(qubit_two, hadamard())
-        self.calculator.pass_multi_gate(qubit_one, qubit_two, paulix())
-        self.calculator.pass_single_gate(qubit_two, u(-1 * theta, 0, 0))
-        self.calculator.pass_multi_gate(qubit_one, qubit_two, paulix())
-        self.calculator.pass_single_gate(
-            qubit_one, u(np.pi / 2, -1 * np.pi, np.pi - theta)
-        )
-        self.calculator.pass_single_gate(qubit_two, hadamard())
         self.circuit_drawing.add_block("RXX", [qubit_one, qubit_two])
 
     def rzz(self, qubit_one: int, qubit_two: int, lmbda: float = np.pi / 2) -> None:
@@ -505,7 +1103,69 @@ class QuantumCircuit:
             qubit_two (int): qubit to act as the qubit two for the gate.
             lmbda (float): The lambda value to rotate the gate on the z axis.
         """
-        self.calculator.pass_multi_gate(qubit_one, qubit_two, paulix())
-        self.calculator.pass_single_gate(qubit_two, u(0, lmbda, 0))
-        self.calculator.pass_multi_gate(qubit_one, qubit_two, paulix())
+        self.__pass_mcu_gate__(
+            [], [qubit_one, qubit_two], self.__gate__(self.__rzz__, lmbda)
+        )
         self.circuit_drawing.add_block("RZZ", [qubit_one, qubit_two])
+
+    def measure(self, qubit: int, creg=None) -> int:
+        """Measures a qubit inside of the circuit, collapsing the state onto the outcome.
+        Args:
+            qubit (int): Qubit to measure.
+            creg (int/str): Classical bit to store the outcome in, the qubit when None.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        outcome = self.__collapse__(qubit, False)
+        self.classical[qubit if creg is None else creg] = outcome
+        self.__add_single_drawing__(qubit, "M")
+        return outcome
+
+    def reset(self, qubit: int) -> None:
+        """Measures a qubit and flips it back to 0.
+        Args:
+            qubit (int): Qubit to reset.
+        """
+        self.__collapse__(qubit, True)
+        self.__add_single_drawing__(qubit, "R")
+
+    def c_if(self, creg, value: int, gate: str, *args) -> bool:
+        """Inserts a gate only when the classical register holds a value.
+        Args:
+            creg (int/str/List[int/str]): Classical bit to compare, or classical bits
+                                          read as a number, the first one being the most
+                                          significant bit.
+            value (int): Value the classical bits need to hold.
+            gate (str): Name of the gate, such as "x" or "crx".
+            args: Arguments of the gate.
+        Returns:
+            bool: Whether the gate was inserted.
+        """
+        bits = creg if isinstance(creg, list) else [creg]
+        held = 0
+        for bit in bits:
+            held = 2 * held + self.classical.get(bit, 0)
+        if held != value:
+            return False
+        getattr(self, gate)(*args)
+        return True
+
+    def __collapse__(self, qubit: int, reset: bool) -> int:
+        """Collapses a qubit of the state, once every recorded or fused gate ran.
+        Args:
+            qubit (int): Qubit to measure.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        backend = self.backend
+        routing = self.calculator
+        if isinstance(routing, DeferredExecution):
+            routing = routing.calculator
+        if isinstance(routing, CliffordRouting) and routing.tableau is not None:
+            backend = routing
+        if not hasattr(backend, "collapse"):
+            raise InvalidEngineError(
+                f"{type(backend).__name__} does not measure qubits inside of the circuit"
+            )
+        return backend.collapse(qubit, self.random.random(), reset)
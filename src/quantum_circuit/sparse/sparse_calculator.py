@@ -1,3 +1,4 @@
+import numpy as np
 from scipy import sparse as sp
 from ..interface import CalculatorInterface
 from .sparse_core import SparseCore
@@ -24,6 +25,21 @@ class SparseCalculator(
             self.__create_braket_queue__(sp.csr_matrix(gate), control, target)
         )
 
+    def pass_mcu_gate(self, controls, targets, gate):
+        self.__mcu_operator_matrix__(
+            self.__create_mcu_mask__(controls, targets, np.asarray(gate))
+        )
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_mask__(qubits, np.asarray(diagonal))
+        )
+
+    def pass_permutation_gate(self, qubits, permutation):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_mask__(qubits, np.asarray(permutation))
+        )
+
     def pass_custom_gate_queue(self, gate_queue):
         gate_queue = [sp.csr_matrix(i) for i in gate_queue]
         self.__operator_matrix__(gate_queue)
@@ -1,5 +1,7 @@
+import numpy as np
 from scipy import sparse as sp
 from ..interface import CoreInterface
+from ...errors import OutOfRangeError
 from ...qubit import qubit
 
 
@@ -30,3 +32,80 @@ class SparseCore(CoreInterface):
         to_add_zero += to_add_one
         self.state = sp.csc_matrix(to_add_zero.dot(self.state))
         return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_mask, offsets, gate = mcu_queue
+        size = 2**self.qubits
+        indices = np.arange(size)
+        base = np.flatnonzero(indices & (control_mask | offsets[-1]) == control_mask)
+        rows = base | offsets[:, None]
+        untouched = np.ones(size, dtype=bool)
+        untouched[rows] = False
+        gate_row, gate_column = np.nonzero(gate)
+        values = np.broadcast_to(
+            gate[gate_row, gate_column][:, None], rows[gate_row].shape
+        )
+        operator = sp.csr_matrix(
+            (
+                np.concatenate(
+                    [np.ones(np.count_nonzero(untouched), gate.dtype), values.ravel()]
+                ),
+                (
+                    np.concatenate([indices[untouched], rows[gate_row].ravel()]),
+                    np.concatenate([indices[untouched], rows[gate_column].ravel()]),
+                ),
+            ),
+            shape=(size, size),
+        )
+        self.state = sp.csc_matrix(operator.dot(self.state))
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        self.state = sp.csc_matrix(self.state)
+        rows = self.state.indices
+        position = np.zeros(rows.size, dtype=int)
+        for bit in bits:
+            position = (position << 1) | ((rows >> bit) & 1)
+        self.state.data *= diagonal[position].astype(self.state.dtype)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        state = sp.csc_matrix(self.state)
+        rows = state.indices.astype(int)
+        local = np.zeros_like(rows)
+        for bit in bits:
+            local = (local << 1) | ((rows >> bit) & 1)
+        moved = permutation[local]
+        for shift, bit in enumerate(reversed(bits)):
+            rows = (rows & ~(1 << bit)) | (((moved >> shift) & 1) << bit)
+        self.state = sp.csc_matrix(
+            (state.data, (rows, np.zeros_like(rows))), shape=state.shape
+        )
+        return
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit, keeping the stored amplitudes that agree with the outcome.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        bit = self.qubits - 1 - qubit if self.big_endian else qubit
+        state = sp.csc_matrix(self.state)
+        rows = state.indices.astype(int)
+        ones = ((rows >> bit) & 1).astype(bool)
+        probability = float(np.sum(np.square(np.abs(state.data[ones]))))
+        outcome = int(draw < probability)
+        kept = ones if outcome else ~ones
+        rows = rows[kept] ^ (1 << bit) if reset and outcome else rows[kept]
+        data = state.data[kept] / np.sqrt(probability if outcome else 1 - probability)
+        self.state = sp.csc_matrix(
+            (data.astype(state.dtype), (rows, np.zeros_like(rows))), shape=state.shape
+        )
+        return outcome
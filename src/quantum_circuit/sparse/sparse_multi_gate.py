@@ -22,3 +22,49 @@ class SparseMultiGate(MultiGateInterface):
             bra_ket_zero_kron = bra_ket_zero_kron[::-1]
             bra_ket_one_kron = bra_ket_one_kron[::-1]
         return [bra_ket_zero_kron, bra_ket_one_kron]
+
+    def __create_mcu_mask__(self, controls, targets, gate):
+        """Creates the masks that select the amplitudes of a multi-controlled unitary.
+        Args:
+            controls (List[int]): Qubits that all need to be set for the gate to act.
+            targets (List[int]): Qubits the gate acts on, the first one being the most
+                                 significant qubit of the gate.
+            gate (np.array): 2^k x 2^k gate where k is the number of targets.
+        Returns:
+            List: Control mask, offset of every row of the gate and the gate to apply.
+        """
+        if self.big_endian:
+            controls = [self.qubits - 1 - control for control in controls]
+            targets = [self.qubits - 1 - target for target in targets]
+        offsets = np.zeros(2 ** len(targets), dtype=int)
+        for row in range(offsets.size):
+            for position, target in enumerate(targets):
+                if row >> (len(targets) - 1 - position) & 1:
+                    offsets[row] |= 1 << target
+        return [sum(1 << control for control in controls), offsets, gate]
+
+    def __create_diagonal_mask__(self, qubits, diagonal):
+        """Resolves the bits a diagonal gate multiplies the phases of.
+        Args:
+            qubits (List[int]): Qubits the gate acts on, the first one being the most
+                                significant qubit of the gate.
+            diagonal (np.array): The 2^k diagonal entries of the gate.
+        Returns:
+            List: Bit of every qubit and the diagonal entries to multiply by.
+        """
+        if self.big_endian:
+            qubits = [self.qubits - 1 - qubit for qubit in qubits]
+        return [list(qubits), diagonal]
+
+    def __create_permutation_mask__(self, qubits, permutation):
+        """Resolves the bits a permutation gate moves the amplitudes along.
+        Args:
+            qubits (List[int]): Qubits the gate acts on, the first one being the most
+                                significant qubit of the gate.
+            permutation (np.array): Basis state each of the 2^k basis states is sent to.
+        Returns:
+            List: Bit of every qubit and the permutation to apply.
+        """
+        if self.big_endian:
+            qubits = [self.qubits - 1 - qubit for qubit in qubits]
+        return [list(qubits), permutation]
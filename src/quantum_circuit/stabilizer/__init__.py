@@ -0,0 +1,2 @@
+from .stabilizer_calculator import StabilizerCalculator
+from .clifford_routing import CliffordRouting
@@ -0,0 +1,157 @@
+from ...errors import InvalidEngineError, NotCliffordGateError, OutOfRangeError
+from ..fusion import GateFusion
+from ..interface import CalculatorInterface
+from .stabilizer_calculator import StabilizerCalculator
+
+
+class CliffordRouting(CalculatorInterface):
+    """Runs gates on a stabilizer tableau for as long as every one of them is Clifford.
+
+    The gates are recorded next to the tableau. The first gate that is not Clifford
+    creates the calculator the circuit would otherwise run on, replays the recorded
+    gates on it and from then on passes every gate straight to it. Reading the state
+    does the same, since a dense state is what the other calculators hold, while
+    measure samples the tableau directly.
+
+    Args:
+        build (Callable[[], CalculatorInterface]): Creates the calculator to switch to.
+        qubits (int): Number of qubits.
+        big_endian (bool): Flag to set if the state is big endian.
+        prep (chr): Initial direction of the qubits.
+        max_qubits (int): Most qubits the calculator to switch to holds, no limit when
+                          None.
+        random (np.random.Generator): Draws the random outcomes of the tableau, numpy's
+                                      global generator when None.
+
+    Attributes:
+        build (Callable[[], CalculatorInterface]): Creates the calculator to switch to.
+        built (CalculatorInterface): Calculator once switched to, None before.
+        tableau (StabilizerCalculator): Tableau the gates run on, None once switched.
+        qubits (int): Number of qubits.
+        max_qubits (int): Most qubits the calculator to switch to holds.
+        queue (list): Gates run on the tableau as the name of the method and its
+                      arguments.
+    """
+
+    def __init__(
+        self,
+        build,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        max_qubits: int = None,
+        random=None,
+    ):
+        self.build = build
+        self.built = None
+        self.tableau = StabilizerCalculator(qubits, big_endian, prep)
+        if random is not None:
+            self.tableau.random = random
+        self.qubits = qubits
+        self.max_qubits = max_qubits
+        self.queue = []
+
+    def __getattr__(self, name: str):
+        return getattr(self.calculator, name)
+
+    @property
+    def calculator(self) -> CalculatorInterface:
+        """Tableau while every gate is Clifford, the switched to calculator after."""
+        return self.built if self.tableau is None else self.tableau
+
+    @property
+    def state(self):
+        """State of the circuit, leaving the tableau for the other calculator."""
+        self.switch()
+        return self.built.state
+
+    @state.setter
+    def state(self, state_to_store):
+        self.switch()
+        self.built.state = state_to_store
+
+    def switch(self) -> None:
+        """Leaves the tableau for the other calculator and replays the gates on it."""
+        if self.tableau is None:
+            return
+        if self.max_qubits is not None and self.qubits > self.max_qubits:
+            raise OutOfRangeError(
+                f"Cannot leave the stabilizer tableau for a dense state of {self.qubits} "
+                f"qubits, at most {self.max_qubits} qubits fit"
+            )
+        self.built = self.build()
+        for method, args in self.queue:
+            if method == "collapse":
+                self.__replay_collapse__(*args)
+            else:
+                getattr(self.built, method)(*args)
+        self.tableau = None
+        self.queue = []
+        return
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit on the tableau, recording the outcome for the other calculator.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        outcome = self.tableau.collapse(qubit, draw, reset)
+        self.queue.append(("collapse", (qubit, outcome, reset)))
+        return outcome
+
+    def __replay_collapse__(self, qubit: int, outcome: int, reset: bool) -> None:
+        """Collapses the other calculator onto an outcome measured on the tableau.
+        Args:
+            qubit (int): Qubit measured.
+            outcome (int): Outcome of the measurement, forced by a draw of 0 or 1.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        """
+        calculator = self.built
+        if isinstance(calculator, GateFusion):
+            calculator.flush()
+            calculator = calculator.calculator
+        if not hasattr(calculator, "collapse"):
+            raise InvalidEngineError(
+                f"{type(calculator).__name__} does not measure qubits inside of the circuit"
+            )
+        calculator.collapse(qubit, 1 - outcome, reset)
+        return
+
+    def __pass__(self, method: str, *args) -> None:
+        """Runs a gate on the tableau, or on the other calculator when it is not Clifford.
+        Args:
+            method (str): Name of the calculator method.
+            args: Arguments of the method.
+        """
+        if self.tableau is not None:
+            try:
+                getattr(self.tableau, method)(*args)
+                self.queue.append((method, args))
+                return
+            except NotCliffordGateError:
+                self.switch()
+        getattr(self.built, method)(*args)
+        return
+
+    def pass_single_gate(self, qubits_to_apply, gate):
+        if not isinstance(qubits_to_apply, int):
+            qubits_to_apply = list(qubits_to_apply)
+        self.__pass__("pass_single_gate", qubits_to_apply, gate)
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.__pass__("pass_custom_gate_queue", gate_queue)
+
+    def pass_multi_gate(self, control: int, target: int, gate):
+        self.__pass__("pass_multi_gate", control, target, gate)
+
+    def pass_mcu_gate(self, controls, targets, gate):
+        self.__pass__("pass_mcu_gate", list(controls), list(targets), gate)
+
+    def pass_diagonal_gate(self, qubits, diagonal):
+        self.__pass__("pass_diagonal_gate", list(qubits), diagonal)
+
+    def pass_permutation_gate(self, qubits, permutation):
+        self.__pass__("pass_permutation_gate", list(qubits), permutation)
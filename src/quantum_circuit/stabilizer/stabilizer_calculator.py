@@ -0,0 +1,46 @@
+import numpy as np
+from ..interface import CalculatorInterface
+from .stabilizer_core import StabilizerCore
+from .stabilizer_single_gate import StabilizerSingleGate
+from .stabilizer_multi_gate import StabilizerMultiGate
+
+
+class StabilizerCalculator(
+    CalculatorInterface, StabilizerCore, StabilizerSingleGate, StabilizerMultiGate
+):
+    """Calculator that runs Clifford circuits on a stabilizer tableau.
+
+    Circuits made of gates such as h, s, sdg, x, y, z, cx, cz and swap take O(n)
+    per gate instead of O(2^n), so thousands of qubits can be simulated and
+    measured. Every gate is checked to be Clifford before it touches the tableau,
+    and NotCliffordGateError is raised for any other gate.
+    """
+
+    def __init__(self, qubits: int, big_endian: bool = False, prep: chr = "z"):
+        StabilizerCore.__init__(self, qubits, big_endian, prep)
+        StabilizerSingleGate.__init__(self, qubits, big_endian)
+        StabilizerMultiGate.__init__(self, qubits, big_endian)
+
+    def pass_single_gate(self, qubits_to_apply, gate: np.array):
+        self.__operator_matrix__(self.__create_gate_queue__(qubits_to_apply, gate))
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.__operator_matrix__(self.__custom_gate_queue__(gate_queue))
+
+    def pass_multi_gate(self, control: int, target: int, gate: np.array):
+        self.__multi_operator_matrix__(
+            self.__create_control_queue__(control, target, gate)
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        self.__mcu_operator_matrix__(self.__create_mcu_queue__(controls, targets, gate))
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_queue__(qubits, diagonal)
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_queue__(qubits, permutation)
+        )
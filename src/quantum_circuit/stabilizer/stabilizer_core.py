@@ -0,0 +1,339 @@
+import numpy as np
+from ...errors import NotCliffordGateError, OutOfRangeError
+from ..interface import CoreInterface
+
+
+class StabilizerCore(CoreInterface):
+    """Holds the stabilizer tableau of the state, with every row packed into bits.
+
+    Following Aaronson and Gottesman, a state of n qubits reached by Clifford gates
+    is described by its n stabilizers, the Pauli strings that leave it unchanged,
+    along with n destabilizers. Every row of the tableau is a Pauli string written
+    as i^e X^x Z^z, with the x and z bits of all qubits packed into 64 bit words, so
+    multiplying two rows costs n / 64 word operations. A Clifford gate maps every
+    Pauli string to another one and is applied by rewriting the bits of its qubits
+    in every row, O(n) per gate, and measuring a qubit costs O(n^2 / 64).
+
+    Attributes:
+        x (np.array): X bits of the 2n rows, destabilizers first, as uint64 words.
+        z (np.array): Z bits of the 2n rows, as uint64 words.
+        e (np.array): Power of i every row is multiplied by.
+        dense_qubits (int): Most qubits the state is made into a dense array for.
+        random (np.random.Generator): Draws every random outcome, numpy's global
+                                      generator unless the circuit gives its own.
+    """
+
+    dense_qubits = 30
+    random = np.random
+
+    def __init__(self, qubits: int, big_endian: bool = False, prep: chr = "z"):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        words = (qubits + 63) // 64
+        self.x = np.zeros((2 * qubits, words), np.uint64)
+        self.z = np.zeros((2 * qubits, words), np.uint64)
+        self.e = np.zeros(2 * qubits, np.uint8)
+        bits = np.arange(qubits)
+        masks = np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64))
+        destabilizers, stabilizers = (
+            (self.x, self.z) if prep == "z" else (self.z, self.x)
+        )
+        destabilizers[bits, bits // 64] = masks
+        stabilizers[qubits + bits, bits // 64] = masks
+        if prep == "y":
+            self.z[qubits + bits, bits // 64] = masks
+            self.e[qubits:] = 1
+        return
+
+    @property
+    def state(self):
+        """The state as a dense (2^n, 1) array, up to a global phase.
+
+        The amplitude of the first basis state found by measuring every qubit is
+        taken as real and positive, since the tableau does not keep a global phase.
+        Only states of at most dense_qubits qubits are made, so every row fits in
+        its first word.
+        """
+        if self.qubits > self.dense_qubits:
+            raise OutOfRangeError(
+                f"A dense state of {self.qubits} qubits is larger than the "
+                f"{self.dense_qubits} qubits a stabilizer tableau is made into"
+            )
+        offset, (x, z, e) = self.__support__()
+        shifts = np.arange(self.qubits, dtype=np.uint64)
+        indices = np.bitwise_or.reduce(
+            offset.astype(np.uint64) << shifts, keepdims=True
+        )
+        amplitudes = np.ones(1, "D")
+        for row in range(len(e)):
+            signs = self.__parity__((indices & z[row, 0])[:, None])
+            phases = 1j ** int(e[row]) * (1 - 2.0 * signs)
+            indices = np.concatenate([indices, indices ^ x[row, 0]])
+            amplitudes = np.concatenate([amplitudes, amplitudes * phases])
+        state = np.zeros((2**self.qubits, 1), "F")
+        state[indices.astype(np.int64), 0] = amplitudes * 2 ** (-len(e) / 2)
+        return state
+
+    @state.setter
+    def state(self, state_to_store):
+        raise NotCliffordGateError(
+            "A stabilizer tableau cannot hold an arbitrary state"
+        )
+
+    def __bit__(self, qubit: int) -> int:
+        """Column of the tableau that holds a qubit.
+        Args:
+            qubit (int): Qubit of the quantum circuit.
+        Returns:
+            int: Bit of the basis state indices that holds the qubit.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        return self.qubits - 1 - qubit if self.big_endian else qubit
+
+    @staticmethod
+    def __parity__(words):
+        """Parity of the number of set bits in every row of packed words.
+        Args:
+            words (np.array): uint64 words, one row per Pauli string.
+        Returns:
+            np.array: 0 or 1 for every row.
+        """
+        folded = np.bitwise_xor.reduce(words, axis=-1)
+        for shift in (32, 16, 8, 4, 2, 1):
+            folded = folded ^ (folded >> np.uint64(shift))
+        return (folded & np.uint64(1)).astype(np.uint8)
+
+    def __columns__(self, words, bits):
+        """Unpacks the given bits of every row.
+        Args:
+            words (np.array): Packed x or z bits of the rows.
+            bits (List[int]): Bits to unpack.
+        Returns:
+            np.array: (rows, bits) array of booleans.
+        """
+        return np.stack(
+            [
+                (words[:, bit // 64] >> np.uint64(bit % 64)) & np.uint64(1)
+                for bit in bits
+            ],
+            axis=1,
+        ).astype(bool)
+
+    def __write__(self, words, bits, values) -> None:
+        """Packs the given bits of every row back into the words.
+        Args:
+            words (np.array): Packed x or z bits of the rows.
+            bits (List[int]): Bits to write.
+            values (np.array): (rows, bits) array of booleans.
+        """
+        for position, bit in enumerate(bits):
+            shift = np.uint64(bit % 64)
+            words[:, bit // 64] &= ~(np.uint64(1) << shift)
+            words[:, bit // 64] |= values[:, position].astype(np.uint64) << shift
+        return
+
+    def __conjugate__(self, bits, images) -> None:
+        """Rewrites every row of the tableau through a Clifford gate.
+
+        The part of a row on the gate's qubits, X^x Z^z, becomes the product of the
+        images of the X and Z of every qubit it holds, and the phases picked up
+        while multiplying them are added to the row's power of i.
+
+        Args:
+            bits (List[int]): Bits the gate acts on, the first one being most
+                              significant.
+            images (List[tuple]): For every bit, the images of its X and of its Z, each
+                                  as the power of i and the x and z bits of a Pauli
+                                  string on the gate's bits.
+        """
+        old_x = self.__columns__(self.x, bits)
+        old_z = self.__columns__(self.z, bits)
+        new_x = np.zeros_like(old_x)
+        new_z = np.zeros_like(old_z)
+        powers = self.e.astype(np.int64)
+        for which, old in ((0, old_x), (1, old_z)):
+            for position in range(len(bits)):
+                power, image_x, image_z = images[position][which]
+                rows = old[:, position]
+                powers[rows] += power + 2 * np.sum(new_z[rows] & image_x, axis=1)
+                new_x[rows] ^= image_x
+                new_z[rows] ^= image_z
+        self.e = (powers % 4).astype(np.uint8)
+        self.__write__(self.x, bits, new_x)
+        self.__write__(self.z, bits, new_z)
+        return
+
+    def __multiply__(self, rows, source: int) -> None:
+        """Multiplies rows of the tableau on the right by another row.
+        Args:
+            rows (np.array): Rows to multiply.
+            source (int): Row to multiply them by.
+        """
+        self.e[rows] = (
+            self.e[rows]
+            + self.e[source]
+            + 2 * self.__parity__(self.z[rows] & self.x[source])
+        ) % 4
+        self.x[rows] ^= self.x[source]
+        self.z[rows] ^= self.z[source]
+        return
+
+    def __measure__(self, bit: int, outcome: int = None) -> int:
+        """Measures a bit in the Z basis and collapses the tableau onto the outcome.
+        Args:
+            bit (int): Bit to measure.
+            outcome (int): Outcome to collapse onto when it is random, drawn when None.
+        Returns:
+            int: Measured value of the bit.
+        """
+        qubits = self.qubits
+        word, mask = bit // 64, np.uint64(1) << np.uint64(bit % 64)
+        flipped = (self.x[:, word] & mask) != 0
+        stabilizers = np.flatnonzero(flipped[qubits:])
+        if stabilizers.size:
+            pivot = qubits + stabilizers[0]
+            rows = np.flatnonzero(flipped)
+            self.__multiply__(rows[(rows != pivot) & (rows != pivot - qubits)], pivot)
+            self.x[pivot - qubits] = self.x[pivot]
+            self.z[pivot - qubits] = self.z[pivot]
+            self.e[pivot - qubits] = self.e[pivot]
+            if outcome is None:
+                outcome = int(self.random.random() < 0.5)
+            self.x[pivot] = 0
+            self.z[pivot] = 0
+            self.z[pivot, word] = mask
+            self.e[pivot] = 2 * outcome
+            return int(outcome)
+        rows = qubits + np.flatnonzero(flipped[:qubits])
+        before = np.bitwise_xor.accumulate(self.z[rows], axis=0)[:-1]
+        power = int(np.sum(self.e[rows], dtype=np.int64)) + 2 * int(
+            np.sum(self.__parity__(before & self.x[rows][1:]), dtype=np.int64)
+        )
+        return (power % 4) // 2
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit and collapses the tableau onto the outcome.
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome when it is
+                          random, each outcome having a probability of one half.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        bit = self.__bit__(qubit)
+        outcome = self.__measure__(bit, int(draw < 0.5))
+        if reset and outcome:
+            word, mask = bit // 64, np.uint64(1) << np.uint64(bit % 64)
+            rows = (self.z[:, word] & mask) != 0
+            self.e[rows] = (self.e[rows] + 2) % 4
+        return outcome
+
+    def __support__(self):
+        """Basis states the state is spread over.
+
+        The state is an equal superposition over one basis state xor every
+        combination of the X bits of the stabilizers, which are brought to row
+        echelon form. The tableau itself is left untouched.
+
+        Returns:
+            (np.array, tuple): Bits of one basis state of the superposition, and the x,
+                               z and e of the independent stabilizers that flip bits.
+        """
+        saved = (self.x.copy(), self.z.copy(), self.e.copy())
+        qubits = self.qubits
+        rank = 0
+        for bit in range(qubits):
+            word, mask = bit // 64, np.uint64(1) << np.uint64(bit % 64)
+            found = np.flatnonzero(self.x[qubits + rank :, word] & mask)
+            if not found.size:
+                continue
+            top, pivot = qubits + rank, qubits + rank + found[0]
+            for rows in (self.x, self.z, self.e):
+                rows[[top, pivot]] = rows[[pivot, top]]
+            others = qubits + np.flatnonzero(self.x[qubits:, word] & mask)
+            self.__multiply__(others[others != top], top)
+            rank += 1
+        reduced = tuple(
+            rows[qubits : qubits + rank].copy() for rows in (self.x, self.z, self.e)
+        )
+        self.x, self.z, self.e = saved[0].copy(), saved[1].copy(), saved[2].copy()
+        offset = np.array([self.__measure__(bit, 0) for bit in range(qubits)], np.uint8)
+        self.x, self.z, self.e = saved
+        return offset, reduced
+
+    def sample(self, shots: int = 1):
+        """Draws measurements of every qubit without collapsing the state.
+        Args:
+            shots (int): Number of measurements to draw.
+        Returns:
+            List[str]: Bits of every measured basis state, the highest bit first as
+                       measure returns them.
+        """
+        offset, (x, _, _) = self.__support__()
+        flips = np.unpackbits(x.view(np.uint8), axis=1, bitorder="little")
+        flips = flips[:, : self.qubits].astype(np.float32)
+        choices = (self.random.random((shots, len(flips))) < 0.5).astype(np.float32)
+        outcomes = (np.dot(choices, flips) % 2).astype(np.uint8) ^ offset
+        characters = (outcomes[:, ::-1] + ord("0")).astype(np.uint8)
+        return [row.tobytes().decode() for row in characters]
+
+    def marginal(self, qubits):
+        """Probabilities of the basis states of some of the qubits, summed over the rest.
+
+        The kept qubits are measured one after the other on copies of the tableau,
+        branching on both outcomes of every random measurement, each with a
+        probability of one half, so no dense state is made.
+
+        Args:
+            qubits (List[int]): Qubits to keep.
+        Returns:
+            np.array: Probability of each of the 2^k basis states of the kept qubits, with
+                      their bits in the same order as in the state.
+        """
+        bits = sorted(self.__bit__(qubit) for qubit in qubits)
+        saved = (self.x, self.z, self.e)
+        branches = [(saved, 0, 1.0)]
+        for position, bit in enumerate(bits):
+            word, mask = bit // 64, np.uint64(1) << np.uint64(bit % 64)
+            grown = []
+            for tableau, local, probability in branches:
+                random = bool(np.any(tableau[0][self.qubits :, word] & mask))
+                for outcome in (0, 1) if random else (None,):
+                    self.x, self.z, self.e = (rows.copy() for rows in tableau)
+                    measured = self.__measure__(bit, outcome)
+                    grown.append(
+                        (
+                            (self.x, self.z, self.e),
+                            local | measured << position,
+                            probability / 2 if random else probability,
+                        )
+                    )
+            branches = grown
+        self.x, self.z, self.e = saved
+        probabilities = np.zeros(2 ** len(bits))
+        for _, local, probability in branches:
+            probabilities[local] = probability
+        return probabilities
+
+    def __operator_matrix__(self, gate_queue):
+        for bits, images in gate_queue:
+            self.__conjugate__(bits, images)
+        return
+
+    def __multi_operator_matrix__(self, multi_gate_queue):
+        self.__operator_matrix__(multi_gate_queue)
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        self.__operator_matrix__(mcu_queue)
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        self.__operator_matrix__(diagonal_queue)
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        self.__operator_matrix__(permutation_queue)
+        return
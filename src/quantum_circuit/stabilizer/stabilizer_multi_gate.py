@@ -0,0 +1,144 @@
+import numpy as np
+from ...errors import NotCliffordGateError
+from ..interface import MultiGateInterface
+
+
+class StabilizerMultiGate(MultiGateInterface):
+    def __init__(self, qubits: int, big_endian: bool = False):
+        self.qubits = qubits
+        self.big_endian = big_endian
+        return
+
+    def __create_control_queue__(self, control: int, target: int, gate: np.array):
+        """Images of a controlled gate on its control and target.
+        Args:
+            control (int): Qubit to act as the control for the gate.
+            target (int): Qubit to act as the target for the gate.
+            gate (np.array): 2x2 gate applied when the control is set.
+        Returns:
+            List[(List[int], List[tuple])]: Bits of the gate with its images.
+        """
+        return self.__create_mcu_queue__([control], [target], gate)
+
+    def __create_mcu_queue__(self, controls, targets, gate: np.array):
+        """Images of a multi-controlled unitary, which is only Clifford on up to three
+        qubits or when it does nothing.
+        Args:
+            controls (List[int]): Qubits that all need to be set for the gate to act.
+            targets (List[int]): Qubits the gate acts on, the first one being the most
+                                 significant qubit of the gate.
+            gate (np.array): 2^k x 2^k gate where k is the number of targets.
+        Returns:
+            List[(List[int], List[tuple])]: Bits of the gate with its images.
+        """
+        qubits = list(controls) + list(targets)
+        if len(qubits) > 3:
+            if np.allclose(gate, np.identity(len(gate))):
+                return []
+            raise NotCliffordGateError(
+                "Gates on more than three qubits are not Clifford"
+            )
+        controlled = np.identity(2 ** len(qubits), "D")
+        controlled[-len(gate) :, -len(gate) :] = gate
+        return [
+            ([self.__bit__(qubit) for qubit in qubits], self.__images__(controlled))
+        ]
+
+    def __create_diagonal_queue__(self, qubits, diagonal: np.array):
+        """Images of a diagonal gate, which is Clifford when its phases are i to the
+        power of a quadratic form sum(a_j x_j) + 2 sum(b_jl x_j x_l) of the bits.
+        Args:
+            qubits (List[int]): Qubits the gate acts on, the first one being the most
+                                significant qubit of the gate.
+            diagonal (np.array): The 2^k diagonal entries of the gate.
+        Returns:
+            List[(List[int], List[tuple])]: Bits of the gate with its images.
+        """
+        diagonal = np.asarray(diagonal, "D")
+        key = ("diagonal", diagonal.tobytes())
+        if key not in self.cliffords:
+            size = len(qubits)
+            phases = diagonal / diagonal[0]
+            powers = np.round(np.angle(phases) / (np.pi / 2)).astype(int) % 4
+            if not np.allclose(phases, 1j**powers, atol=1e-6):
+                raise NotCliffordGateError("Diagonal gate is not Clifford")
+            bits = self.__bits__(size, np.arange(2**size)[:, None]).astype(int)
+            linear = powers[1 << np.arange(size - 1, -1, -1)]
+            pairs = np.zeros((size, size), int)
+            for first in range(size):
+                for second in range(first + 1, size):
+                    both = (1 << (size - 1 - first)) | (1 << (size - 1 - second))
+                    pairs[first, second] = (
+                        powers[both] - linear[first] - linear[second]
+                    ) % 4
+            if np.any(pairs % 2) or not np.array_equal(
+                (np.dot(bits, linear) + np.sum(np.dot(bits, pairs) * bits, axis=1)) % 4,
+                powers,
+            ):
+                raise NotCliffordGateError("Diagonal gate is not Clifford")
+            pairs = (pairs + pairs.T) // 2 == 1
+            images = []
+            for position in range(size):
+                unit = np.arange(size) == position
+                flip_z = pairs[position] | (unit & (linear[position] % 2 == 1))
+                images.append(
+                    (
+                        (int(linear[position]), unit, flip_z),
+                        (0, np.zeros(size, bool), unit),
+                    )
+                )
+            self.cliffords[key] = images
+        return [([self.__bit__(qubit) for qubit in qubits], self.cliffords[key])]
+
+    def __create_permutation_queue__(self, qubits, permutation: np.array):
+        """Images of a permutation gate, which is Clifford when it sends every basis
+        state x to A x xor c for an invertible matrix A of bits.
+        Args:
+            qubits (List[int]): Qubits the gate acts on, the first one being the most
+                                significant qubit of the gate.
+            permutation (np.array): Basis state each of the 2^k basis states is sent to.
+        Returns:
+            List[(List[int], List[tuple])]: Bits of the gate with its images.
+        """
+        permutation = np.asarray(permutation, np.int64)
+        key = ("permutation", permutation.tobytes())
+        if key not in self.cliffords:
+            size = len(qubits)
+            shift = permutation[0]
+            columns = permutation[1 << np.arange(size - 1, -1, -1)] ^ shift
+            indices = np.arange(2**size)
+            moved = np.full(indices.size, shift)
+            for position in range(size):
+                moved ^= np.where(
+                    indices >> (size - 1 - position) & 1, columns[position], 0
+                )
+            if not np.array_equal(moved, permutation):
+                raise NotCliffordGateError("Permutation gate is not Clifford")
+            matrix = (columns[None, :] >> np.arange(size - 1, -1, -1)[:, None]) & 1
+            matrix = matrix.astype(np.uint8)
+            inverse = np.identity(size, np.uint8)
+            for column in range(size):
+                pivot = column + np.flatnonzero(matrix[column:, column])[0]
+                matrix[[column, pivot]] = matrix[[pivot, column]]
+                inverse[[column, pivot]] = inverse[[pivot, column]]
+                for row in np.flatnonzero(matrix[:, column]):
+                    if row != column:
+                        matrix[row] ^= matrix[column]
+                        inverse[row] ^= inverse[column]
+            shift_bits = self.__bits__(size, shift)
+            images = []
+            for position in range(size):
+                flip_z = inverse[position] == 1
+                sign = 2 * int(np.sum(flip_z & shift_bits) % 2)
+                images.append(
+                    (
+                        (
+                            0,
+                            self.__bits__(size, columns[position]),
+                            np.zeros(size, bool),
+                        ),
+                        (sign, np.zeros(size, bool), flip_z),
+                    )
+                )
+            self.cliffords[key] = images
+        return [([self.__bit__(qubit) for qubit in qubits], self.cliffords[key])]
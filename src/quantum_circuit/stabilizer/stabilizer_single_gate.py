@@ -0,0 +1,99 @@
+import numpy as np
+from ...errors import NotCliffordGateError
+from ...quantum_gate import identity, paulix, pauliz
+from ..interface import SingleGateInterface
+
+
+class StabilizerSingleGate(SingleGateInterface):
+    def __init__(self, qubits: int, big_endian: bool = False):
+        self.qubits = qubits
+        self.big_endian = big_endian
+        self.cliffords = {}
+        return
+
+    def __pauli__(self, size: int, x: int, z: int) -> np.array:
+        """Matrix of the Pauli string X^x Z^z on a few qubits.
+        Args:
+            size (int): Number of qubits.
+            x (int): X bits, the first qubit being most significant.
+            z (int): Z bits, the first qubit being most significant.
+        Returns:
+            np.array: 2^size x 2^size matrix of the Pauli string.
+        """
+        matrix = np.ones((1, 1))
+        for bit in reversed(range(size)):
+            factor = np.identity(2)
+            if (x >> bit) & 1:
+                factor = np.dot(factor, paulix())
+            if (z >> bit) & 1:
+                factor = np.dot(factor, pauliz())
+            matrix = np.kron(matrix, factor)
+        return matrix
+
+    def __bits__(self, size: int, value: int) -> np.array:
+        """Bits of a value, the most significant first."""
+        return (value >> np.arange(size - 1, -1, -1)) & 1 == 1
+
+    def __images__(self, gate: np.array):
+        """Pauli strings a Clifford gate turns the X and Z of each of its qubits into.
+        Args:
+            gate (np.array): 2^k x 2^k gate, the first qubit being most significant.
+        Returns:
+            List[tuple]: For every qubit, the power of i with the x and z bits of the
+                         image of its X and of its Z.
+        """
+        gate = np.asarray(gate, "D")
+        key = ("matrix", gate.tobytes())
+        if key in self.cliffords:
+            return self.cliffords[key]
+        size = int(np.log2(len(gate)))
+        paulis = {
+            (x, z): self.__pauli__(size, x, z)
+            for x in range(2**size)
+            for z in range(2**size)
+        }
+        images = []
+        for position in range(size):
+            mask = 1 << (size - 1 - position)
+            pair = []
+            for generator in (paulis[(mask, 0)], paulis[(0, mask)]):
+                conjugated = np.dot(gate, np.dot(generator, gate.conj().T))
+                for (x, z), pauli in paulis.items():
+                    factor = np.trace(np.dot(pauli.conj().T, conjugated)) / len(gate)
+                    power = int(np.round(np.angle(factor) / (np.pi / 2))) % 4
+                    if np.allclose(conjugated, 1j**power * pauli, atol=1e-6):
+                        pair.append(
+                            (power, self.__bits__(size, x), self.__bits__(size, z))
+                        )
+                        break
+                else:
+                    raise NotCliffordGateError(f"Gate {gate.tolist()} is not Clifford")
+            images.append(tuple(pair))
+        self.cliffords[key] = images
+        return images
+
+    def __create_gate_queue__(self, qubits_to_apply, gate: np.array):
+        """Pairs every qubit the gate is applied to with the images of the gate.
+        Args:
+            qubits_to_apply (int/List[int]): Qubits to apply the gate to.
+            gate (np.array): 2x2 Clifford gate to apply.
+        Returns:
+            List[(List[int], List[tuple])]: Bit of every qubit with the gate's images.
+        """
+        if isinstance(qubits_to_apply, int):
+            qubits_to_apply = [qubits_to_apply]
+        images = self.__images__(gate)
+        return [([self.__bit__(qubit)], images) for qubit in qubits_to_apply]
+
+    def __custom_gate_queue__(self, gate_array):
+        """Keeps the images of every non identity gate of a per bit array of gates.
+        Args:
+            gate_array (List[np.array]): 2x2 gates where index i acts on bit i.
+        Returns:
+            List[(List[int], List[tuple])]: Bit of every gate with its images.
+        """
+        return [
+            ([bit], self.__images__(gate))
+            for bit, gate in enumerate(gate_array)
+            if not np.array_equal(gate, identity())
+        ]
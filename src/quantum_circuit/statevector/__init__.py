@@ -0,0 +1 @@
+from .statevector_calculator import StateVectorCalculator
@@ -0,0 +1,48 @@
+import numpy as np
+from ..interface import CalculatorInterface
+from .statevector_core import StateVectorCore
+from .statevector_single_gate import StateVectorSingleGate
+from .statevector_multi_gate import StateVectorMultiGate
+
+
+class StateVectorCalculator(
+    CalculatorInterface, StateVectorCore, StateVectorSingleGate, StateVectorMultiGate
+):
+    """Calculator that applies every gate directly onto the amplitudes of the state.
+
+    Gates are never expanded into 2^n x 2^n operators. Each 2x2 gate is applied to
+    the amplitude pairs that differ only in the target bit, which keeps every
+    gate at O(2^n) time and the memory at the size of the state itself. Given
+    more than one thread, every kernel splits its work across a shared pool.
+    """
+
+    def __init__(
+        self, qubits: int, big_endian: bool = False, prep: chr = "z", threads: int = 1
+    ):
+        StateVectorCore.__init__(self, qubits, big_endian, prep, threads)
+        StateVectorSingleGate.__init__(self, qubits, big_endian)
+        StateVectorMultiGate.__init__(self, qubits, big_endian)
+
+    def pass_single_gate(self, qubits_to_apply, gate: np.array):
+        self.__operator_matrix__(self.__create_gate_queue__(qubits_to_apply, gate))
+
+    def pass_custom_gate_queue(self, gate_queue):
+        self.__operator_matrix__(self.__custom_gate_queue__(gate_queue))
+
+    def pass_multi_gate(self, control: int, target: int, gate: np.array):
+        self.__multi_operator_matrix__(
+            self.__create_control_queue__(control, target, gate)
+        )
+
+    def pass_mcu_gate(self, controls, targets, gate: np.array):
+        self.__mcu_operator_matrix__(self.__create_mcu_queue__(controls, targets, gate))
+
+    def pass_diagonal_gate(self, qubits, diagonal: np.array):
+        self.__diagonal_operator_matrix__(
+            self.__create_diagonal_queue__(qubits, diagonal)
+        )
+
+    def pass_permutation_gate(self, qubits, permutation: np.array):
+        self.__permutation_operator_matrix__(
+            self.__create_permutation_queue__(qubits, permutation)
+        )
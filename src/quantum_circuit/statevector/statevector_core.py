@@ -0,0 +1,244 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from ...qubit import qubit
+from ...errors import OutOfRangeError
+from ..interface import CoreInterface
+
+
+class StateVectorCore(CoreInterface):
+    """Holds the state vector and the in-place kernels that update it.
+
+    The state is stored as a contiguous (2^n, 1) array. A kernel reshapes it so
+    that every bit it touches gets its own axis of length two, which turns the
+    amplitude pairs of a gate into two strided views of the same buffer.
+
+    With more than one thread, the view is also cut along the longest axis the
+    gate does not touch. The pieces share no amplitudes, so each one is updated
+    by its own thread while NumPy releases the GIL.
+    """
+
+    pools = {}
+    min_chunk = 2**14
+
+    def __init__(
+        self, qubits: int, big_endian: bool = False, prep: chr = "z", threads: int = 1
+    ):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        self.threads = threads
+        if threads > 1 and threads not in StateVectorCore.pools:
+            StateVectorCore.pools[threads] = ThreadPoolExecutor(threads)
+        if prep == "z":
+            self.state = np.zeros((2**qubits, 1), "F")
+            self.state[0] = 1
+        else:
+            self.state = qubit(prep)
+            for _ in range(qubits - 1):
+                self.state = np.kron(self.state, qubit(prep))
+        return
+
+    def __bit__(self, qubit: int) -> int:
+        """Position of a qubit inside of a basis state index.
+        Args:
+            qubit (int): Qubit of the quantum circuit.
+        Returns:
+            int: Bit that holds the qubit, with 0 being the least significant bit.
+        """
+        if qubit not in range(self.qubits):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        return self.qubits - 1 - qubit if self.big_endian else qubit
+
+    def __tensor__(self, bits):
+        """Reshapes the state so that each of the given bits has its own axis.
+        Args:
+            bits (List[int]): Bits of the basis state index to split out.
+        Returns:
+            (np.array, dict): View of the state and the axis of every given bit.
+        """
+        shape, axes = self.__shape__(bits)
+        return self.state.reshape(shape), axes
+
+    def __shape__(self, bits):
+        """Shape that gives each of the given bits its own axis of length two.
+        Args:
+            bits (List[int]): Bits of the basis state index to split out.
+        Returns:
+            (List[int], dict): Shape of the view and the axis of every given bit.
+        """
+        shape = []
+        axes = {}
+        previous = self.qubits
+        for bit in sorted(bits, reverse=True):
+            shape.append(2 ** (previous - bit - 1))
+            axes[bit] = len(shape)
+            shape.append(2)
+            previous = bit
+        shape.append(2**previous)
+        return shape, axes
+
+    def __run__(self, tensor, axes, kernel) -> None:
+        """Runs a kernel over a view of the state, split between the threads.
+        Args:
+            tensor (np.array): View of the state.
+            axes (dict): Axis of every bit the kernel touches.
+            kernel (Callable[[np.array], None]): Updates a piece of the view in place.
+        """
+        free = [axis for axis in range(tensor.ndim) if axis not in axes.values()]
+        axis = max(free, key=lambda free_axis: tensor.shape[free_axis])
+        pieces = min(
+            self.threads, tensor.shape[axis], max(1, tensor.size // self.min_chunk)
+        )
+        if pieces < 2:
+            kernel(tensor)
+            return
+        bounds = np.linspace(0, tensor.shape[axis], pieces + 1).astype(int)
+        chunks = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            index = [slice(None)] * tensor.ndim
+            index[axis] = slice(start, stop)
+            chunks.append(tensor[tuple(index)])
+        for future in [
+            StateVectorCore.pools[self.threads].submit(kernel, chunk)
+            for chunk in chunks
+        ]:
+            future.result()
+        return
+
+    def __apply_pair__(self, tensor, axis: int, gate) -> None:
+        """Applies a 2x2 gate in place onto the amplitude pairs of an axis.
+        Args:
+            tensor (np.array): View of the state.
+            axis (int): Axis of the target bit within the view.
+            gate (np.array): 2x2 gate to apply.
+        """
+        zero = tensor[(slice(None),) * axis + (0,)]
+        one = tensor[(slice(None),) * axis + (1,)]
+        zero_copy = zero.copy()
+        np.multiply(zero, gate[0][0], out=zero)
+        zero += gate[0][1] * one
+        np.multiply(one, gate[1][1], out=one)
+        one += gate[1][0] * zero_copy
+        return
+
+    def __apply_block__(self, tensor, axes, gate) -> None:
+        """Applies a 2^k x 2^k gate in place onto the amplitudes along k axes.
+        Args:
+            tensor (np.array): View of the state.
+            axes (List[int]): Axis of every target bit, the first one being the most
+                              significant bit of the gate.
+            gate (np.array): 2^k x 2^k gate to apply.
+        """
+        size = len(axes)
+        result = np.tensordot(
+            gate.reshape((2,) * 2 * size), tensor, (list(range(size, 2 * size)), axes)
+        )
+        tensor[...] = np.moveaxis(result, list(range(size)), axes)
+        return
+
+    def __operator_matrix__(self, gate_queue):
+        for bit, gate in gate_queue:
+            tensor, axes = self.__tensor__([bit])
+            self.__run__(
+                tensor, axes, lambda chunk: self.__apply_pair__(chunk, axes[bit], gate)
+            )
+        return
+
+    def __multi_operator_matrix__(self, multi_gate_queue):
+        control_bit, target_bit, gate = multi_gate_queue
+        tensor, axes = self.__tensor__([control_bit, target_bit])
+        index = [slice(None)] * tensor.ndim
+        index[axes[control_bit]] = 1
+        target_axis = axes[target_bit] - (axes[control_bit] < axes[target_bit])
+        self.__run__(
+            tensor,
+            axes,
+            lambda chunk: self.__apply_pair__(chunk[tuple(index)], target_axis, gate),
+        )
+        return
+
+    def __mcu_operator_matrix__(self, mcu_queue):
+        control_bits, target_bits, gate = mcu_queue
+        tensor, axes = self.__tensor__(control_bits + target_bits)
+        index = [slice(None)] * tensor.ndim
+        for bit in control_bits:
+            index[axes[bit]] = 1
+        target_axes = [
+            axes[target] - sum(axes[control] < axes[target] for control in control_bits)
+            for target in target_bits
+        ]
+
+        def kernel(chunk):
+            chunk = chunk[tuple(index)]
+            if len(target_bits) == 1:
+                self.__apply_pair__(chunk, target_axes[0], gate)
+                return
+            self.__apply_block__(chunk, target_axes, gate)
+
+        self.__run__(tensor, axes, kernel)
+        return
+
+    def __diagonal_operator_matrix__(self, diagonal_queue):
+        bits, diagonal = diagonal_queue
+        tensor, axes = self.__tensor__(bits)
+        order = sorted(range(len(bits)), key=lambda position: axes[bits[position]])
+        shape = [1] * tensor.ndim
+        for bit in bits:
+            shape[axes[bit]] = 2
+        phases = diagonal.reshape((2,) * len(bits)).transpose(order).reshape(shape)
+        self.__run__(tensor, axes, lambda chunk: np.multiply(chunk, phases, out=chunk))
+        return
+
+    def __permutation_operator_matrix__(self, permutation_queue):
+        bits, permutation = permutation_queue
+        tensor, axes = self.__tensor__(bits)
+        shape = (2,) * len(bits)
+        sources = np.flatnonzero(permutation != np.arange(permutation.size))
+        inverse = np.argsort(permutation)
+
+        def kernel(chunk):
+            moved = np.moveaxis(
+                chunk, [axes[bit] for bit in bits], list(range(len(bits)))
+            )
+            if permutation.size > 16:
+                amplitudes = moved.reshape(permutation.size, -1)
+                moved[...] = amplitudes[inverse].reshape(moved.shape)
+                return
+            copies = [
+                moved[np.unravel_index(source, shape)].copy() for source in sources
+            ]
+            for source, amplitudes in zip(sources, copies):
+                moved[np.unravel_index(permutation[source], shape)] = amplitudes
+
+        self.__run__(tensor, axes, kernel)
+        return
+
+    def collapse(self, qubit: int, draw: float, reset: bool = False) -> int:
+        """Measures a qubit, keeping the half of the state that agrees with the outcome.
+
+        The half of the amplitudes where the bit of the qubit disagrees is zeroed and
+        the other half is renormalized, both through views of the state in place.
+
+        Args:
+            qubit (int): Qubit to measure.
+            draw (float): Uniform draw in [0, 1) that picks the outcome.
+            reset (bool): Flag to flip the qubit back to 0 after measuring it.
+        Returns:
+            int: Outcome of the measurement.
+        """
+        bit = self.__bit__(qubit)
+        tensor, _ = self.__tensor__([bit])
+        zero, one = tensor[:, 0], tensor[:, 1]
+        probability = float(np.sum(np.square(np.abs(one))))
+        outcome = int(draw < probability)
+        kept, dropped = (one, zero) if outcome else (zero, one)
+        kept *= 1 / np.sqrt(probability if outcome else 1 - probability)
+        if reset and outcome:
+            zero[...] = one
+            one[...] = 0
+        else:
+            dropped[...] = 0
+        return outcome
+
+    def __set_state__(self, state_to_store):
+        self.state = np.array(state_to_store, "F").reshape(2**self.qubits, 1)
+        return
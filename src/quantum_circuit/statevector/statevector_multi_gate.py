@@ -0,0 +1,64 @@
+import numpy as np
+from ..interface import MultiGateInterface
+
+
+class StateVectorMultiGate(MultiGateInterface):
+    def __init__(self, qubits: int, big_endian: bool = False):
+        self.qubits = qubits
+        self.big_endian = big_endian
+        return
+
+    def __create_control_queue__(
+        self, control_qubit: int, target_qubit: int, gate: np.array
+    ):
+        """Resolves the bits of a controlled gate.
+        Args:
+            control_qubit (int): Qubit to act as the control for the gate.
+            target_qubit (int): Qubit to act as the target for the gate.
+            gate (np.array): 2x2 gate applied when the control is set.
+        Returns:
+            List: Control bit, target bit and the gate to apply.
+        """
+        return [
+            self.__bit__(control_qubit),
+            self.__bit__(target_qubit),
+            np.asarray(gate, "F"),
+        ]
+
+    def __create_mcu_queue__(self, controls, targets, gate: np.array):
+        """Resolves the bits of a multi-controlled unitary.
+        Args:
+            controls (List[int]): Qubits that all need to be set for the gate to act.
+            targets (List[int]): Qubits the gate acts on, the first one being the most
+                                 significant qubit of the gate.
+            gate (np.array): 2^k x 2^k gate where k is the number of targets.
+        Returns:
+            List: Control bits, target bits and the gate to apply.
+        """
+        return [
+            [self.__bit__(control) for control in controls],
+            [self.__bit__(target) for target in targets],
+            np.asarray(gate, "F"),
+        ]
+
+    def __create_diagonal_queue__(self, qubits, diagonal: np.array):
+        """Resolves the bits a diagonal gate multiplies the phases of.
+        Args:
+            qubits (List[int]): Qubits the gate acts on, the first one being the most
+                                significant qubit of the gate.
+            diagonal (np.array): The 2^k diagonal entries of the gate.
+        Returns:
+            List: Bit of every qubit and the diagonal entries to multiply by.
+        """
+        return [[self.__bit__(qubit) for qubit in qubits], np.asarray(diagonal)]
+
+    def __create_permutation_queue__(self, qubits, permutation: np.array):
+        """Resolves the bits a permutation gate moves the amplitudes along.
+        Args:
+            qubits (List[int]): Qubits the gate acts on, the first one being the most
+                                significant qubit of the gate.
+            permutation (np.array): Basis state each of the 2^k basis states is sent to.
+        Returns:
+            List: Bit of every qubit and the permutation to apply.
+        """
+        return [[self.__bit__(qubit) for qubit in qubits], np.asarray(permutation)]
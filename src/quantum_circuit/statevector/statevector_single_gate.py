@@ -0,0 +1,37 @@
+import numpy as np
+from ...quantum_gate import identity
+from ..interface import SingleGateInterface
+
+
+class StateVectorSingleGate(SingleGateInterface):
+
+    def __init__(self, qubits: int, big_endian: bool = False):
+        self.qubits = qubits
+        self.big_endian = big_endian
+        return
+
+    def __create_gate_queue__(self, qubits_to_apply, gate: np.array):
+        """Pairs every qubit the gate is applied to with the bit that holds it.
+        Args:
+            qubits_to_apply (int/List[int]): Qubits to apply the gate to.
+            gate (np.array): 2x2 gate to apply.
+        Returns:
+            List[(int, np.array)]: Bits with the gate to apply on each.
+        """
+        if isinstance(qubits_to_apply, int):
+            qubits_to_apply = [qubits_to_apply]
+        gate = np.asarray(gate, "F")
+        return [(self.__bit__(qubit), gate) for qubit in qubits_to_apply]
+
+    def __custom_gate_queue__(self, gate_array):
+        """Keeps every non identity gate of a per bit array of gates.
+        Args:
+            gate_array (List[np.array]): 2x2 gates where index i acts on bit i.
+        Returns:
+            List[(int, np.array)]: Bits with the gate to apply on each.
+        """
+        return [
+            (bit, np.asarray(gate, "F"))
+            for bit, gate in enumerate(gate_array)
+            if not np.array_equal(gate, identity())
+        ]
@@ -0,0 +1 @@
+from .trajectory_calculator import TrajectoryCalculator
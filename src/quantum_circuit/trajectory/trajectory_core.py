@@ -0,0 +1,104 @@
+import numpy as np
+from collections import Counter
+from ..batch.batch_core import BatchCore
+
+
+class TrajectoryCore(BatchCore):
+    """Holds a batch of state vectors that each follow one trajectory of a noisy circuit.
+
+    The trajectories are the members of a batch, so every kernel of the statevector
+    engine runs on all of them at once. A channel picks one of its Kraus operators
+    for every trajectory, with the probability that operator has on that trajectory,
+    and applies the picked operators in one batched pass, so the cost grows with the
+    size of the batch instead of a Python loop over the trajectories.
+    """
+
+    def __init__(
+        self,
+        qubits: int,
+        big_endian: bool = False,
+        prep: chr = "z",
+        noise=None,
+        trajectories: int = 1,
+    ):
+        BatchCore.__init__(self, qubits, big_endian, prep, trajectories)
+        self.noise = noise
+        self.trajectories = trajectories
+        return
+
+    def __kraus__(self, bit: int, kraus) -> None:
+        """Applies a channel on a bit of every trajectory, through one of its Kraus
+           operators picked for each trajectory.
+        Args:
+            bit (int): Bit the channel acts on.
+            kraus (np.array): Stack of 2x2 Kraus operators of the channel.
+        """
+        tensor, axes = self.__tensor__([bit])
+        zero = tensor[:, :, 0]
+        one = tensor[:, :, 1]
+        populations = np.sum(np.abs(tensor) ** 2, axis=(1, 3))
+        coherences = np.sum(zero * one.conj(), axis=(1, 2))
+        reduced = np.empty((self.trajectories, 2, 2), complex)
+        reduced[:, 0, 0] = populations[:, 0]
+        reduced[:, 1, 1] = populations[:, 1]
+        reduced[:, 0, 1] = coherences
+        reduced[:, 1, 0] = coherences.conj()
+        weights = np.einsum("kji,kjl,bli->bk", kraus.conj(), kraus, reduced).real
+        weights = np.clip(weights, 0, None)
+        draws = (
+            self.random.random((self.trajectories, 1)) * weights.sum(axis=1)[:, None]
+        )
+        picked = np.minimum(
+            (np.cumsum(weights, axis=1) < draws).sum(axis=1), len(kraus) - 1
+        )
+        norms = np.sqrt(weights[np.arange(self.trajectories), picked])
+        gates = kraus[picked] / np.where(norms > 0, norms, 1)[:, None, None]
+        self.__apply_pair__(tensor, axes[bit], gates.astype("F"))
+        return
+
+    def __noise__(self, bits, gate_type: str) -> None:
+        """Applies the channels attached to a type of gate on every bit it touched.
+        Args:
+            bits (List[int]): Bits the gate acted on.
+            gate_type (str): "single" or "multi".
+        """
+        if self.noise is None:
+            return
+        for kraus in self.noise.channels[gate_type]:
+            for bit in sorted(set(bits)):
+                self.__kraus__(bit, kraus)
+        return
+
+    def probabilities(self):
+        """Probability of reading out every basis state averaged over the trajectories,
+           readout errors included.
+        Returns:
+            np.array: Probability of every basis state.
+        """
+        probabilities = np.mean(np.abs(self.state) ** 2, axis=0).astype(float)
+        if self.noise is None:
+            return probabilities
+        return self.noise.read(probabilities)
+
+    def sample(self, shots: int = 1):
+        """Reads out the qubits, readout errors included.
+        Args:
+            shots (int): Number of times to read out the qubits.
+        Returns:
+            List[str]: Basis state of every shot, the most significant bit first.
+        """
+        probabilities = np.clip(self.probabilities(), 0, None)
+        outcomes = self.random.choice(
+            probabilities.size, shots, p=probabilities / probabilities.sum()
+        )
+        return [bin(outcome)[2:].zfill(self.qubits) for outcome in outcomes]
+
+    def counts(self, shots: int = None) -> dict:
+        """Number of times every basis state is read out.
+        Args:
+            shots (int): Number of times to read out the qubits, once per trajectory
+                         when None.
+        Returns:
+            dict: Number of shots of every basis state read out at least once.
+        """
+        return dict(Counter(self.sample(shots or self.trajectories)))
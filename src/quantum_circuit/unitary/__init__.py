@@ -0,0 +1 @@
+from .unitary_calculator import UnitaryCalculator
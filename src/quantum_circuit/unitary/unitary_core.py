@@ -0,0 +1,47 @@
+import numpy as np
+from ..batch.batch_core import BatchCore
+
+
+class UnitaryCore(BatchCore):
+    """Holds the unitary of a circuit as the batch of state vectors of its columns.
+
+    Column j of the unitary is the state the circuit sends basis state j to, so the
+    identity is evolved as a batch of 2^n state vectors. Every kernel of the
+    statevector engine runs on all of them at once, which keeps a gate at O(4^n)
+    instead of the O(8^n) of multiplying 2^n x 2^n operators.
+
+    Unitaries are cached by the gates that built them, shared by every circuit.
+    """
+
+    cache = {}
+    max_cached = 32
+
+    def __init__(self, qubits: int, big_endian: bool = False, prep: chr = "z"):
+        self.big_endian = big_endian
+        self.qubits = qubits
+        self.threads = 1
+        self.batch = 2**qubits
+        self.state = np.identity(2**qubits, "F")
+        return
+
+    @property
+    def state(self):
+        """Unitary of every gate applied so far as a 2^n x 2^n array."""
+        return self.states.T
+
+    @state.setter
+    def state(self, state_to_store):
+        self.states = np.array(np.asarray(state_to_store, "F").T, "F", order="C")
+
+    def store(self, key: str) -> None:
+        """Caches the unitary under the key of the gates that built it.
+        Args:
+            key (str): Key of the gates that built the unitary.
+        """
+        if (
+            key not in UnitaryCore.cache
+            and len(UnitaryCore.cache) >= UnitaryCore.max_cached
+        ):
+            UnitaryCore.cache.pop(next(iter(UnitaryCore.cache)))
+        UnitaryCore.cache[key] = self.state.copy()
+        return
@@ -2,6 +2,18 @@ import numpy as np
 from numpy.typing import NDArray
 
 
+def _broadcast(rows) -> NDArray:
+    """Matrix whose entries may be arrays of parameters, stacked along leading axes.
+    Args:
+        rows (List[List]): Entries of the matrix, each a number or an array.
+    Returns:
+        NDArray: (..., rows, columns) stack with one matrix per set of parameters.
+    """
+    entries = np.broadcast_arrays(*[entry for row in rows for entry in row])
+    stacked = np.moveaxis(np.array(entries, complex), 0, -1)
+    return np.array(stacked.reshape(entries[0].shape + (len(rows), len(rows[0]))), "F")
+
+
 def identity() -> NDArray:
     """Identity gate as a 2x2 matrix.
 
@@ -75,12 +87,14 @@ def phase(theta: float = np.pi / 2) -> NDArray:
             [0, e^(i * θ)]
     ```
     Args:
-        theta (float, optional): Angle of vector. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Angle of vector, an array gives one gate per
+                                         angle. Defaults to np.pi/2.
 
     Returns:
         NDArray: Matrix representation of the phase gate.
     """
-    return np.array([[1 + 0j, 0 + 0j], [0 + 0j, np.exp(0 + 1j * theta)]], "F")
+    theta = np.asarray(theta)
+    return _broadcast([[1 + 0j, 0 + 0j], [0 + 0j, np.exp(0 + 1j * theta)]])
 
 
 def s() -> NDArray:
@@ -143,17 +157,18 @@ def rz(theta: float = np.pi / 2) -> NDArray:
           [0,  e^(i * (θ / 2))]
     ```
     Args:
-        theta (float, optional): Angle of vector. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Angle of vector, an array gives one gate per
+                                         angle. Defaults to np.pi/2.
 
     Returns:
         NDArray: Matrix representation of the RZ gate.
     """
-    return np.array(
+    theta = np.asarray(theta)
+    return _broadcast(
         [
             [np.exp((0 - 1j * (theta / 2))), 0 + 0j],
             [0 + 0j, np.exp(0 + 1j * (theta / 2))],
-        ],
-        "F",
+        ]
     )
 
 
@@ -165,17 +180,18 @@ def rx(theta: float = np.pi / 2) -> NDArray:
           [-i * sin(θ / 2),  cos((θ / 2))]
     ```
     Args:
-        theta (float, optional): Angle of vector. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Angle of vector, an array gives one gate per
+                                         angle. Defaults to np.pi/2.
 
     Returns:
         NDArray: Matrix representation of the RX gate.
     """
-    return np.array(
+    theta = np.asarray(theta)
+    return _broadcast(
         [
             [np.cos(theta / 2), 0 - 1j * np.sin(theta / 2)],
             [0 - 1j * np.sin(theta / 2), np.cos(theta / 2)],
-        ],
-        "F",
+        ]
     )
 
 
@@ -188,17 +204,18 @@ def ry(theta: float = np.pi / 2) -> NDArray:
          [sin(θ / 2),  cos((θ / 2))]
     ```
     Args:
-        theta (float, optional): Angle of vector. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Angle of vector, an array gives one gate per
+                                         angle. Defaults to np.pi/2.
 
     Returns:
         NDArray: Matrix representation of the RY gate.
     """
-    return np.array(
+    theta = np.asarray(theta)
+    return _broadcast(
         [
             [np.cos(theta / 2), -1 * np.sin(theta / 2)],
             [np.sin(theta / 2), np.cos(theta / 2)],
-        ],
-        "F",
+        ]
     )
 
 
@@ -238,22 +255,24 @@ def u(
         [e^(i * φ) * sin(θ / 2), e^(i * (λ + φ)) * cos(θ / 2)]
     ```
     Args:
-        theta (float, optional): Rotation angle (0 to π) determining the degree of rotation. Defaults to np.pi/2.
-        phi (float, optional): Phase shift affecting the qubit's state on the Bloch sphere. Defaults to np.pi/2.
-        lmbda (float, optional): Additional phase shift influencing interference patterns. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Rotation angle (0 to π) determining the degree of rotation. Defaults to np.pi/2.
+        phi (float/NDArray, optional): Phase shift affecting the qubit's state on the Bloch sphere. Defaults to np.pi/2.
+        lmbda (float/NDArray, optional): Additional phase shift influencing interference patterns. Defaults to np.pi/2.
+
+        Arrays of parameters broadcast against each other and give one gate per set.
 
     Returns:
         NDArray: Matrix representation of the U gate.
     """
-    return np.array(
+    theta, phi, lmbda = np.asarray(theta), np.asarray(phi), np.asarray(lmbda)
+    return _broadcast(
         [
             [np.cos(theta / 2), -1 * np.exp(0 + 1j * lmbda) * np.sin(theta / 2)],
             [
                 np.exp(0 + 1j * phi) * np.sin(theta / 2),
                 np.exp(0 + 1j * (lmbda + phi)) * np.cos(theta / 2),
             ],
-        ],
-        "F",
+        ]
     )
 
 
@@ -361,19 +380,20 @@ def rxx(theta: float = np.pi / 2) -> NDArray:
                 [-i * sin(θ / 2), 0, 0, cos(θ / 2)]
     ```
     Args:
-        theta (float, optional): Rotation angle. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Rotation angle, an array gives one gate per
+                                         angle. Defaults to np.pi/2.
 
     Returns:
         NDArray: Matrix representation of the RXX gate.
     """
-    return np.array(
+    theta = np.asarray(theta)
+    return _broadcast(
         [
             [np.cos(theta / 2), 0 + 0j, 0 + 0j, 0 - 1j * np.sin(theta / 2)],
             [0 + 0j, np.cos(theta / 2), 0 - 1j * np.sin(theta / 2), 0 + 0j],
             [0 + 0j, 0 - 1j * np.sin(theta / 2), np.cos(theta / 2), 0 + 0j],
             [0 - 1j * np.sin(theta / 2), 0 + 0j, 0 + 0j, np.cos(theta / 2)],
-        ],
-        "F",
+        ]
     )
 
 
@@ -387,19 +407,20 @@ def rzz(theta: float = np.pi / 2) -> NDArray:
           [0, 0, 0, e^(-i * (θ / 2))]
     ```
     Args:
-        theta (float, optional): Rotation angle. Defaults to np.pi/2.
+        theta (float/NDArray, optional): Rotation angle, an array gives one gate per
+                                         angle. Defaults to np.pi/2.
 
     Returns:
         NDArray: Matrix representation of the RZZ gate.
     """
-    return np.array(
+    theta = np.asarray(theta)
+    return _broadcast(
         [
             [np.exp(0 - 1j * (theta / 2)), 0 + 0j, 0 + 0j, 0 + 0j],
             [0 + 0j, np.exp(0 + 1j * (theta / 2)), 0 + 0j, 0 + 0j],
             [0 + 0j, 0 + 0j, np.exp(0 + 1j * (theta / 2)), 0 + 0j],
             [0 + 0j, 0 + 0j, 0 + 0j, np.exp(0 - 1j * (theta / 2))],
-        ],
-        "F",
+        ]
     )
 
 
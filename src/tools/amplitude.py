@@ -1,4 +1,4 @@
-from numpy import arcsin, around, power, sqrt, log2, ndarray
+from numpy import abs, arcsin, around, log2, ndarray
 from numpy.typing import NDArray
 from .base import convert_state
 from typing import Union
@@ -11,8 +11,16 @@ def amplitude(
     show_bit: Union[int, str] = -1,
     rounds: int = 3,
     radian: bool = False,
+    raw: bool = False,
+    out: ndarray = None,
 ) -> NDArray:
     """Outputs the amplitude of a quantum circuit state.
+
+    A single bit is read from the calculator on its own when it can give one
+    amplitude, such as a matrix product state, without making the whole state.
+    With raw, the amplitudes are read from a view of the state of the calculator,
+    neither copied nor rounded, and only the output is rounded.
+
     ```
     from qcpy import quantumcircuit, amplitude
     amplitude(quantumcircuit(qubits = 2)
@@ -22,40 +30,49 @@ def amplitude(
         show_bit: (str/int, optional): Can specify showing a single value from the state. Defaults to -1.
         round: (int, optional): Rounds the amplitude array by a given value. Defaults to 3.
         radian: (bool, true): Can represent the amplitude array in radians or not. Defaults to true.
+        raw: (bool, optional): Reads the state without copying or rounding it. Defaults to False.
+        out: (ndarray, optional): Float array of the size of the state to write the
+                                  amplitude array into. Defaults to None.
     Returns:
         NDArray: Amplitude array from given state.
     """
-    state = convert_state(quantumstate)
-    size = int(log2(state.size))
-
     if rounds < 0:
-        raise RoundBelowZeroError(f"Cannot round to {round} needs to be 0 or greater")
+        raise RoundBelowZeroError(f"Cannot round to {rounds} needs to be 0 or greater")
 
-    if isinstance(show_bit, int) and show_bit < 0:
-        amplitude = sqrt(power(state.real, 2) + power(state.imag, 2))
+    if isinstance(show_bit, str):
+        show_bit = int(show_bit, 2)
 
-    elif isinstace(show_bit, str):
-        amplitude = int(show_bit, 2)
-        if 2**size <= amplitude:
+    if (
+        show_bit >= 0
+        and isinstance(quantumstate, QuantumCircuit)
+        and hasattr(quantumstate.backend, "amplitude")
+    ):
+        backend = quantumstate.backend
+        if 2**backend.qubits <= show_bit:
             raise OutOfRangeError(
                 f"Cannot show bit of value {show_bit} as it is out of range"
             )
-        amplitude = sqrt(
-            power(state[amplitude].real, 2) + power(state[amplitude].imag, 2)
-        )
+        amplitude = abs(backend.amplitude(show_bit))
+        if radian:
+            amplitude = arcsin(amplitude) * 2
+        return around(amplitude, decimals=rounds)
+
+    state = convert_state(quantumstate, raw)
+    size = int(log2(state.size))
 
-    elif isinstance(show_bit, int):
-        amplitude = show_bit
-        if 2**size <= amplitude:
+    if show_bit >= 0:
+        if 2**size <= show_bit:
             raise OutOfRangeError(
                 f"Cannot show bit of value {show_bit} as it is out of range"
             )
-        amplitude = sqrt(
-            power(quantumstate[amplitude].real, 2)
-            + power(quantumstate[amplitude].imag, 2)
-        )
+        amplitude = abs(state[show_bit])
+        if radian:
+            amplitude = arcsin(amplitude) * 2
+        return around(amplitude, decimals=rounds)
 
+    amplitude = abs(state, out=out)
     if radian:
-        amplitude = arcsin(amplitude) * 2
+        arcsin(amplitude, out=amplitude)
+        amplitude *= 2
 
-    return around(amplitude, decimals=rounds)
+    return around(amplitude, decimals=rounds, out=amplitude)
@@ -1,11 +1,24 @@
 import numpy as np
 
 
-def convert_state(to_convert) -> np.array:
+def convert_state(to_convert, raw: bool = False) -> np.array:
+    """Flattens a state, or the state of a quantum circuit, for the tools.
+    Args:
+        to_convert (ndarray/quantumcircuit): State to flatten.
+        raw (bool): Flag to return a read-only view of the state as it is, instead
+                    of a copy rounded to log2(N) decimals.
+    Returns:
+        np.array: Flat state.
+    """
     from ... import quantumcircuit
 
     if isinstance(to_convert, quantumcircuit):
         to_convert = to_convert.state
 
+    if raw:
+        view = np.asarray(to_convert).reshape(-1).view()
+        view.flags.writeable = False
+        return view
+
     to_convert = to_convert.flatten()
     return np.around(to_convert, int(np.log2(to_convert.size)))
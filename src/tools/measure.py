@@ -1,23 +1,97 @@
 from typing import Union
-from numpy import arange, log2, ndarray, random
+from numpy import (
+    abs,
+    array,
+    asarray,
+    cumsum,
+    log2,
+    minimum,
+    ndarray,
+    random,
+    searchsorted,
+    sort,
+    square,
+    unique,
+)
 from ..quantum_circuit import QuantumCircuit
-from .base import convert_state
-from .probability import probability
+from ..errors import InvalidProbability
 
 
-def measure(quantumstate: Union[QuantumCircuit, ndarray]) -> str:
+def measure(
+    quantumstate: Union[QuantumCircuit, ndarray],
+    shots: int = None,
+    counts: bool = True,
+):
     """Outputs the measure of a quantum circuit state.
+
+    The probability of every basis state is computed once, and every shot is then
+    drawn at once by a search of sorted uniform draws in the cumulative
+    probabilities, which walks the probabilities in order instead of at random.
+    The shots of a circuit are drawn from its own generator, so a circuit built
+    with a seed reads out the same shots every time.
+
     ```
     from qcpy import quantumcircuit, measure
     measure(quantumcircuit(qubits = 2))
+    measure(quantumcircuit(qubits = 2), shots = 1000)
     ```
+    Args:
+        quantumstate (ndarray/quantumcircuit, required): State to read out. No default.
+        shots (int, optional): Number of times to read out the state, once with a
+                               single basis state returned when not given.
+                               Defaults to None.
+        counts (bool, optional): Returns how many times every basis state was read out
+                                 when true, or the basis state index of every shot.
+                                 Defaults to True.
     Returns:
-        NDArray: Amplitude array from given state.
+        str/List[str]/dict/np.array: Basis state read out, or the one of every member
+                                     of a batch, for a single read out. Counts of every
+                                     basis state read out, or the basis state index of
+                                     every shot, for many shots.
     """
-    state = convert_state(quantumstate)
+    if isinstance(quantumstate, QuantumCircuit) and hasattr(
+        quantumstate.backend, "sample"
+    ):
+        if shots is None:
+            return quantumstate.backend.sample()[0]
+        outcomes = array(quantumstate.backend.sample(shots))
+        return _tally(outcomes.T, counts)
+    generator = random
+    if isinstance(quantumstate, QuantumCircuit):
+        generator = quantumstate.random
+        quantumstate = quantumstate.state
+    state = asarray(quantumstate).reshape(-1)
     size = int(log2(state.size))
-    probabilities = probability(state, round=size)
-    final_state = random.choice(arange(len(state), dtype=int), 1, p=probabilities)
-    final_state = str(bin(final_state[0]))[2:]
-    final_state = final_state.zfill(size)
-    return final_state
+    cumulative = cumsum(square(abs(state)), dtype=float)
+    if abs(cumulative[-1] - 1) > 1e-3:
+        raise InvalidProbability("Probability is invalid and is not equal to 100%")
+    draws = sort(generator.random(1 if shots is None else shots)) * cumulative[-1]
+    outcomes = minimum(searchsorted(cumulative, draws, side="right"), state.size - 1)
+    if shots is None:
+        return bin(outcomes[0])[2:].zfill(size)
+    if not counts:
+        generator.shuffle(outcomes)
+        return outcomes
+    indices, times = unique(outcomes, return_counts=True)
+    bits = [format(index, f"0{size}b") for index in indices.tolist()]
+    return dict(zip(bits, times.tolist()))
+
+
+def _tally(outcomes: ndarray, counts: bool):
+    """Counts or indexes basis states read out by a calculator.
+    Args:
+        outcomes (np.array): Basis state of every shot, or (B, shots) basis states of
+                             every member of a batch, as bit strings.
+        counts (bool): Counts every basis state when true, or indexes every shot.
+    Returns:
+        dict/List[dict]/np.array: Counts of every basis state, for every member of a
+                                  batch, or the basis state index of every shot.
+    """
+    if not counts:
+        return array([int(outcome, 2) for outcome in outcomes.reshape(-1)]).reshape(
+            outcomes.shape
+        )
+    if outcomes.ndim > 1:
+        return [_tally(member, counts) for member in outcomes]
+    bits, times = unique(outcomes, return_counts=True)
+    return {str(bit): int(time) for bit, time in zip(bits, times)}
@@ -1,4 +1,4 @@
-from numpy import angle, around, mod, pi, log2, ndarray
+from numpy import arctan2, around, mod, pi, log2, ndarray
 from numpy.typing import NDArray
 from .base import convert_state
 from typing import Union
@@ -11,9 +11,14 @@ def phase_angle(
     show_bit: Union[str, int] = -1,
     round: int = 3,
     radian: bool = True,
+    raw: bool = False,
+    out: ndarray = None,
 ) -> NDArray:
     """Outputs the phase angle of a quantum circuit state.
 
+    With raw, the phase angles are read from a view of the state of the calculator,
+    neither copied nor rounded, and only the output is rounded.
+
     ```
     from qcpy import quantumcircuit, phaseangle
     phaseangle(quantumcircuit(qubits = 2)
@@ -23,35 +28,32 @@ def phase_angle(
         show_bit: (str/int, optional): Can specify showing a single value from the state. Defaults to -1.
         round: (int, optional): Rounds the phase angle array by a given value. Defaults to 3.
         radian: (bool, true): Can represent the phase angle array in radians or not. Defaults to true.
+        raw: (bool, optional): Reads the state without copying or rounding it. Defaults to False.
+        out: (ndarray, optional): Float array of the size of the state to write the
+                                  phase angle array into. Defaults to None.
     Returns:
         NDArray: Phase angle array from given state.
     """
-    state = convert_state(quantumstate)
-    size = int(log2(quantumstate.size))
-
     if round < 0:
         raise RoundBelowZeroError(f"Cannot round to {round} needs to be 0 or greater")
 
-    if isinstance(show_bit, int) and show_bit < 0:
-        phaseangle = mod(angle(state), 2 * pi) * (180 / pi)
+    state = convert_state(quantumstate, raw)
+    size = int(log2(state.size))
 
-    elif isinstance(show_bit, str):
-        phaseangle = int(show_bit, 2)
-        if 2**size <= phase_angle:
-            raise OutOfRangeError(
-                f"Cannot show bit of value {show_bit} as it is out of range"
-            )
-        phaseangle = mod(angle(state[phaseangle]), 2 * pi) * (180 / pi)
+    if isinstance(show_bit, str):
+        show_bit = int(show_bit, 2)
 
-    elif isinstance(show_bit, int):
-        phaseangle = show_bit
-        if 2**size <= phase_angle:
+    if show_bit >= 0:
+        if 2**size <= show_bit:
             raise OutOfRangeError(
                 f"Cannot show bit of value {show_bit} as it is out of range"
             )
-        phaseangle = mod(angle(state[phaseangle]), 2 * pi) * (180 / pi)
+        state = state[show_bit : show_bit + 1]
 
-    if radian:
-        phaseangle *= pi / 180
+    phaseangle = arctan2(state.imag, state.real, out=None if show_bit >= 0 else out)
+    mod(phaseangle, 2 * pi, out=phaseangle)
+    if not radian:
+        phaseangle *= 180 / pi
+    around(phaseangle, decimals=round, out=phaseangle)
 
-    return around(phaseangle, decimals=round)
+    return phaseangle[0] if show_bit >= 0 else phaseangle
@@ -1,6 +1,15 @@
-from numpy import abs, around, multiply, square, log2, ndarray
+from numpy import (
+    abs,
+    allclose,
+    around,
+    asarray,
+    multiply,
+    square,
+    log2,
+    ndarray,
+)
 from numpy.typing import NDArray
-from typing import Union
+from typing import List, Union
 from .base import convert_state
 from ..quantum_circuit import QuantumCircuit
 from ..errors import InvalidProbability, RoundBelowZeroError, OutOfRangeError
@@ -11,36 +20,124 @@ def probability(
     show_percent: bool = False,
     show_bit: int = -1,
     round: int = 3,
+    qubits: List[int] = None,
+    raw: bool = False,
+    out: ndarray = None,
 ) -> NDArray:
     """Outputs the probability of a quantum circuit state.
 
+    A circuit whose calculator reads out its own probabilities, such as a batch of
+    states or a density matrix, outputs those, with one row per member of a batch.
+    Given qubits, the probabilities are summed over every other qubit, with the bits
+    of the given qubits in the same order as in the state. A single bit is read
+    from the calculator on its own when it can give one amplitude, such as a
+    matrix product state, without making the whole state. The probabilities are
+    always squared from a view of the state of the calculator, never rounded
+    amplitudes, and only the output is rounded.
+
     ```
     from qcpy import quantumcircuit, probability
     probablity(quantumcircuit(qubits = 2)
+    probablity(quantumcircuit(qubits = 2), qubits = [0])
     ```
     Args:
         state: (ndarray/quantumcircuit, required): State to convert to a probability array. No default.
         show_bit: (str/int, optional): Can specify showing a single value from the state. Defaults to -1.
         round: (int, optional): Rounds the phase angle array by a given value. Defaults to 3.
         radian: (bool, true): Can represent the phase angle array in radians or not. Defaults to true.
+        qubits: (List[int], optional): Qubits to keep, summing over the rest. Defaults to None.
+        raw: (bool, optional): Reads the state without copying or rounding it, which
+                               probability always does. Defaults to False.
+        out: (ndarray, optional): Float array of the shape of the output to write the
+                                  probability array into. Defaults to None.
     Returns:
         NDArray: Probability array from given state.
     """
-    circuit_size = int(log2(quantumstate.size))
-    quantum_state = convert_state(quantumstate)
     if round < 0:
         raise RoundBelowZeroError(f"Cannot round to {round} needs to be 0 or greater")
-    if isinstance(show_bit, int) and show_bit < 0:
-        probability = abs(square(quantum_state))
-    elif isinstance(show_bit, str) or isinstance(show_bit, int):
+    if isinstance(show_bit, str):
+        show_bit = int(show_bit, 2)
+    if (
+        qubits is None
+        and show_bit >= 0
+        and isinstance(quantumstate, QuantumCircuit)
+        and hasattr(quantumstate.backend, "amplitude")
+    ):
+        backend = quantumstate.backend
+        if 2**backend.qubits <= show_bit:
+            raise OutOfRangeError(
+                f"Cannot show bit of value {show_bit} as it is out of range"
+            )
+        probability = square(abs(backend.amplitude(show_bit)))
+        if show_percent:
+            probability = multiply(probability, 100)
+        return around(probability, decimals=round)
+    if qubits is not None:
+        probabilities = _marginal(quantumstate, qubits)
+    elif isinstance(quantumstate, QuantumCircuit) and hasattr(
+        quantumstate.backend, "probabilities"
+    ):
+        probabilities = quantumstate.backend.probabilities()
+    else:
+        probabilities = abs(convert_state(quantumstate, True), out=out)
+        square(probabilities, out=probabilities)
+    circuit_size = int(log2(probabilities.shape[-1]))
+    if not allclose(probabilities.sum(axis=-1, dtype=float), 1, atol=1e-3):
+        raise InvalidProbability("Probability is invalid and is not equal to 100%")
+    if show_bit >= 0:
         if 2**circuit_size <= show_bit:
             raise OutOfRangeError(
                 f"Cannot show bit of value {show_bit} as it is out of range"
             )
-        probability = abs(square(quantum_state[show_bit]))
+        probability = probabilities[..., show_bit]
+        if show_percent:
+            probability = multiply(probability, 100)
+        return around(probability, decimals=round)
+    if out is not None and probabilities is not out:
+        out[...] = probabilities
+        probabilities = out
     if show_percent:
-        probability = multiply(probability, 100)
-    if sum(probability) != float(100):
-        raise InvalidProbability("Probability is invalid and is not equal to 100%")
+        multiply(probabilities, 100, out=probabilities)
+
+    return around(probabilities, decimals=round, out=probabilities)
 
-    return around(probability, decimals=round)
+
+def _marginal(quantumstate: Union[ndarray, QuantumCircuit], qubits: List[int]):
+    """Probabilities of the basis states of some of the qubits, summed over the rest.
+
+    The probabilities are reshaped so that every bit has its own axis, and every
+    axis of the other qubits is summed away in one reduction. Only the magnitudes
+    are held, as one float array, and the state is not rounded.
+
+    Args:
+        quantumstate (ndarray/quantumcircuit): State to read the probabilities of.
+        qubits (List[int]): Qubits to keep.
+    Returns:
+        NDArray: Probability of each of the 2^k basis states of the kept qubits, for
+                 every member of a batch.
+    """
+    big_endian = False
+    if isinstance(quantumstate, QuantumCircuit):
+        backend = quantumstate.backend
+        big_endian = backend.big_endian
+        if hasattr(backend, "marginal"):
+            return backend.marginal(qubits)
+        if hasattr(backend, "probabilities"):
+            probabilities = backend.probabilities()
+        else:
+            probabilities = abs(asarray(quantumstate.state))
+            square(probabilities, out=probabilities)
+            probabilities = probabilities.reshape(-1)
+    else:
+        probabilities = abs(asarray(quantumstate).reshape(-1))
+        square(probabilities, out=probabilities)
+    size = int(log2(probabilities.shape[-1]))
+    leading = probabilities.ndim - 1
+    axes = set()
+    for qubit in qubits:
+        if qubit not in range(size):
+            raise OutOfRangeError("qubit is out of range of size of quantum circuit")
+        axes.add(leading + (qubit if big_endian else size - 1 - qubit))
+    probabilities = probabilities.reshape(probabilities.shape[:-1] + (2,) * size)
+    summed = tuple(axis for axis in range(leading, leading + size) if axis not in axes)
+    return probabilities.sum(axis=summed).reshape(probabilities.shape[:leading] + (-1,))
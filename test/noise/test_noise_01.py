@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from qcpy import channels, errors
+
+
+def test_noise_01():
+    for kraus in [
+        channels.depolarizing(0.3),
+        channels.amplitude_damping(0.3),
+        channels.phase_damping(0.3),
+    ]:
+        assert np.allclose(
+            sum(np.dot(k.conj().T, k) for k in kraus), np.identity(2)
+        ), "test_noise_01 Failed on preserving the trace"
+    assert (
+        channels.readout(0.1, 0.2) == np.array([[0.9, 0.2], [0.1, 0.8]])
+    ).all(), "test_noise_01 Failed on the readout matrix"
+    with pytest.raises(errors.InvalidNoiseError):
+        channels.depolarizing(1.5)
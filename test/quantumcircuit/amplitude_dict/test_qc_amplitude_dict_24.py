@@ -0,0 +1,36 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z", engine="amplitude_dict")
+    return qc
+
+
+def test_24a():
+    qc = inc(3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.ccx(0, 1, 2)
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.707, 0, 0, 0, 0, 0, 0, 0.707], "F")
+    ).all(), "test_24a Failed on hadamard -> cx -> ccx"
+
+
+def test_24b():
+    qc = inc(3)
+    qc.x(0)
+    qc.swap(0, 2)
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0, 0, 0, 0, 1, 0, 0, 0], "F")
+    ).all(), "test_24b Failed on x -> swap"
+
+
+def test_24c():
+    qc = inc(2)
+    qc.mcu([], [0, 1], np.roll(np.identity(4), 1, axis=0))
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3) == np.array([0, 0, 1, 0], "F")
+    ).all(), "test_24c Failed on a custom permutation"
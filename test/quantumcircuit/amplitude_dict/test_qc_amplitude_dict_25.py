@@ -0,0 +1,36 @@
+from qcpy import quantumcircuit
+
+
+def inc(x, big_endian=False, epsilon=None):
+    qc = quantumcircuit(
+        qubits=x, engine="amplitude_dict", big_endian=big_endian, epsilon=epsilon
+    )
+    qc.h(0)
+    for qubit in range(x - 1):
+        qc.cx(qubit, qubit + 1)
+    return qc
+
+
+def test_25a():
+    assert inc(60).calculator.nonzero == {
+        0: 0.7071067690849304 + 0j,
+        2**60 - 1: 0.7071067690849304 + 0j,
+    }, "test_25a Failed on a 60 qubit ghz state"
+
+
+def test_25b():
+    qc = inc(60, True)
+    qc.x(0)
+    assert list(qc.calculator.nonzero) == [
+        2**59 - 1,
+        2**59,
+    ], "test_25b Failed on big endian keys of a 60 qubit state"
+
+
+def test_25c():
+    qc = inc(2, epsilon=0.5)
+    qc.ry(0, 0.2)
+    assert list(qc.calculator.nonzero) == [
+        0,
+        3,
+    ], "test_25c Failed on dropping amplitudes below epsilon"
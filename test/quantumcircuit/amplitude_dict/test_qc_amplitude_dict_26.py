@@ -0,0 +1,61 @@
+import numpy as np
+
+from qcpy import measure, paulisum, probability, quantumcircuit
+
+
+def ghz(x, big_endian=False, seed=None):
+    qc = quantumcircuit(
+        qubits=x, engine="amplitude_dict", big_endian=big_endian, seed=seed
+    )
+    qc.h(0)
+    for qubit in range(x - 1):
+        qc.cx(qubit, qubit + 1)
+    return qc
+
+
+def test_26a():
+    qc = ghz(60)
+    assert measure(qc) in ["0" * 60, "1" * 60], "test_26a Failed on a single shot"
+    counts = measure(qc, shots=1000)
+    assert set(counts) == {"0" * 60, "1" * 60} and (
+        400 < counts["0" * 60] < 600
+    ), "test_26a Failed on many shots of a 60 qubit state"
+    assert np.allclose(
+        probability(qc, qubits=[0, 59]), [0.5, 0, 0, 0.5]
+    ), "test_26a Failed on a marginal of a 60 qubit state"
+    assert np.isclose(
+        qc.expectation(paulisum({"Z" * 60: 1.0, "X" * 60: 0.5, "ZI" * 30: 2.0})),
+        3.5,
+    ), "test_26a Failed on an expectation of a 60 qubit state"
+
+
+def test_26b():
+    for big_endian in [False, True]:
+        qc = quantumcircuit(qubits=4, engine="amplitude_dict", big_endian=big_endian)
+        dense = quantumcircuit(qubits=4, big_endian=big_endian)
+        for circuit in [qc, dense]:
+            circuit.h([0, 1, 2])
+            circuit.ry(3, 0.4)
+            circuit.cx(2, 3)
+            circuit.s(1)
+        assert np.allclose(
+            probability(qc, qubits=[1, 3]), probability(dense, qubits=[1, 3])
+        ), "test_26b Failed on the order of the kept qubits"
+        observable = paulisum({"XYZI": 0.3, "IIZX": -1.0, "YIIY": 0.5j})
+        assert np.isclose(
+            qc.expectation(observable), dense.expectation(observable), atol=1e-5
+        ), "test_26b Failed on matching the dense expectation"
+        assert np.isclose(
+            qc.backend.amplitude(5), dense.state.reshape(-1)[5], atol=1e-6
+        ), "test_26b Failed on a single amplitude"
+
+
+def test_26c():
+    for seed in range(6):
+        qc = ghz(60, seed=seed)
+        outcome = qc.measure(30, "c")
+        assert qc.measure(59) == outcome, "test_26c Failed on collapsing the ghz state"
+        qc.reset(0)
+        assert list(qc.calculator.nonzero) == [
+            (2**60 - 2) * outcome
+        ], "test_26c Failed on resetting a qubit"
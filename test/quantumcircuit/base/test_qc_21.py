@@ -0,0 +1,48 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z", big_endian=True)
+    qc.h(0)
+    qc.cx(0, x - 1)
+    qc.cz(0, 1)
+    return np.around(qc.state.flatten(), 3)
+
+
+def test_21a():
+    assert (
+        inc(2) == np.array([0.707 + 0j, 0 + 0j, 0 + 0j, -0.707 + 0j], "F")
+    ).all(), "test_21a Failed on big endian hadamard -> cnot -> cz"
+
+
+def test_21b():
+    assert (
+        inc(3)
+        == np.array(
+            [0.707 + 0j, 0 + 0j, 0 + 0j, 0 + 0j, 0 + 0j, 0.707 + 0j, 0 + 0j, 0 + 0j],
+            "F",
+        )
+    ).all(), "test_21b Failed on big endian hadamard -> cnot -> cz"
+
+
+def test_21c():
+    expected = np.zeros(16, "F")
+    expected[0] = 0.707
+    expected[9] = 0.707
+    assert (
+        inc(4) == expected
+    ).all(), "test_21c Failed on big endian hadamard -> cnot -> cz"
+
+
+def test_21d():
+    qc = quantumcircuit(qubits=3)
+    qc.h(0)
+    held = qc.state
+    copy = held.copy()
+    qc.cy(0, 1)
+    qc.ccx(0, 1, 2)
+    qc.measure(0)
+    assert np.array_equal(
+        held, copy
+    ), "test_21d Failed on a state read before controlled gates and a measure"
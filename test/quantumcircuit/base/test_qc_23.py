@@ -0,0 +1,82 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="x")
+    return qc
+
+
+def test_23a():
+    qc = inc(2)
+    qc.s(0)
+    qc.cz(0, 1)
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.5, 0.5j, 0.5, -0.5j], "F")
+    ).all(), "test_23a Failed on s -> cz"
+
+
+def test_23b():
+    qc = inc(2)
+    qc.z([0, 1])
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.5, -0.5, -0.5, 0.5], "F")
+    ).all(), "test_23b Failed on z on every qubit"
+
+
+def test_23c():
+    qc = inc(2)
+    qc.mcu([0], [1], np.diag([1, -1]))
+    qc.custom(1, np.diag([1, 1j]))
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.5, 0.5, 0.5j, -0.5j], "F")
+    ).all(), "test_23c Failed on diagonal multi-controlled unitary -> custom"
+
+
+def fused_inc(x, fuse=True):
+    qc = quantumcircuit(qubits=x, prep="x", fuse=fuse)
+    for i in range(x):
+        qc.rz(i, 0.1 * (i + 1))
+    for i in range(x - 1):
+        qc.cz(i, i + 1)
+    qc.rzz(0, x - 1, 0.6)
+    return qc
+
+
+def test_23d():
+    qc = fused_inc(4)
+    assert qc.fused == 7, "test_23d Failed on merging a diagonal layer"
+    assert len(qc.calculator.pending[0][0]) == 4, "test_23d Failed on one phase array"
+
+
+def test_23e():
+    assert np.allclose(
+        fused_inc(5).state, fused_inc(5, fuse=False).state, atol=1e-6
+    ), "test_23e Failed on merged phases matching unfused gates"
+
+
+def test_23f():
+    fused = fused_inc(3, fuse=2)
+    unfused = fused_inc(3, fuse=False)
+    for qc in [fused, unfused]:
+        qc.h(1)
+        qc.t(1)
+    assert np.allclose(
+        fused.state, unfused.state, atol=1e-6
+    ), "test_23f Failed on a diagonal layer followed by a 2x2 block"
+
+
+def test_23g():
+    circuits = [quantumcircuit(qubits=2, fuse=1), quantumcircuit(qubits=2)]
+    for qc in circuits:
+        for _ in range(1000):
+            qc.p(0, 5e-6)
+            qc.h(1)
+            qc.cx(1, 0)
+            qc.h(1)
+    assert np.allclose(
+        circuits[0].state, circuits[1].state, atol=1e-6
+    ), "test_23g Failed on keeping small phases between flushes"
@@ -0,0 +1,104 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z")
+    return qc
+
+
+def test_24a():
+    qc = inc(3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.ccx(0, 1, 2)
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.707, 0, 0, 0, 0, 0, 0, 0.707], "F")
+    ).all(), "test_24a Failed on hadamard -> cx -> ccx"
+
+
+def test_24b():
+    qc = inc(3)
+    qc.x(0)
+    qc.swap(0, 2)
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0, 0, 0, 0, 1, 0, 0, 0], "F")
+    ).all(), "test_24b Failed on x -> swap"
+
+
+def test_24c():
+    qc = inc(2)
+    qc.mcu([], [0, 1], np.roll(np.identity(4), 1, axis=0))
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3) == np.array([0, 0, 1, 0], "F")
+    ).all(), "test_24c Failed on a custom permutation"
+
+
+def fused_inc(x, fuse=True):
+    qc = quantumcircuit(qubits=x, prep="x", fuse=fuse)
+    qc.z(0)
+    qc.x(0)
+    for i in range(x - 1):
+        qc.cx(i, i + 1)
+    qc.ccx(0, 1, x - 1)
+    qc.swap(0, x - 1)
+    return qc
+
+
+def test_24d():
+    qc = fused_inc(4)
+    assert qc.fused == 5, "test_24d Failed on composing permutations"
+    assert qc.calculator.pending[0][2] == "permutation", "test_24d Failed on one table"
+
+
+def test_24e():
+    assert np.allclose(
+        fused_inc(5).state, fused_inc(5, fuse=False).state, atol=1e-6
+    ), "test_24e Failed on composed permutations matching unfused gates"
+
+
+def test_24f():
+    fused = fused_inc(4, fuse=2)
+    unfused = fused_inc(4, fuse=False)
+    for qc in [fused, unfused]:
+        qc.h(2)
+        qc.cx(2, 3)
+    assert np.allclose(
+        fused.state, unfused.state, atol=1e-6
+    ), "test_24f Failed on permutations next to 4x4 blocks"
+
+
+def test_24g():
+    circuits = [quantumcircuit(qubits=2, fuse=1), quantumcircuit(qubits=2)]
+    for qc in circuits:
+        qc.h(0)
+        for _ in range(1000):
+            qc.x(0)
+            qc.p(0, 5e-6)
+            qc.h(1)
+            qc.cx(1, 0)
+            qc.h(1)
+    assert np.allclose(
+        circuits[0].state, circuits[1].state, atol=1e-6
+    ), "test_24g Failed on keeping small phases of a permutation block"
+
+
+def test_24h():
+    for fuse in [False, 1]:
+        qc = quantumcircuit(qubits=3, fuse=fuse)
+        qc.h([0, 1, 2])
+        qc.t([0, 1, 2])
+        qc.x([1, 1])
+        qc.z([1, 1])
+        qc.s([0, 0, 2])
+        expected = quantumcircuit(qubits=3)
+        expected.h([0, 1, 2])
+        expected.t([0, 1, 2])
+        expected.x(1)
+        expected.z(1)
+        expected.s([0, 2])
+        assert np.allclose(
+            qc.state, expected.state, atol=1e-6
+        ), "test_24h Failed on tables of repeated qubits"
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, measure, probability, quantumcircuit
+
+
+def build(qc):
+    qc.h(0)
+    qc.ry(1, 0.4)
+    qc.cx(0, 2)
+    qc.ccx(0, 1, 2)
+    qc.rzz(1, 2, 0.7)
+    qc.swap(0, 1)
+    return qc
+
+
+def test_01a():
+    states = np.random.default_rng(0).normal(size=(5, 8)) + 0j
+    states /= np.linalg.norm(states, axis=1)[:, None]
+    for big_endian in [False, True]:
+        batch = quantumcircuit(qubits=3, batch=5, big_endian=big_endian)
+        batch.calculator.state = states
+        build(batch)
+        assert batch.engine == "batch", "test_01a Failed on picking the batch engine"
+        for member, state in enumerate(states):
+            vector = quantumcircuit(
+                qubits=3, engine="statevector", big_endian=big_endian
+            )
+            vector.calculator.state = state
+            build(vector)
+            assert np.allclose(
+                batch.state[member], vector.state.reshape(-1), atol=1e-5
+            ), "test_01a Failed on matching the statevector engine"
+
+
+def test_01b():
+    qubit_states = np.zeros((4, 3, 2), complex)
+    for member in range(4):
+        for qubit in range(3):
+            qubit_states[member, qubit, (member >> qubit) & 1] = 1
+    qc = quantumcircuit(qubits=3, batch=4, big_endian=True)
+    qc.calculator.state = qubit_states
+    qc.x(2)
+    assert measure(qc) == [
+        "001",
+        "101",
+        "011",
+        "111",
+    ], "test_01b Failed on measuring every member of the batch"
+    assert probability(qc).shape == (4, 8), "test_01b Failed on batched probability"
+    assert (
+        probability(qc, show_bit=1) == np.array([1, 0, 0, 0])
+    ).all(), "test_01b Failed on showing a basis state of every member"
+
+
+def test_01c():
+    qc = quantumcircuit(qubits=2, batch=3, fuse=2, lazy=True)
+    qc.h(0)
+    qc.cx(0, 1)
+    samples = qc.backend.sample(200)
+    assert len(samples) == 200 and all(
+        len(shot) == 3 and set(shot) <= {"00", "11"} for shot in samples
+    ), "test_01c Failed on sampling bell states"
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, engine="statevector", batch=3)
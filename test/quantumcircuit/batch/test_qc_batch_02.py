@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, gates, probability, quantumcircuit
+
+
+def build(qc, theta, phi):
+    qc.h([0, 1])
+    qc.rx(0, theta)
+    qc.ry(1, phi)
+    qc.rz(2, theta)
+    qc.p(0, phi)
+    qc.u(2, theta, phi, 0.3)
+    qc.crx(0, 2, phi)
+    qc.cry(2, 1, theta)
+    qc.crz(1, 0, phi)
+    qc.rxx(0, 1, theta)
+    qc.rzz(1, 2, phi)
+    return qc
+
+
+def test_02a():
+    thetas = np.linspace(0, np.pi, 6)
+    phis = np.linspace(-1, 2, 6)
+    for fuse in [False, 2]:
+        sweep = build(quantumcircuit(qubits=3, batch=6, fuse=fuse), thetas, phis)
+        for member, (theta, phi) in enumerate(zip(thetas, phis)):
+            vector = build(quantumcircuit(qubits=3, engine="statevector"), theta, phi)
+            assert np.allclose(
+                sweep.state[member], vector.state.reshape(-1), atol=1e-5
+            ), "test_02a Failed on matching the statevector engine"
+
+
+def test_02b():
+    thetas = np.linspace(0, np.pi, 5)
+    qc = quantumcircuit(qubits=1, batch=5)
+    qc.rx(0, thetas)
+    assert np.allclose(
+        probability(qc, round=5)[:, 1], np.sin(thetas / 2) ** 2, atol=1e-5
+    ), "test_02b Failed on the stacked probabilities of a sweep"
+    assert gates.rx(thetas).shape == (5, 2, 2), "test_02b Failed on a stack of gates"
+    assert np.array_equal(
+        gates.u(thetas, 0, 0)[3], gates.u(thetas[3], 0, 0)
+    ), "test_02b Failed on broadcasting the parameters of u"
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=1, engine="statevector").rx(0, thetas)
+
+
+def test_02c():
+    thetas = np.linspace(0, np.pi, 4)
+    qc = quantumcircuit(qubits=3, batch=6)
+    with pytest.raises(errors.InvalidEngineError, match="4 gates"):
+        qc.rx(0, thetas)
+    with pytest.raises(errors.InvalidEngineError, match="batch of 6"):
+        qc.rxx(0, 2, thetas)
+    with pytest.raises(errors.InvalidEngineError):
+        qc.crx(0, 1, thetas)
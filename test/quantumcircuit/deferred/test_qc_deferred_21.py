@@ -0,0 +1,43 @@
+import numpy as np
+from qcpy import amplitude, quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z", lazy=True)
+    qc.h(0)
+    for i in range(x - 1):
+        qc.cx(i, i + 1)
+    return qc
+
+
+def test_21a():
+    qc = inc(64)
+    assert qc.queued == 64, "test_21a Failed on counting recorded gates"
+    assert qc.calculator.built is None, "test_21a Failed on deferring the calculator"
+    assert str(qc) != "", "test_21a Failed on drawing a recorded circuit"
+
+
+def test_21b():
+    qc = inc(3)
+    assert np.allclose(
+        amplitude(qc), [0.707, 0, 0, 0, 0, 0, 0, 0.707]
+    ), "test_21b Failed on running recorded gates for amplitude"
+    assert qc.queued == 0, "test_21b Failed on emptying the recorded gates"
+    qc.x(0)
+    assert qc.queued == 1, "test_21b Failed on recording after a read"
+    assert np.allclose(
+        amplitude(qc), [0, 0.707, 0, 0, 0, 0, 0.707, 0]
+    ), "test_21b Failed on running gates recorded after a read"
+
+
+def test_21c():
+    qc = quantumcircuit(qubits=4, prep="z", lazy=True, fuse=2, engine="statevector")
+    eager = quantumcircuit(qubits=4, prep="z")
+    for circuit in [qc, eager]:
+        circuit.h([0, 1, 2, 3])
+        circuit.rzz(0, 2, 0.3)
+        circuit.ccx(0, 1, 3)
+        circuit.rx(3, 0.8)
+    assert np.allclose(
+        qc.state, eager.state, atol=1e-6
+    ), "test_21c Failed on deferred fused gates matching eager gates"
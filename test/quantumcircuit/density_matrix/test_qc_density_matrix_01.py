@@ -0,0 +1,47 @@
+import numpy as np
+
+from qcpy import quantumcircuit
+
+
+def test_01a():
+    qc = quantumcircuit(qubits=2, engine="density_matrix")
+    qc.h(0)
+    qc.cx(0, 1)
+    assert (
+        np.around(qc.state, 3)
+        == np.array(
+            [[0.5, 0, 0, 0.5], [0, 0, 0, 0], [0, 0, 0, 0], [0.5, 0, 0, 0.5]], "F"
+        )
+    ).all(), "test_01a Failed on a bell state"
+
+
+def test_01b():
+    qc = quantumcircuit(qubits=2, engine="density_matrix", big_endian=True)
+    qc.x(0)
+    qc.s(0)
+    qc.h(1)
+    assert (
+        np.around(qc.state, 3)
+        == np.array(
+            [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0.5, 0.5], [0, 0, 0.5, 0.5]], "F"
+        )
+    ).all(), "test_01b Failed on big endian phases"
+
+
+def test_01c():
+    for prep in ["x", "y"]:
+        vector = quantumcircuit(qubits=3, engine="statevector", prep=prep)
+        density = quantumcircuit(qubits=3, engine="density_matrix", prep=prep)
+        for qc in [vector, density]:
+            qc.rx(0, 0.3)
+            qc.ccx(0, 1, 2)
+            qc.rzz(1, 2, 0.7)
+            qc.swap(0, 2)
+            qc.cry(2, 1)
+        state = vector.state
+        assert np.allclose(
+            density.state, np.dot(state, state.conj().T), atol=1e-5
+        ), "test_01c Failed on matching the statevector engine"
+        assert np.isclose(
+            density.backend.purity, 1, atol=1e-5
+        ), "test_01c Failed on the purity of a pure state"
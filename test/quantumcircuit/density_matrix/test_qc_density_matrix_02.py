@@ -0,0 +1,53 @@
+import numpy as np
+
+from qcpy import channels, noisemodel, quantumcircuit
+
+
+def noisy(kraus, gate_types=["single", "multi"]):
+    noise = noisemodel()
+    noise.add(kraus, gate_types)
+    return noise
+
+
+def test_02a():
+    qc = quantumcircuit(qubits=2, noise=noisy(channels.depolarizing(0.75)))
+    qc.x(0)
+    assert (
+        np.around(qc.state, 3)
+        == np.array([[0.5, 0, 0, 0], [0, 0.5, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]], "F")
+    ).all(), "test_02a Failed on fully depolarizing a qubit"
+
+
+def test_02b():
+    qc = quantumcircuit(qubits=2, noise=noisy(channels.amplitude_damping(1)))
+    qc.x([0, 1])
+    assert (
+        np.around(qc.state, 3)
+        == np.array([[1, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]], "F")
+    ).all(), "test_02b Failed on damping both qubits back to 0"
+
+
+def test_02c():
+    qc = quantumcircuit(qubits=2, noise=noisy(channels.phase_damping(1), "multi"))
+    qc.h(0)
+    assert np.isclose(
+        qc.state[0][1], 0.5, atol=1e-5
+    ), "test_02c Failed on leaving single qubit gates without noise"
+    qc.cx(0, 1)
+    assert (
+        np.around(qc.state, 3)
+        == np.array([[0.5, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0.5]], "F")
+    ).all(), "test_02c Failed on dephasing a bell state"
+    assert np.isclose(
+        qc.backend.purity, 0.5, atol=1e-5
+    ), "test_02c Failed on the purity of a mixed state"
+
+
+def test_02d():
+    noise = noisemodel()
+    noise.add_readout(channels.readout(0.1, 0.2))
+    qc = quantumcircuit(qubits=2, noise=noise)
+    qc.x(1)
+    assert np.allclose(
+        qc.backend.probabilities(), [0.18, 0.02, 0.72, 0.08]
+    ), "test_02d Failed on readout errors"
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from qcpy import channels, errors, measure, noisemodel, quantumcircuit
+
+
+def test_03a():
+    noise = noisemodel()
+    noise.add(channels.depolarizing(0.01))
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, engine="statevector", noise=noise)
+    assert (
+        quantumcircuit(qubits=2, noise=noise).engine == "density_matrix"
+    ), "test_03a Failed on picking the density_matrix engine for noise"
+
+
+def test_03b():
+    noise = noisemodel()
+    noise.add(channels.amplitude_damping(1))
+    qc = quantumcircuit(qubits=3, noise=noise, lazy=True)
+    qc.h([0, 1, 2])
+    assert measure(qc) == "000", "test_03b Failed on measuring a damped state"
+
+
+def test_03c():
+    noise = noisemodel()
+    with pytest.raises(errors.InvalidNoiseError):
+        noise.add(channels.depolarizing(0.1), "measure")
+    with pytest.raises(errors.InvalidNoiseError):
+        noise.add(2 * channels.phase_damping(0.1))
+    with pytest.raises(errors.InvalidNoiseError):
+        noise.add_readout(np.identity(2) * 0.5)
+
+
+def test_03d():
+    noise = noisemodel()
+    noise.add(channels.depolarizing(0.01))
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, noise=noise, fuse=True)
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, noise=noise, fuse=2)
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, noise=noise, clifford=True)
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, noise=noise, trajectories=4, fuse=True)
+
+
+def test_03e():
+    noise = noisemodel()
+    noise.add(channels.depolarizing(0.01))
+    with pytest.raises(errors.InvalidEngineError, match="threads"):
+        quantumcircuit(qubits=3, noise=noise, threads=2)
+    with pytest.raises(errors.InvalidEngineError, match="threads"):
+        quantumcircuit(qubits=3, batch=4, threads=2)
@@ -0,0 +1,47 @@
+import numpy as np
+
+from qcpy import quantumcircuit
+
+
+def inc(x, processes, big_endian=False):
+    qc = quantumcircuit(
+        qubits=x, engine="distributed", processes=processes, big_endian=big_endian
+    )
+    for qubit in range(x):
+        qc.h(qubit)
+        qc.rx(qubit, 0.3 * qubit)
+    for qubit in range(x - 1, 0, -1):
+        qc.cx(qubit, qubit - 1)
+        qc.rzz(qubit - 1, qubit, 0.7)
+    qc.ccx(x - 1, x - 2, 0)
+    qc.swap(0, x - 1)
+    return qc
+
+
+def test_25a():
+    qc = quantumcircuit(qubits=6, engine="statevector")
+    distributed = inc(6, 4)
+    for qubit in range(6):
+        qc.h(qubit)
+        qc.rx(qubit, 0.3 * qubit)
+    for qubit in range(5, 0, -1):
+        qc.cx(qubit, qubit - 1)
+        qc.rzz(qubit - 1, qubit, 0.7)
+    qc.ccx(5, 4, 0)
+    qc.swap(0, 5)
+    assert np.allclose(
+        distributed.state, qc.state, atol=1e-6
+    ), "test_25a Failed on gates across the global qubits of four processes"
+
+
+def test_25b():
+    assert np.allclose(
+        inc(8, 2, True).state, inc(8, 1, True).state, atol=1e-6
+    ), "test_25b Failed on big endian with two processes"
+
+
+def test_25c():
+    qc = inc(3, 8)
+    assert (
+        qc.engine == "distributed" and qc.calculator.processes == 2
+    ), "test_25c Failed on keeping two bits within every shard"
@@ -0,0 +1,22 @@
+import os
+import numpy as np
+
+from qcpy import quantumcircuit
+
+
+def test_26a():
+    qc = quantumcircuit(qubits=4, engine="distributed", processes=2)
+    qc.h(0)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            qc.calculator.close()
+        except BaseException:
+            os._exit(1)
+        os._exit(0)
+    _, status = os.waitpid(pid, 0)
+    assert status == 0, "test_26a Failed on shutting down in a forked process"
+    qc.h(1)
+    assert np.allclose(
+        qc.state.reshape(-1)[:4], 0.5
+    ), "test_26a Failed on keeping the workers of the owner of the state"
@@ -0,0 +1,38 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z", fuse=True)
+    for i in range(x):
+        qc.rz(i, 0.3)
+        qc.ry(i, 0.7)
+        qc.rz(i, -0.3)
+        qc.sx(i)
+    qc.cx(0, x - 1)
+    qc.x(0)
+    qc.x(0)
+    return qc
+
+
+def test_21a():
+    qc = inc(3)
+    assert qc.fused == 3 * 3 + 2, "test_21a Failed on counting fused gates"
+    qc.state
+    qc.x(1)
+    qc.x(1)
+    qc.state
+    assert qc.fused == 3 * 3 + 4, "test_21a Failed on dropping identity gates"
+
+
+def test_21b():
+    unfused = quantumcircuit(qubits=4, prep="z")
+    for i in range(4):
+        unfused.rz(i, 0.3)
+        unfused.ry(i, 0.7)
+        unfused.rz(i, -0.3)
+        unfused.sx(i)
+    unfused.cx(0, 3)
+    assert np.allclose(
+        inc(4).state, unfused.state, atol=1e-6
+    ), "test_21b Failed on fused gates matching unfused gates"
@@ -0,0 +1,60 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x, fuse=2, engine=None):
+    qc = quantumcircuit(qubits=x, prep="z", fuse=fuse, engine=engine)
+    for i in range(x):
+        qc.h(i)
+    for i in range(x - 1):
+        qc.rzz(i, i + 1, 0.4)
+        qc.rxx(i, i + 1, 0.9)
+        qc.cx(i + 1, i)
+        qc.swap(i, i + 1)
+        qc.ry(i, 0.2)
+    qc.ccx(0, 1, x - 1)
+    qc.cz(x - 1, 0)
+    qc.t(x - 1)
+    return qc
+
+
+def test_22a():
+    qc = quantumcircuit(qubits=2, prep="z", fuse=2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.rz(1, 0.5)
+    qc.cx(0, 1)
+    assert qc.fused == 3, "test_22a Failed on counting fused blocks"
+    unfused = quantumcircuit(qubits=2, prep="z")
+    unfused.h(0)
+    unfused.cx(0, 1)
+    unfused.rz(1, 0.5)
+    unfused.cx(0, 1)
+    assert np.allclose(
+        qc.state, unfused.state, atol=1e-6
+    ), "test_22a Failed on a fused 4x4 block"
+
+
+def test_22b():
+    assert np.allclose(
+        inc(4).state, inc(4, fuse=False).state, atol=1e-6
+    ), "test_22b Failed on two qubit blocks matching unfused gates"
+
+
+def test_22c():
+    assert np.allclose(
+        inc(5, engine="statevector").state, inc(5, fuse=False).state, atol=1e-6
+    ), "test_22c Failed on two qubit blocks with the statevector engine"
+
+
+def test_22d():
+    circuits = [quantumcircuit(qubits=3, fuse=2), quantumcircuit(qubits=3)]
+    for qc in circuits:
+        qc.h(0)
+        for _ in range(1000):
+            qc.rz(0, 5e-6)
+            qc.cx(0, 1)
+            qc.ccx(0, 1, 2)
+    assert np.allclose(
+        circuits[0].state, circuits[1].state, atol=1e-6
+    ), "test_22d Failed on keeping small phases of a controlled block"
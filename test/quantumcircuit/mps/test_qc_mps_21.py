@@ -0,0 +1,22 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z", engine="mps")
+    qc.h(0)
+    for i in range(x - 1):
+        qc.cx(i, i + 1)
+    return np.around(qc.state.flatten(), 3)
+
+
+def test_21a():
+    state = inc(22)
+    assert (
+        state[0] == 0.707 + 0j and state[-1] == 0.707 + 0j
+    ), "test_21a Failed on hadamard -> cnot chain"
+
+
+def test_21b():
+    state = inc(22)
+    assert np.count_nonzero(state) == 2, "test_21b Failed on hadamard -> cnot chain"
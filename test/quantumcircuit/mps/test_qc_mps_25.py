@@ -0,0 +1,53 @@
+import numpy as np
+
+from qcpy import measure, quantumcircuit
+
+
+def inc(x, max_bond=None, big_endian=False):
+    qc = quantumcircuit(
+        qubits=x, engine="mps", max_bond=max_bond, big_endian=big_endian
+    )
+    qc.h(0)
+    for qubit in range(x - 1):
+        qc.cx(qubit, qubit + 1)
+    return qc
+
+
+def test_25a():
+    mps = inc(100).backend
+    assert np.isclose(mps.amplitude(0), 0.707, atol=1e-3) and np.isclose(
+        mps.amplitude(2**100 - 1), 0.707, atol=1e-3
+    ), "test_25a Failed on amplitudes of a 100 qubit ghz state"
+    assert (
+        max(tensor.shape[2] for tensor in mps.tensors) == 2
+    ), "test_25a Failed on keeping the bond dimension at 2"
+
+
+def test_25b():
+    qc = inc(100)
+    assert measure(qc) in [
+        "0" * 100,
+        "1" * 100,
+    ], "test_25b Failed on sampling a 100 qubit ghz state"
+    assert (
+        np.around(qc.backend.marginal([0, 50, 99]), 3)
+        == np.array([0.5, 0, 0, 0, 0, 0, 0, 0.5])
+    ).all(), "test_25b Failed on marginal probabilities"
+
+
+def test_25c():
+    qc = quantumcircuit(qubits=6, engine="mps", max_bond=1)
+    qc.h(0)
+    qc.cx(0, 5)
+    assert (
+        np.around(qc.backend.truncation, 3) == 0.5
+    ), "test_25c Failed on truncating to max_bond"
+
+
+def test_25d():
+    qc = inc(4, big_endian=True)
+    qc.x(0)
+    qc.swap(0, 3)
+    assert (
+        np.around(qc.backend.marginal([0, 3]), 3) == np.array([0, 0.5, 0.5, 0])
+    ).all(), "test_25d Failed on marginals after a swap network in big endian"
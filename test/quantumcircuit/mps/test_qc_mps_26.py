@@ -0,0 +1,51 @@
+import numpy as np
+
+from qcpy import amplitude, paulisum, probability, quantumcircuit
+
+
+def ghz(x, big_endian=False):
+    qc = quantumcircuit(qubits=x, engine="mps", big_endian=big_endian)
+    qc.h(0)
+    for qubit in range(x - 1):
+        qc.cx(qubit, qubit + 1)
+    return qc
+
+
+def test_26a():
+    qc = ghz(100)
+    assert np.isclose(
+        probability(qc, show_bit="1" * 100), 0.5
+    ), "test_26a Failed on the probability of a bit of a 100 qubit state"
+    assert np.isclose(
+        amplitude(qc, show_bit=2**100 - 1), 0.707
+    ), "test_26a Failed on the amplitude of a bit of a 100 qubit state"
+    assert np.isclose(
+        qc.expectation(
+            paulisum({"Z" * 100: 1.0, "X" * 100: 0.5, "ZZ" + "I" * 98: 2.0})
+        ),
+        3.5,
+        atol=1e-5,
+    ), "test_26a Failed on an expectation of a 100 qubit state"
+
+
+def test_26b():
+    for big_endian in [False, True]:
+        qc = quantumcircuit(qubits=4, engine="mps", big_endian=big_endian)
+        dense = quantumcircuit(qubits=4, big_endian=big_endian)
+        for circuit in [qc, dense]:
+            circuit.h([0, 1, 2])
+            circuit.ry(3, 0.4)
+            circuit.cx(0, 3)
+            circuit.s(1)
+            circuit.swap(1, 3)
+        observable = paulisum({"XYZI": 0.3, "IIZX": -1.0, "YIIY": 0.5j})
+        assert np.isclose(
+            qc.expectation(observable), dense.expectation(observable), atol=1e-5
+        ), "test_26b Failed on matching the dense expectation"
+        assert np.allclose(
+            probability(qc, show_bit=5), probability(dense, show_bit=5)
+        ), "test_26b Failed on the probability of a single bit"
+    marginal = probability(ghz(6), qubits=[2, 3], round=20)
+    assert not np.any(
+        np.signbit(marginal)
+    ), "test_26b Failed on clipping negative marginals"
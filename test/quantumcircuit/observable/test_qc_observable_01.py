@@ -0,0 +1,121 @@
+import itertools
+from functools import reduce
+
+import numpy as np
+import pytest
+
+from qcpy import errors, parameter, paulisum, quantumcircuit
+
+paulis = {
+    "I": np.eye(2),
+    "X": np.array([[0, 1], [1, 0]]),
+    "Y": np.array([[0, -1j], [1j, 0]]),
+    "Z": np.diag([1, -1]),
+}
+
+
+def dense(observable, big_endian):
+    matrix = 0
+    for string, coefficient in observable.terms.items():
+        letters = [paulis[letter] for letter in string]
+        if not big_endian:
+            letters = letters[::-1]
+        matrix = matrix + coefficient * reduce(np.kron, letters)
+    return matrix
+
+
+def build(qc):
+    qc.h([0, 1, 2])
+    qc.rx(0, 0.3)
+    qc.ry(1, 1.1)
+    qc.t(2)
+    qc.cx(0, 2)
+    qc.rzz(1, 2, 0.7)
+    return qc
+
+
+def test_01a():
+    generator = np.random.RandomState(5)
+    strings = ["".join(string) for string in itertools.product("IXYZ", repeat=3)]
+    observable = paulisum({string: generator.randn() for string in strings})
+    for big_endian in [False, True]:
+        matrix = dense(observable, big_endian)
+        qc = build(
+            quantumcircuit(qubits=3, engine="statevector", big_endian=big_endian)
+        )
+        state = np.asarray(qc.state, complex).reshape(-1)
+        assert np.isclose(
+            qc.expectation(observable), np.vdot(state, np.dot(matrix, state)).real
+        ), "test_01a Failed on state vector expectation"
+        assert np.allclose(
+            observable.apply(state, big_endian), np.dot(matrix, state)
+        ), "test_01a Failed on applying the observable"
+        qc = build(
+            quantumcircuit(qubits=3, engine="density_matrix", big_endian=big_endian)
+        )
+        density = np.asarray(qc.state, complex)
+        assert np.isclose(
+            qc.expectation(observable), np.trace(np.dot(density, matrix)).real
+        ), "test_01a Failed on density matrix expectation"
+
+
+def test_01b():
+    observable = paulisum([("XI", 0.5), ("zz", 1.0), ("XI", 0.5)])
+    assert observable.terms == {"XI": 1.0, "ZZ": 1.0}, "test_01b Failed on terms"
+    qc = quantumcircuit(qubits=2, batch=3)
+    qc.h(0)
+    assert np.allclose(
+        qc.expectation(observable), [1, 1, 1], atol=1e-5
+    ), "test_01b Failed on batch expectation"
+    qc = quantumcircuit(qubits=2, trajectories=4)
+    qc.h(0)
+    assert np.isclose(
+        qc.expectation("XI"), 1, atol=1e-5
+    ), "test_01b Failed on trajectory expectation"
+    assert np.isclose(
+        quantumcircuit(qubits=2).expectation(2 * paulisum("ZI") + "IZ"), 3
+    ), "test_01b Failed on summed observables"
+
+
+def test_01c():
+    with pytest.raises(errors.InvalidPauliStringError):
+        paulisum({"XA": 1.0})
+    with pytest.raises(errors.InvalidPauliStringError):
+        paulisum({"XZ": 1.0, "ZZI": 0.5})
+    with pytest.raises(errors.InvalidPauliStringError):
+        quantumcircuit(qubits=2).expectation("XYZ")
+
+
+def test_01d():
+    theta = parameter("theta")
+    observable = paulisum({"XZ": 0.7, "YY": -0.3, "ZI": 1.0})
+    qc = quantumcircuit(qubits=2, engine="statevector", lazy=True)
+    qc.h(0)
+    qc.ry(1, theta)
+    qc.cx(0, 1)
+    compiled = qc.compile().bind([0.4])
+    value, gradient = compiled.gradient(observable)
+    value_matrix, gradient_matrix = compiled.gradient(dense(observable, False))
+    assert np.isclose(value, value_matrix), "test_01d Failed on gradient expectation"
+    assert np.isclose(
+        gradient[theta], gradient_matrix[theta]
+    ), "test_01d Failed on gradient"
+
+
+def test_01e():
+    generator = np.random.RandomState(7)
+    strings = ["".join(string) for string in itertools.product("XYZI", repeat=5)]
+    chosen = generator.choice(strings, 300, replace=False)
+    observable = paulisum(
+        {string: complex(*generator.randn(2)) for string in chosen.tolist()}
+    )
+    states = generator.randn(2, 32) + 1j * generator.randn(2, 32)
+    for big_endian in [False, True]:
+        matrix = dense(observable, big_endian)
+        assert np.allclose(
+            observable.expectation(states, big_endian),
+            np.einsum("bi,ij,bj->b", states.conj(), matrix, states),
+        ), "test_01e Failed on groups of many strings"
+        assert np.allclose(
+            observable.apply(states, big_endian), np.dot(states, matrix.T)
+        ), "test_01e Failed on applying groups of many strings"
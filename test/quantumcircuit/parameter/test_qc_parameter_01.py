@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, parameter, quantumcircuit
+
+
+def build(qc, theta, phi):
+    qc.h([0, 1, 2])
+    qc.rx(0, theta)
+    qc.t(1)
+    qc.s(1)
+    qc.cx(0, 1)
+    qc.ry(1, phi)
+    qc.rz(2, theta)
+    qc.p(0, phi)
+    qc.u(2, theta, 0.2, phi)
+    qc.crx(0, 2, phi)
+    qc.rxx(0, 1, theta)
+    qc.rzz(1, 2, phi)
+    qc.h(2)
+    qc.sx(2)
+    return qc
+
+
+def test_01a():
+    theta = parameter("theta")
+    phi = parameter("phi")
+    for fuse in [False, 1, 2]:
+        template = build(
+            quantumcircuit(qubits=3, engine="statevector", fuse=fuse, lazy=True),
+            theta,
+            phi,
+        )
+        compiled = template.compile()
+        assert compiled.parameters == [theta, phi], "test_01a Failed on parameters"
+        for values in [(0.3, 1.2), (-2.0, 0.5)]:
+            vector = build(quantumcircuit(qubits=3, engine="statevector"), *values)
+            assert np.allclose(
+                compiled.bind({theta: values[0], "phi": values[1]}).run(),
+                vector.state,
+                atol=1e-5,
+            ), "test_01a Failed on matching the statevector engine"
+            assert np.allclose(
+                compiled.bind(values).run(), vector.state, atol=1e-5
+            ), "test_01a Failed on binding values in order"
+
+
+def test_01b():
+    theta = parameter("theta")
+    qc = quantumcircuit(qubits=1, batch=4, lazy=True)
+    qc.rx(0, theta)
+    thetas = np.linspace(0, np.pi, 4)
+    states = qc.compile().bind([thetas]).run()
+    assert np.allclose(
+        np.abs(states[:, 1]) ** 2, np.sin(thetas / 2) ** 2, atol=1e-5
+    ), "test_01b Failed on sweeping a bound parameter"
+
+
+def test_01c():
+    theta = parameter("theta")
+    with pytest.raises(errors.NotLazyCircuitError):
+        quantumcircuit(qubits=1).rx(0, theta)
+    qc = quantumcircuit(qubits=1, lazy=True)
+    qc.rx(0, theta)
+    compiled = qc.compile()
+    with pytest.raises(errors.UnboundParameterError):
+        qc.state
+    with pytest.raises(errors.UnboundParameterError):
+        compiled.run()
+    with pytest.raises(errors.UnboundParameterError):
+        compiled.bind({"phi": 0.1})
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, parameter, quantumcircuit
+
+
+def build(qc, theta, phi):
+    qc.h([0, 1, 2])
+    qc.rx(0, theta)
+    qc.cx(0, 1)
+    qc.ry(1, phi)
+    qc.rz(2, theta)
+    qc.p(0, phi)
+    qc.u(2, theta, 0.2, phi)
+    qc.crx(0, 2, phi)
+    qc.cry(2, 1, theta)
+    qc.crz(1, 0, phi)
+    qc.rxx(0, 1, theta)
+    qc.rzz(1, 2, phi)
+    qc.h(2)
+    return qc
+
+
+def expectation(observable, values):
+    state = build(quantumcircuit(qubits=3, engine="statevector"), *values).state
+    state = np.asarray(state, complex).reshape(-1)
+    return np.vdot(state, np.dot(observable, state)).real
+
+
+def test_02a():
+    theta = parameter("theta")
+    phi = parameter("phi")
+    generator = np.random.RandomState(7)
+    observable = generator.randn(8, 8) + 1j * generator.randn(8, 8)
+    observable = observable + observable.conj().T
+    values = (0.4, -1.3)
+    for fuse in [False, 2]:
+        template = build(
+            quantumcircuit(qubits=3, engine="statevector", fuse=fuse, lazy=True),
+            theta,
+            phi,
+        )
+        value, gradient = template.compile().bind(values).gradient(observable)
+        assert np.isclose(
+            value, expectation(observable, values), atol=1e-4
+        ), "test_02a Failed on the expectation"
+        for position, name in enumerate([theta, phi]):
+            shifted = [list(values), list(values)]
+            shifted[0][position] += 1e-2
+            shifted[1][position] -= 1e-2
+            difference = (
+                expectation(observable, shifted[0])
+                - expectation(observable, shifted[1])
+            ) / 2e-2
+            assert np.isclose(
+                gradient[name], difference, atol=1e-3
+            ), "test_02a Failed on the gradient"
+
+
+def test_02b():
+    theta = parameter("theta")
+    qc = quantumcircuit(qubits=1, engine="statevector", lazy=True)
+    qc.ry(0, theta)
+    value, gradient = qc.compile().bind([0.5]).gradient(np.array([1, -1]))
+    assert np.isclose(value, np.cos(0.5), atol=1e-5), "test_02b Failed on diagonal"
+    assert np.isclose(
+        gradient[theta], -np.sin(0.5), atol=1e-5
+    ), "test_02b Failed on diagonal gradient"
+
+
+def test_02c():
+    theta = parameter("theta")
+    qc = quantumcircuit(qubits=1, batch=3, lazy=True)
+    qc.rx(0, theta)
+    with pytest.raises(errors.InvalidEngineError):
+        qc.compile().bind([0.1]).gradient(np.array([1, -1]))
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from qcpy import errors, gates, quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="z", sparse=True)
+    qc.h(x - 1)
+    qc.mcu([x - 1], [0, 1], np.kron(gates.paulix(), gates.hadamard()))
+    return np.around(np.asarray(qc.state).flatten(), 3)
+
+
+def test_22a():
+    expected = np.zeros(8, "F")
+    expected[0] = 0.707
+    expected[5] = 0.5
+    expected[7] = 0.5
+    assert (
+        inc(3) == expected
+    ).all(), "test_22a Failed on hadamard -> multi-controlled unitary"
+
+
+def test_22b():
+    expected = np.zeros(16, "F")
+    expected[0] = 0.707
+    expected[9] = 0.5
+    expected[11] = 0.5
+    assert (
+        inc(4) == expected
+    ).all(), "test_22b Failed on hadamard -> multi-controlled unitary"
+
+
+def test_22c():
+    qc = quantumcircuit(qubits=3, prep="z", sparse=True)
+    with pytest.raises(errors.NotUnitaryMultiGateError):
+        qc.mcu([0], [1, 2], gates.paulix())
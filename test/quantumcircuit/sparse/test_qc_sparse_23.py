@@ -0,0 +1,36 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, prep="x", sparse=True)
+    return qc
+
+
+def test_23a():
+    qc = inc(2)
+    qc.s(0)
+    qc.cz(0, 1)
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.5, 0.5j, 0.5, -0.5j], "F")
+    ).all(), "test_23a Failed on s -> cz"
+
+
+def test_23b():
+    qc = inc(2)
+    qc.z([0, 1])
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.5, -0.5, -0.5, 0.5], "F")
+    ).all(), "test_23b Failed on z on every qubit"
+
+
+def test_23c():
+    qc = inc(2)
+    qc.mcu([0], [1], np.diag([1, -1]))
+    qc.custom(1, np.diag([1, 1j]))
+    assert (
+        np.around(np.asarray(qc.state).flatten(), 3)
+        == np.array([0.5, 0.5, 0.5j, -0.5j], "F")
+    ).all(), "test_23c Failed on diagonal multi-controlled unitary -> custom"
@@ -0,0 +1,33 @@
+import numpy as np
+
+from qcpy import quantumcircuit
+
+
+def inc(x, big_endian=False):
+    qc = quantumcircuit(qubits=x, engine="stabilizer", big_endian=big_endian)
+    qc.h(x - 1)
+    qc.cx(x - 1, 0)
+    qc.s(0)
+    return np.around(qc.state.flatten(), 3)
+
+
+def test_01a():
+    assert (
+        inc(2) == np.array([0.707 + 0j, 0 + 0j, 0 + 0j, 0.707j], "F")
+    ).all(), "test_01a Failed on hadamard, cnot and s"
+
+
+def test_01b():
+    assert (
+        inc(3, True) == np.array([0.707 + 0j, 0, 0, 0, 0, 0.707j, 0, 0], "F")
+    ).all(), "test_01b Failed on big endian hadamard, cnot and s"
+
+
+def test_01c():
+    qc = quantumcircuit(qubits=2, prep="y", engine="stabilizer")
+    qc.sdg([0, 1])
+    qc.swap(0, 1)
+    qc.cz(0, 1)
+    assert (
+        np.around(qc.state.flatten(), 3) == np.array([0.5, 0.5, 0.5, -0.5], "F")
+    ).all(), "test_01c Failed on prep y, sdg, swap and cz"
@@ -0,0 +1,37 @@
+from qcpy import measure, quantumcircuit
+
+
+def inc(x):
+    qc = quantumcircuit(qubits=x, engine="stabilizer")
+    qc.h(0)
+    for qubit in range(x - 1):
+        qc.cx(qubit, qubit + 1)
+    return qc
+
+
+def test_02a():
+    assert measure(inc(1000)) in [
+        "0" * 1000,
+        "1" * 1000,
+    ], "test_02a Failed on measuring a 1000 qubit ghz state"
+
+
+def test_02b():
+    qc = inc(1000)
+    qc.x(list(range(0, 1000, 2)))
+    assert set(qc.tableau.sample(50)) <= {
+        "10" * 500,
+        "01" * 500,
+    }, "test_02b Failed on sampling a 1000 qubit state"
+
+
+def test_02c():
+    qc = quantumcircuit(qubits=3, engine="stabilizer")
+    qc.h([0, 1])
+    qc.cz(0, 2)
+    assert set(qc.tableau.sample(200)) == {
+        "000",
+        "001",
+        "010",
+        "011",
+    }, "test_02c Failed on sampling a uniform superposition"
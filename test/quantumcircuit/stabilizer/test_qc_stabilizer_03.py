@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, quantumcircuit
+
+
+def test_03a():
+    qc = quantumcircuit(qubits=2, engine="stabilizer")
+    with pytest.raises(errors.NotCliffordGateError):
+        qc.t(0)
+
+
+def test_03b():
+    qc = quantumcircuit(qubits=2, clifford=True)
+    qc.h(0)
+    qc.cx(0, 1)
+    assert qc.tableau is not None, "test_03b Failed on staying on the tableau"
+    qc.t(1)
+    assert qc.tableau is None, "test_03b Failed on leaving the tableau"
+    assert (
+        np.around(qc.state.flatten(), 3) == np.array([0.707, 0, 0, 0.5 + 0.5j], "F")
+    ).all(), "test_03b Failed on replaying the gates"
+
+
+def test_03c():
+    qc = quantumcircuit(qubits=3, clifford=True, lazy=True)
+    qc.y(0)
+    qc.ccx(0, 1, 2)
+    qc.rx(2, np.pi / 2)
+    assert (
+        np.around(qc.state.flatten(), 3)
+        == np.array([0, 0.707j, 0, 0, 0, 0.707, 0, 0], "F")
+    ).all(), "test_03c Failed on keeping the global phase once off the tableau"
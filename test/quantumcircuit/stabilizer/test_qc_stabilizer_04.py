@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, probability, quantumcircuit
+
+
+def clifford(qc):
+    qc.h([0, 2, 3])
+    qc.cx(0, 1)
+    qc.s(1)
+    qc.cz(2, 4)
+    qc.h(4)
+    qc.swap(1, 3)
+    qc.cx(3, 4)
+    return qc
+
+
+def test_04a():
+    qc = quantumcircuit(qubits=1000, engine="stabilizer")
+    qc.h(0)
+    for qubit in range(999):
+        qc.cx(qubit, qubit + 1)
+    assert np.allclose(
+        probability(qc, qubits=[0, 999]), [0.5, 0, 0, 0.5]
+    ), "test_04a Failed on a marginal of a 1000 qubit state"
+    assert np.allclose(
+        probability(qc, qubits=[3, 500, 998]), [0.5, 0, 0, 0, 0, 0, 0, 0.5]
+    ), "test_04a Failed on a marginal of three qubits"
+
+
+def test_04b():
+    for big_endian in [False, True]:
+        for prep in ["z", "x", "y"]:
+            qc = clifford(
+                quantumcircuit(
+                    qubits=5, engine="stabilizer", big_endian=big_endian, prep=prep
+                )
+            )
+            dense = clifford(quantumcircuit(qubits=5, big_endian=big_endian, prep=prep))
+            for qubits in [[1], [4, 0], [0, 2, 3], [0, 1, 2, 3, 4]]:
+                assert np.allclose(
+                    probability(qc, qubits=qubits),
+                    probability(dense, qubits=qubits),
+                    atol=1e-3,
+                ), f"test_04b Failed on matching the dense marginal of {qubits}"
+
+
+def test_04c():
+    with pytest.raises(errors.OutOfRangeError):
+        quantumcircuit(qubits=40, engine="stabilizer").state
+    qc = quantumcircuit(qubits=40, clifford=True)
+    qc.h(0)
+    with pytest.raises(errors.OutOfRangeError):
+        qc.t(0)
+    assert qc.tableau is not None, "test_04c Failed on keeping the tableau"
+    qc = quantumcircuit(qubits=40, clifford=True, engine="mps")
+    qc.h(0)
+    qc.t(0)
+    assert qc.tableau is None, "test_04c Failed on leaving the tableau for mps"
@@ -0,0 +1,46 @@
+import numpy as np
+from qcpy import quantumcircuit
+
+
+def inc(x, threads, big_endian=False):
+    qc = quantumcircuit(
+        qubits=x, prep="z", big_endian=big_endian, engine="statevector", threads=threads
+    )
+    qc.h(0)
+    for i in range(x - 1):
+        qc.cx(i, i + 1)
+    for i in range(x):
+        qc.rx(i, 0.1 * i)
+    qc.rzz(0, x - 1, 0.4)
+    qc.mcu(
+        [x - 1], [0, x // 2], np.kron(np.diag([1, -1]), np.ones((2, 2)) / np.sqrt(2))
+    )
+    qc.swap(1, x - 2)
+    return qc
+
+
+def test_25a():
+    qc = quantumcircuit(qubits=16, prep="z", threads=4)
+    qc.h(15)
+    for i in range(15, 0, -1):
+        qc.cx(i, i - 1)
+    state = np.around(np.asarray(qc.state).flatten(), 3)
+    assert (
+        state[0] == 0.707 and state[-1] == 0.707 and np.count_nonzero(state) == 2
+    ), "test_25a Failed on a threaded GHZ state"
+
+
+def test_25b():
+    assert np.allclose(
+        inc(16, 4).state, inc(16, 1).state, atol=1e-6
+    ), "test_25b Failed on threaded gates matching a single thread"
+
+
+def test_25c():
+    qc = inc(17, 3, big_endian=True)
+    assert (
+        qc.engine == "statevector"
+    ), "test_25c Failed on picking the statevector engine"
+    assert np.allclose(
+        qc.state, inc(17, 1, big_endian=True).state, atol=1e-6
+    ), "test_25c Failed on big endian threaded gates"
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, quantumcircuit
+
+
+def probabilities(qc):
+    state = np.asarray(qc.state)
+    if qc.engine == "density_matrix":
+        return np.diagonal(state).real
+    return np.abs(state.reshape(-1)) ** 2
+
+
+def basis(qubits, big_endian):
+    expected = np.zeros(8)
+    expected[sum(1 << (2 - qubit if big_endian else qubit) for qubit in qubits)] = 1
+    return expected
+
+
+def test_26a():
+    for engine in [None, "statevector", "density_matrix"]:
+        for big_endian in [False, True]:
+            for seed in range(8):
+                qc = quantumcircuit(
+                    qubits=3, engine=engine, big_endian=big_endian, seed=seed
+                )
+                qc.h(0)
+                qc.cx(0, 1)
+                outcome = qc.measure(0, "c")
+                assert qc.classical["c"] == outcome, "test_26a Failed on register"
+                assert np.allclose(
+                    probabilities(qc),
+                    basis([0, 1] if outcome else [], big_endian),
+                    atol=1e-5,
+                ), "test_26a Failed on collapse"
+                qc.reset(1)
+                qc.c_if("c", 1, "x", 2)
+                assert np.allclose(
+                    probabilities(qc),
+                    basis([0, 2] if outcome else [], big_endian),
+                    atol=1e-5,
+                ), "test_26a Failed on reset and conditional gate"
+
+
+def test_26b():
+    outcomes = []
+    for _ in range(2):
+        qc = quantumcircuit(qubits=4, engine="statevector", fuse=2, seed=11)
+        qc.h([0, 1, 2, 3])
+        outcomes.append([qc.measure(qubit) for qubit in range(4)])
+    assert outcomes[0] == outcomes[1], "test_26b Failed on seeded measurements"
+    qc = quantumcircuit(qubits=2, seed=4)
+    qc.x(0)
+    qc.measure(0, 0)
+    qc.measure(1, 1)
+    assert qc.c_if([0, 1], 2, "x", 1), "test_26b Failed on reading classical bits"
+    assert not qc.c_if(1, 1, "x", 1), "test_26b Failed on skipping gates"
+
+
+def test_26c():
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, batch=2).measure(0)
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, engine="mps").reset(0)
+    with pytest.raises(errors.OutOfRangeError):
+        quantumcircuit(qubits=2).measure(2)
+
+
+def test_26d():
+    options = [
+        {"sparse": True},
+        {"clifford": True},
+        {"engine": "stabilizer"},
+        {"engine": "distributed", "processes": 2},
+    ]
+    for option in options:
+        for big_endian in [False, True]:
+            seen = set()
+            for seed in range(8):
+                qc = quantumcircuit(
+                    qubits=3, big_endian=big_endian, seed=seed, **option
+                )
+                qc.h(0)
+                qc.cx(0, 1)
+                outcome = qc.measure(0, "c")
+                again = qc.measure(1)
+                qc.reset(1)
+                qc.c_if("c", 1, "x", 2)
+                seen.add(outcome)
+                assert again == outcome, f"test_26d Failed on collapse with {option}"
+                assert np.allclose(
+                    probabilities(qc),
+                    basis([0, 2] if outcome else [], big_endian),
+                    atol=1e-5,
+                ), f"test_26d Failed on reset and conditional gate with {option}"
+            assert seen == {0, 1}, f"test_26d Failed on drawing outcomes with {option}"
+
+
+def test_26e():
+    outcomes = []
+    for _ in range(2):
+        qc = quantumcircuit(qubits=6, engine="stabilizer", seed=3)
+        qc.h([0, 1, 2, 3, 4, 5])
+        outcomes.append([qc.measure(qubit) for qubit in range(6)])
+    assert outcomes[0] == outcomes[1], "test_26e Failed on seeded tableau measurements"
+    with pytest.raises(errors.InvalidEngineError, match="MpsCalculator"):
+        quantumcircuit(qubits=2, engine="mps").measure(0)
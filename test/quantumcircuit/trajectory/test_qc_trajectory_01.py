@@ -0,0 +1,29 @@
+import numpy as np
+
+from qcpy import quantumcircuit
+
+
+def test_01a():
+    qc = quantumcircuit(qubits=2, trajectories=4)
+    qc.h(0)
+    qc.cx(0, 1)
+    assert qc.engine == "trajectory", "test_01a Failed on picking the trajectory engine"
+    assert (
+        np.around(qc.state, 3) == np.array([[0.707, 0, 0, 0.707]] * 4, "F")
+    ).all(), "test_01a Failed on a batch of bell states"
+
+
+def test_01b():
+    for prep in ["x", "y"]:
+        vector = quantumcircuit(
+            qubits=3, engine="statevector", prep=prep, big_endian=True
+        )
+        batch = quantumcircuit(qubits=3, trajectories=3, prep=prep, big_endian=True)
+        for qc in [vector, batch]:
+            qc.rx(0, 0.3)
+            qc.ccx(0, 1, 2)
+            qc.rzz(1, 2, 0.7)
+            qc.swap(0, 2)
+        assert np.allclose(
+            batch.state, np.tile(vector.state.reshape(1, -1), (3, 1)), atol=1e-5
+        ), "test_01b Failed on matching the statevector engine"
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from qcpy import channels, errors, measure, noisemodel, quantumcircuit
+
+
+def noisy(kraus, gate_types=["single", "multi"]):
+    noise = noisemodel()
+    noise.add(kraus, gate_types)
+    return noise
+
+
+def test_02a():
+    qc = quantumcircuit(
+        qubits=3, noise=noisy(channels.amplitude_damping(1)), trajectories=8
+    )
+    qc.h([0, 1, 2])
+    assert (
+        np.around(qc.backend.probabilities(), 3) == np.array([1, 0, 0, 0, 0, 0, 0, 0])
+    ).all(), "test_02a Failed on damping every trajectory back to 0"
+    assert measure(qc) == "000", "test_02a Failed on measuring a damped state"
+    assert qc.backend.counts() == {"000": 8}, "test_02a Failed on counting shots"
+
+
+def test_02b():
+    np.random.seed(0)
+    noise = noisy(channels.depolarizing(0.2))
+    noise.add(channels.phase_damping(0.3), "multi")
+    noise.add_readout(channels.readout(0.05, 0.1))
+    density = quantumcircuit(qubits=3, noise=noise)
+    batch = quantumcircuit(qubits=3, noise=noise, trajectories=4000)
+    for qc in [density, batch]:
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.ry(2, 0.4)
+        qc.cz(1, 2)
+    assert np.allclose(
+        batch.backend.probabilities(), density.backend.probabilities(), atol=0.03
+    ), "test_02b Failed on averaging to the density_matrix probabilities"
+    assert (
+        sum(batch.backend.counts(100).values()) == 100
+    ), "test_02b Failed on the number of shots"
+
+
+def test_02c():
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, engine="density_matrix", trajectories=10)
+
+
+def test_02d():
+    runs = []
+    for _ in range(2):
+        qc = quantumcircuit(
+            qubits=3, noise=noisy(channels.depolarizing(0.3)), trajectories=16, seed=7
+        )
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.ry(2, 0.4)
+        runs.append((qc.state, measure(qc, shots=50)))
+    assert np.array_equal(
+        runs[0][0], runs[1][0]
+    ), "test_02d Failed on seeded trajectories"
+    assert runs[0][1] == runs[1][1], "test_02d Failed on seeded shots"
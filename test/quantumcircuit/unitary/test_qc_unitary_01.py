@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, quantumcircuit
+from qcpy.src.quantum_circuit.unitary import UnitaryCalculator
+
+
+def build(qc):
+    qc.h(0)
+    qc.rx(1, 0.3)
+    qc.cx(0, 2)
+    qc.ccx(0, 1, 2)
+    qc.rzz(1, 2, 0.7)
+    qc.swap(0, 2)
+    qc.cry(2, 1)
+    return qc
+
+
+def test_01a():
+    for big_endian in [False, True]:
+        unitary = build(
+            quantumcircuit(qubits=3, engine="unitary", big_endian=big_endian)
+        ).unitary()
+        assert np.allclose(
+            unitary.conj().T @ unitary, np.identity(8), atol=1e-5
+        ), "test_01a Failed on building a unitary"
+        for prep in ["z", "x", "y"]:
+            vector = build(
+                quantumcircuit(
+                    qubits=3, engine="statevector", prep=prep, big_endian=big_endian
+                )
+            )
+            start = quantumcircuit(
+                qubits=3, engine="statevector", prep=prep, big_endian=big_endian
+            )
+            assert np.allclose(
+                unitary @ start.state, vector.state, atol=1e-5
+            ), "test_01a Failed on matching the statevector engine"
+
+
+def test_01b():
+    plain = build(quantumcircuit(qubits=3, engine="unitary")).unitary()
+    fused = build(quantumcircuit(qubits=3, engine="unitary", fuse=2)).unitary()
+    assert np.allclose(plain, fused, atol=1e-5), "test_01b Failed on fused blocks"
+
+
+def test_01c():
+    first = build(quantumcircuit(qubits=3, engine="unitary", lazy=True))
+    unitary = first.unitary(cache=True)
+    second = build(quantumcircuit(qubits=3, engine="unitary", lazy=True))
+    assert np.allclose(
+        second.unitary(cache=True), unitary
+    ), "test_01c Failed on reusing a cached unitary"
+    assert second.queued == 0, "test_01c Failed on skipping the cached gates"
+    with pytest.raises(errors.InvalidEngineError):
+        quantumcircuit(qubits=2, engine="statevector").unitary()
+
+
+def test_01d():
+    UnitaryCalculator.cache.clear()
+    for qubits, big_endian in [(6, False), (2, False), (2, True), (6, True)]:
+        qc = quantumcircuit(
+            qubits=qubits, engine="unitary", big_endian=big_endian, lazy=True
+        )
+        qc.h(0)
+        qc.cx(0, 1)
+        uncached = quantumcircuit(
+            qubits=qubits, engine="unitary", big_endian=big_endian
+        )
+        uncached.h(0)
+        uncached.cx(0, 1)
+        assert np.allclose(
+            qc.unitary(cache=True), uncached.unitary(), atol=1e-5
+        ), "test_01d Failed on keeping circuits of other sizes or endianess apart"
+    UnitaryCalculator.cache.clear()
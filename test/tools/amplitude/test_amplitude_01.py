@@ -0,0 +1,19 @@
+import numpy as np
+
+from qcpy import amplitude, quantumcircuit
+
+
+def test_01a():
+    qc = quantumcircuit(qubits=2, engine="statevector")
+    qc.ry(0, 1.0)
+    expected = np.abs(np.asarray(qc.state).reshape(-1))
+    out = np.empty(4, np.float32)
+    result = amplitude(qc, raw=True, out=out, rounds=6)
+    assert result is out, "test_01a Failed on writing into out"
+    assert np.allclose(out, expected, atol=1e-6), "test_01a Failed on raw amplitudes"
+    assert np.isclose(
+        amplitude(qc, show_bit="01", raw=True, rounds=6), expected[1], atol=1e-6
+    ), "test_01a Failed on raw single amplitude"
+    assert np.isclose(
+        amplitude(qc, show_bit=1, radian=True), 1.0, atol=1e-3
+    ), "test_01a Failed on amplitude in radians"
@@ -0,0 +1,45 @@
+import numpy as np
+
+from qcpy import measure, quantumcircuit
+
+
+def test_01a():
+    qc = quantumcircuit(qubits=3)
+    qc.h(0)
+    qc.cx(0, 2)
+    assert measure(qc) in ["000", "101"], "test_01a Failed on a single shot"
+    counts = measure(qc, shots=2000)
+    assert set(counts) <= {"000", "101"}, "test_01a Failed on counted basis states"
+    assert sum(counts.values()) == 2000, "test_01a Failed on number of shots"
+    assert abs(counts["000"] - 1000) < 150, "test_01a Failed on distribution"
+    outcomes = measure(qc, shots=100, counts=False)
+    assert outcomes.shape == (100,), "test_01a Failed on shape of indices"
+    assert set(outcomes.tolist()) <= {0, 5}, "test_01a Failed on basis state indices"
+
+
+def test_01b():
+    state = np.zeros(2**4, "F")
+    state[3] = 1
+    assert measure(state, shots=10) == {"0011": 10}, "test_01b Failed on arrays"
+    qc = quantumcircuit(qubits=2, batch=3)
+    qc.x(1)
+    counts = measure(qc, shots=10)
+    assert counts == [{"10": 10}] * 3, "test_01b Failed on batches"
+    assert np.all(
+        measure(qc, shots=4, counts=False) == 2
+    ), "test_01b Failed on indices of batches"
+    qc = quantumcircuit(qubits=2, engine="density_matrix")
+    qc.x(0)
+    assert measure(qc, shots=5) == {"01": 5}, "test_01b Failed on density matrix"
+
+
+def test_01c():
+    for engine in [None, "mps", "amplitude_dict", "stabilizer", "batch"]:
+        shots = []
+        for _ in range(2):
+            qc = quantumcircuit(qubits=3, engine=engine, seed=7)
+            qc.h([0, 1, 2])
+            shots.append((measure(qc, shots=50, counts=False), measure(qc)))
+        assert np.array_equal(shots[0][0], shots[1][0]) and (
+            shots[0][1] == shots[1][1]
+        ), f"test_01c Failed on seeded shots of engine {engine}"
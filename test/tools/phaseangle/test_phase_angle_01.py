@@ -0,0 +1,21 @@
+import numpy as np
+
+from qcpy import phaseangle, quantumcircuit
+
+
+def test_01a():
+    qc = quantumcircuit(qubits=2, engine="statevector")
+    qc.h([0, 1])
+    qc.t(0)
+    qc.s(1)
+    expected = np.mod(np.angle(np.asarray(qc.state).reshape(-1)), 2 * np.pi)
+    out = np.empty(4, np.float32)
+    result = phaseangle(qc, raw=True, out=out, round=6)
+    assert result is out, "test_01a Failed on writing into out"
+    assert np.allclose(out, expected, atol=1e-5), "test_01a Failed on raw phases"
+    assert np.isclose(
+        phaseangle(qc, show_bit="11", radian=False), 135
+    ), "test_01a Failed on phase in degrees"
+    assert np.allclose(
+        phaseangle(qc), expected, atol=1e-3
+    ), "test_01a Failed on rounded phases"
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from qcpy import errors, probability, quantumcircuit
+
+
+def marginal(full, bits):
+    expected = np.zeros(2 ** len(bits))
+    for index, value in enumerate(full):
+        kept = 0
+        for bit in sorted(bits, reverse=True):
+            kept = 2 * kept + ((index >> bit) & 1)
+        expected[kept] += value
+    return expected
+
+
+def test_01a():
+    for engine in [None, "statevector", "density_matrix", "mps"]:
+        for big_endian in [False, True]:
+            qc = quantumcircuit(qubits=4, engine=engine, big_endian=big_endian)
+            qc.h([0, 1, 2, 3])
+            qc.rx(0, 0.4)
+            qc.cx(0, 2)
+            qc.ry(3, 1.0)
+            qc.cx(3, 1)
+            if engine == "density_matrix":
+                full = np.diagonal(qc.state).real
+            else:
+                full = np.abs(np.asarray(qc.state).reshape(-1)) ** 2
+            for qubits in [[0], [2], [1, 3], [3, 0, 2]]:
+                bits = [3 - qubit if big_endian else qubit for qubit in qubits]
+                assert np.allclose(
+                    probability(qc, round=8, qubits=qubits),
+                    marginal(full, bits),
+                    atol=1e-5,
+                ), "test_01a Failed on marginal probabilities"
+
+
+def test_01b():
+    qc = quantumcircuit(qubits=3, batch=2)
+    qc.x(2)
+    assert np.allclose(
+        probability(qc, qubits=[2]), [[0, 1], [0, 1]]
+    ), "test_01b Failed on batches"
+    state = np.zeros(8)
+    state[6] = 1
+    assert np.allclose(
+        probability(state, qubits=[0, 1], show_percent=True), [0, 0, 100, 0]
+    ), "test_01b Failed on arrays"
+    with pytest.raises(errors.OutOfRangeError):
+        probability(quantumcircuit(qubits=2), qubits=[2])
@@ -0,0 +1,37 @@
+import numpy as np
+
+from qcpy import probability, quantumcircuit
+from qcpy.src.tools.base import convert_state
+
+
+def test_02a():
+    qc = quantumcircuit(qubits=3, engine="statevector")
+    qc.h([0, 1, 2])
+    qc.rx(1, 0.3)
+    view = convert_state(qc, raw=True)
+    assert np.shares_memory(view, qc.backend.state), "test_02a Failed on view"
+    assert not view.flags.writeable, "test_02a Failed on read-only view"
+    out = np.empty(8, np.float32)
+    result = probability(qc, raw=True, out=out, round=6)
+    assert result is out, "test_02a Failed on writing into out"
+    assert np.allclose(out, 0.125, atol=1e-6), "test_02a Failed on raw probabilities"
+    assert np.isclose(
+        probability(qc, show_bit="011", raw=True, show_percent=True), 12.5
+    ), "test_02a Failed on raw single probability"
+    assert np.allclose(
+        probability(qc), 0.125, atol=1e-3
+    ), "test_02a Failed on rounded probabilities"
+
+
+def test_02b():
+    qc = quantumcircuit(qubits=2)
+    qc.h(0)
+    qc.t(0)
+    qc.h(1)
+    assert np.allclose(
+        probability(qc), 0.25, atol=1e-3
+    ), "test_02b Failed on probabilities of unrounded amplitudes"
+    state = np.full(4, 0.3536 * (1 - 1j))
+    assert np.allclose(
+        probability(state), 0.25, atol=1e-3
+    ), "test_02b Failed on a state of rounded amplitudes"